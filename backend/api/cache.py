@@ -0,0 +1,160 @@
+"""
+In-process response cache for read-only endpoints.
+
+Everything under /api/v1 changes only when the ETL loads new data, so a response can be
+reused until the dataset version changes. Entries are keyed by
+(route, normalized query params, data_version) and bounded by an LRU entry limit.
+When a new version is seen, entries for older versions are dropped at once.
+
+The version is resolved once per request (see request_data_version) and shared by the
+ETag, compression and response caches, so they can't disagree about it mid-request.
+"""
+
+import functools
+import inspect
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from backend.db.dataset_version import current_data_version, get_data_version
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+API_CACHE_ENABLED = os.getenv("API_CACHE_ENABLED", "true").lower() == "true"
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "256"))
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = API_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns (found, value) and marks the entry as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any, version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                # A new dataset version makes every older entry unreachable
+                if self._entries:
+                    logger.info(f"Dataset version {self._version} -> {version}; dropping {len(self._entries)} cached responses.")
+                self._entries.clear()
+                self._version = version
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": API_CACHE_ENABLED,
+                "data_version": self._version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+response_cache = ResponseCache()
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(value)) if isinstance(value, set) else tuple(value)
+    return value
+
+
+def _fresh(value: Any) -> Any:
+    """Responses carry per-request state (background tasks, headers), so each hit gets its own copy."""
+    if not isinstance(value, Response):
+        return value
+    response = Response(content=value.body, status_code=value.status_code)
+    response.raw_headers = list(value.raw_headers)
+    return response
+
+
+def request_data_version(request: Request) -> Optional[int]:
+    """
+    Dataset version for this request: read on first use and kept in request.state,
+    so every middleware and the endpoint see the same value.
+    """
+    if not hasattr(request.state, "data_version"):
+        request.state.data_version = current_data_version()
+    return request.state.data_version
+
+
+# Extra parameter the decorator adds to the endpoint's signature, so FastAPI passes the Request
+_REQUEST_PARAM = "http_request"
+
+
+def cached_endpoint(func: Callable) -> Callable:
+    """
+    Caches a sync endpoint's return value per (route, params, data_version).
+    Under FastAPI the version is the one resolved for the request (request_data_version);
+    called directly, it is read through the endpoint's `db` session. The cache is
+    bypassed whenever the version can't be determined.
+    """
+    route = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        request = kwargs.pop(_REQUEST_PARAM, None)
+        db = kwargs.get("db")
+        version = None
+        if API_CACHE_ENABLED:
+            if request is not None:
+                version = request_data_version(request)
+            elif db is not None:
+                version = get_data_version(db)
+        if version is None:
+            return func(*args, **kwargs)
+
+        try:
+            params = tuple(sorted((k, _normalize(v)) for k, v in kwargs.items() if k != "db"))
+            key = (route, params, version)
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        found, value = response_cache.get(key)
+        if found:
+            return _fresh(value)
+        value = func(*args, **kwargs)
+        response_cache.put(key, value, version)
+        return _fresh(value)
+
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+    ])
+    return wrapper
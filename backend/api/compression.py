@@ -0,0 +1,85 @@
+"""
+Response compression for the API.
+
+Responses at least `API_COMPRESS_MIN_SIZE` bytes long are compressed with brotli (when
+the `brotli` package is installed) or gzip, whichever the client accepts. Responses
+that already carry a Content-Encoding, such as the ETL's precompressed snapshots, pass
+through untouched.
+
+Responses under /api/v1 only change with the dataset version, so compressed bodies are
+kept per (ETag, encoding) in an LRU that is dropped when the version changes. A repeat
+request is answered from that cache before the endpoint runs, so it costs no
+compression CPU.
+"""
+
+import gzip
+import os
+from typing import Optional, Set
+
+from backend.api.cache import ResponseCache
+
+# Brotli support is optional
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+API_COMPRESSION_ENABLED = os.getenv("API_COMPRESSION_ENABLED", "true").lower() == "true"
+# Smaller bodies gain little and cost a round of compression on every request
+API_COMPRESS_MIN_SIZE = int(os.getenv("API_COMPRESS_MIN_SIZE", "1024"))
+API_GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "6"))
+API_BROTLI_QUALITY = int(os.getenv("API_BROTLI_QUALITY", "5"))
+API_COMPRESSED_CACHE_ENTRIES = int(os.getenv("API_COMPRESSED_CACHE_ENTRIES", "128"))
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/vnd.apache.arrow.stream")
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Content codings named in an Accept-Encoding header, minus those refused with q=0."""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name)
+    return accepted
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Best encoding we can produce for the client, or None to send the body as-is."""
+    accepted = accepted_encodings(accept_encoding)
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def is_compressible(media_type: Optional[str]) -> bool:
+    return bool(media_type) and media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def vary_on_encoding(vary: Optional[str]) -> str:
+    """Adds Accept-Encoding to a Vary header value (once)."""
+    if vary and "accept-encoding" in vary.lower():
+        return vary
+    return ", ".join(filter(None, [vary, "Accept-Encoding"]))
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=API_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=API_GZIP_LEVEL, mtime=0)
+
+
+# (ETag, encoding) -> (compressed body, headers); the ETag already names the route and params
+compressed_cache = ResponseCache(max_entries=API_COMPRESSED_CACHE_ENTRIES)
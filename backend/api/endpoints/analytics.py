@@ -5,14 +5,26 @@ from backend.db.database import get_db
 from backend.db.schema import TweetSentiment, Word
 from backend.api.schemas import APIResponse 
 from backend.api.utils import get_difficulty_label
+from backend.api.cache import cached_endpoint
+from backend.api.responses import SeriesFormat, series_response
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+TIMELINE_FIELDS = (
+    "date", "target_word", "frustration", "difficulty_label", "very_pos_count",
+    "pos_count", "neu_count", "neg_count", "very_neg_count", "total_tweets"
+)
+
 @router.get("/sentiment", response_model=APIResponse)
-def get_sentiment_analytics(db: Session = Depends(get_db)):
+@cached_endpoint
+def get_sentiment_analytics(
+    format: SeriesFormat = SeriesFormat.rows,
+    db: Session = Depends(get_db)
+):
     """
     Get correlation data between sentiment and game performance.
     Optimized: Returns aggregates for all-time stats, but limits detailed daily timeline to 90 days.
+    format=columnar returns the timeline as arrays per field, format=arrow as an Arrow IPC stream.
     """
     # 1. Calculate All-Time Aggregates
     # Sentiment Distribution sum
@@ -164,6 +176,16 @@ def get_sentiment_analytics(db: Session = Depends(get_db)):
     top_hated = [format_top_item(r) for r in top_hated_raw]
     top_loved = [format_top_item(r) for r in top_loved_raw]
 
+    meta = {
+        "count": str(len(timeline_data)),
+        "note": "Timeline limited to last 90 days. Aggregates and Top Lists are all-time."
+    }
+
+    if format != SeriesFormat.rows:
+        timeline_columns = {field: [row[field] for row in timeline_data] for field in TIMELINE_FIELDS}
+        data = {"aggregates": aggregates, "top_hated": top_hated, "top_loved": top_loved}
+        return series_response(format, "timeline", timeline_columns, data=data, meta=meta)
+
     return APIResponse(
         status="success",
         data={
@@ -172,8 +194,5 @@ def get_sentiment_analytics(db: Session = Depends(get_db)):
             "top_hated": top_hated,
             "top_loved": top_loved
         },
-        meta={
-            "count": str(len(timeline_data)),
-            "note": "Timeline limited to last 90 days. Aggregates and Top Lists are all-time."
-        }
+        meta=meta
     )
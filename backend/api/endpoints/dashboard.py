@@ -7,6 +7,7 @@ from backend.db.schema import Distribution, TweetSentiment, Outlier, Word, Globa
 from backend.api.schemas import APIResponse
 from backend.api.utils import calculate_success_rate
 from backend.services.aggregations import get_distribution_totals
+from backend.api.cache import cached_endpoint
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -133,6 +134,7 @@ def _get_avg_guesses_overall(db: Session) -> float:
 
 
 @router.get("/at-a-glance", response_model=APIResponse)
+@cached_endpoint
 def get_at_a_glance_stats(db: Session = Depends(get_db)):
     """
     Get 6 key statistics for the landing page "At a Glance" section.
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from backend.db.database import get_db
 from backend.db.schema import Distribution, Word
 from backend.api.schemas import APIResponse
+from backend.api.cache import cached_endpoint
+from backend.api.responses import SeriesFormat, columns, series_response
 
 router = APIRouter(prefix="/distributions", tags=["distributions"])
 
@@ -26,13 +28,20 @@ class DistributionSchema(BaseModel):
         from_attributes = True
 
 @router.get("/", response_model=APIResponse)
+@cached_endpoint
 def get_distributions(
     limit: int = 365,
+    format: SeriesFormat = SeriesFormat.rows,
     db: Session = Depends(get_db)
 ):
     """
     Get guess distributions.
+    With format=columnar, `distributions` holds one array per field (dates delta-encoded);
+    format=arrow returns it as an Arrow IPC stream.
     """
+    if format != SeriesFormat.rows:
+        return _distributions_series(format, limit, db)
+
     dists = db.query(Distribution).options(joinedload(Distribution.word)).order_by(Distribution.date.desc()).limit(limit).all()
     
     results = []
@@ -47,7 +56,32 @@ def get_distributions(
         meta={"count": str(len(dists))}
     )
 
+DISTRIBUTION_FIELDS = (
+    "date", "guess_1", "guess_2", "guess_3", "guess_4", "guess_5", "guess_6",
+    "failed", "total_tweets", "avg_guesses", "word_solution"
+)
+
+
+def _distributions_series(format: SeriesFormat, limit: int, db: Session):
+    rows = db.query(
+        Distribution.date,
+        Distribution.guess_1,
+        Distribution.guess_2,
+        Distribution.guess_3,
+        Distribution.guess_4,
+        Distribution.guess_5,
+        Distribution.guess_6,
+        Distribution.failed,
+        Distribution.total_tweets,
+        Distribution.avg_guesses,
+        Word.word
+    ).outerjoin(Word, Distribution.word_id == Word.id)\
+     .order_by(Distribution.date.desc()).limit(limit).all()
+
+    return series_response(format, "distributions", columns(rows, DISTRIBUTION_FIELDS), meta={"count": str(len(rows))})
+
 @router.get("/aggregate", response_model=APIResponse)
+@cached_endpoint
 def get_aggregate_distribution(db: Session = Depends(get_db)):
     """
     Get aggregated guess distribution across all time.
@@ -5,19 +5,34 @@ from typing import List
 from backend.db.database import get_db
 from backend.services.nyt_service import NYTService
 from backend.api.schemas import NYTTimelinePoint, NYTFullAnalysis
+from backend.api.cache import cached_endpoint
+from backend.api.responses import FastJSONResponse, ResponseFormat
 
 router = APIRouter()
 
 @router.get("/analysis", response_model=NYTFullAnalysis)
-def get_nyt_analysis(db: Session = Depends(get_db)):
+@cached_endpoint
+def get_nyt_analysis(
+    format: ResponseFormat = ResponseFormat.rows,
+    db: Session = Depends(get_db)
+):
     """
     Returns the complete NYT effect analysis: summary, statistical tests, and timeline.
     Combines previous /summary and /timeline endpoints for faster initial load.
+    With format=columnar, the timeline is returned as one array per field.
     """
     service = NYTService(db)
     
     summary = service.get_comparison_summary()
     tests = service.run_statistical_tests()
+
+    if format == ResponseFormat.columnar:
+        return FastJSONResponse({
+            "summary": summary.model_dump(),
+            "tests": {name: result.model_dump() for name, result in tests.items()},
+            "timeline": service.get_timeline_columns(),
+        })
+
     timeline = service.get_timeline()
     
     return NYTFullAnalysis(
@@ -29,6 +44,7 @@ def get_nyt_analysis(db: Session = Depends(get_db)):
 
 
 @router.get("/periods")
+@cached_endpoint
 def get_nyt_period_comparison(db: Session = Depends(get_db)):
     """
     Returns metrics for before and multiple post-acquisition periods (1m, 3m, 6m).
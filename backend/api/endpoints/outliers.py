@@ -4,20 +4,29 @@ from typing import List, Optional
 from backend.db.database import get_db
 from backend.db.schema import Outlier, Word, Distribution, TweetSentiment
 from backend.api.schemas import APIResponse, OutliersOverviewResponse, OutlierPoint, OutlierEvent
+from backend.api.cache import cached_endpoint
+from backend.api.responses import FastJSONResponse, ResponseFormat, columns
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 router = APIRouter(prefix="/outliers", tags=["outliers"])
 
 @router.get("/overview", response_model=OutliersOverviewResponse)
+@cached_endpoint
 def get_outliers_dashboard(
     limit: int = 50,
+    format: ResponseFormat = ResponseFormat.rows,
     db: Session = Depends(get_db)
 ):
     """
     Get combined data for the Outliers dashboard:
     1. Scatter plot data (volume vs sentiment) for all days
     2. List of top/recent outliers
+    With format=columnar, both lists are returned as one array per field.
     """
+    if format == ResponseFormat.columnar:
+        return _outliers_columnar(limit, db)
+
     # 1. Scatter Plot Data
     scatter_results = db.query(Word).join(Distribution).join(TweetSentiment).options(
         joinedload(Word.distribution),
@@ -61,12 +70,48 @@ def get_outliers_dashboard(
         top_outliers=top_outliers
     )
 
+
+def _outliers_columnar(limit: int, db: Session) -> FastJSONResponse:
+    """Same data as the overview, read with column queries and no per-row models."""
+    # A day's scatter point is tagged with its first recorded outlier
+    first_outlier = db.query(Outlier.word_id, func.min(Outlier.id).label("id"))\
+        .group_by(Outlier.word_id).subquery()
+    points = db.query(
+        Word.date,
+        Word.word,
+        Distribution.total_tweets,
+        TweetSentiment.avg_sentiment,
+        Outlier.outlier_type
+    ).join(Distribution, Distribution.word_id == Word.id)\
+     .join(TweetSentiment, TweetSentiment.word_id == Word.id)\
+     .outerjoin(first_outlier, first_outlier.c.word_id == Word.id)\
+     .outerjoin(Outlier, Outlier.id == first_outlier.c.id)\
+     .order_by(Word.id).all()
+
+    events = db.query(
+        Outlier.id,
+        Outlier.date,
+        Word.word,
+        Outlier.outlier_type,
+        Outlier.metric,
+        Outlier.actual_value,
+        Outlier.z_score,
+        func.coalesce(Outlier.context, "")
+    ).join(Word, Outlier.word_id == Word.id)\
+     .order_by(Word.date.desc()).limit(limit).all()
+
+    return FastJSONResponse({
+        "plot_data": columns(points, ("date", "word", "volume", "sentiment", "outlier_type")),
+        "top_outliers": columns(events, ("id", "date", "word", "type", "metric", "value", "z_score", "context")),
+    })
+
 # ... existing code ...
 
 
 
 
 @router.get("/highlights", response_model=APIResponse)
+@cached_endpoint
 def get_outlier_highlights(db: Session = Depends(get_db)):
     """
     Get 3 specific highlight cards: Highest Volume, Most Frustrating, Easiest.
@@ -5,10 +5,13 @@ import json
 from backend.db.database import get_db
 from backend.db.schema import TrapAnalysis, Word
 from backend.api.schemas import APIResponse
+from backend.api.cache import cached_endpoint
+from backend.services.word_read_model import word_read_model
 
 router = APIRouter(prefix="/traps", tags=["traps"])
 
 @router.get("/top", response_model=APIResponse)
+@cached_endpoint
 def get_top_traps(
     limit: int = Query(20, le=100, gt=0, description="Max 100 traps"), 
     db: Session = Depends(get_db)
@@ -41,6 +44,14 @@ def get_trap_by_word(word: str, db: Session = Depends(get_db)):
     """
     Get trap analysis for a specific word.
     """
+    # Served from the in-memory read model; the queries below are the fallback
+    model = word_read_model.get(db)
+    if model is not None:
+        record = model.record_by_word(word.upper())
+        if record is None:
+            raise HTTPException(status_code=404, detail="Word not found")
+        return APIResponse(status="success", data=_trap_payload(word.upper(), record))
+
     word_obj = db.query(Word).filter(Word.word == word.upper()).first()
     if not word_obj:
         raise HTTPException(status_code=404, detail="Word not found")
@@ -74,3 +85,26 @@ def get_trap_by_word(word: str, db: Session = Depends(get_db)):
             "success_rate": float(word_obj.success_rate) if word_obj.success_rate else None
         }
     )
+
+
+def _trap_payload(word: str, record: dict) -> dict:
+    """The /traps/{word} payload from a read-model record."""
+    payload = {
+        "word": word,
+        "date": str(record["date"]) if record["date"] else None,
+        "is_trap": record["has_trap"],
+    }
+    if record["has_trap"]:
+        neighbors = record["deadly_neighbors"]
+        payload.update({
+            "trap_score": record["trap_score"],
+            "neighbor_count": record["neighbor_count"],
+            "deadly_neighbors": list(neighbors) if neighbors is not None else [],
+        })
+    else:
+        payload["message"] = "This word has no significant trap characteristics."
+    payload.update({
+        "avg_guesses": float(record["avg_guess_count"]) if record["avg_guess_count"] else None,
+        "success_rate": float(record["success_rate"]) if record["success_rate"] else None
+    })
+    return payload
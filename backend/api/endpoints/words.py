@@ -1,15 +1,22 @@
 import json
+import os
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from backend.db.database import get_db
 from backend.db.schema import Word, Distribution, TweetSentiment, TrapAnalysis, Outlier
 from backend.api.schemas import APIResponse
+from backend.api.cache import cached_endpoint
+from backend.api.responses import SeriesFormat, columns, series_response
+from backend.services.word_read_model import FIELDS, details_from_record, query_word_rows, word_read_model
 
 router = APIRouter(prefix="/words", tags=["words"])
 
+# Most words accepted by one /words/details:batch request
+WORD_DETAILS_BATCH_MAX = int(os.getenv("WORD_DETAILS_BATCH_MAX", "50"))
+
 # Response Models
 class WordSchema(BaseModel):
     id: int
@@ -73,12 +80,17 @@ def get_words(
 
 
 @router.get("/stats/difficulty", response_model=APIResponse)
-def get_difficulty_stats(db: Session = Depends(get_db)):
+@cached_endpoint
+def get_difficulty_stats(
+    format: SeriesFormat = SeriesFormat.rows,
+    db: Session = Depends(get_db)
+):
     """
     Get aggregated difficulty stats for visualizations.
     Returns data for:
     1. Timeline (Date vs Difficulty/Guesses)
     2. Correlation (Frequency vs Guesses)
+    format=columnar returns `points` as arrays per field, format=arrow as an Arrow IPC stream.
     """
     stats = db.query(
         Word.date, 
@@ -87,6 +99,10 @@ def get_difficulty_stats(db: Session = Depends(get_db)):
         Word.frequency_score
     ).filter(Word.avg_guess_count.isnot(None))\
      .order_by(Word.date).all()
+
+    if format != SeriesFormat.rows:
+        table = columns(stats, ("date", "difficulty", "avg_guesses", "frequency"))
+        return series_response(format, "points", table, meta={"count": str(len(stats))})
     
     return APIResponse(
         status="success",
@@ -128,6 +144,14 @@ def get_word_full_details(word_str: str, db: Session = Depends(get_db)):
     Get comprehensive details for a word including sentiment, trap analysis, and outlier status.
     Used by the Word Explorer feature.
     """
+    # Served from the in-memory read model; the queries below are the fallback
+    model = word_read_model.get(db)
+    if model is not None:
+        details = model.details_by_word(word_str.upper())
+        if details is None:
+            raise HTTPException(status_code=404, detail="Word not found in database")
+        return APIResponse(status="success", data={"details": details}, meta={})
+
     word = db.query(Word).filter(Word.word == word_str.upper()).first()
     if not word:
         raise HTTPException(status_code=404, detail="Word not found in database")
@@ -180,3 +204,38 @@ def get_word_full_details(word_str: str, db: Session = Depends(get_db)):
         meta={}
     )
 
+
+class WordDetailsBatchRequest(BaseModel):
+    words: List[str] = Field(..., min_length=1, max_length=WORD_DETAILS_BATCH_MAX)
+
+
+@router.post("/details:batch", response_model=APIResponse)
+def get_word_details_batch(request: WordDetailsBatchRequest, db: Session = Depends(get_db)):
+    """
+    Get Word Explorer details for several words at once, keyed by upper-case word.
+    Words not in the database are listed under `missing`.
+    Served from the in-memory read model, or with a single joined IN query without it.
+    """
+    words = list(dict.fromkeys(w.strip().upper() for w in request.words if w.strip()))
+
+    found = {}
+    model = word_read_model.get(db)
+    if model is not None:
+        for w in words:
+            details = model.details_by_word(w)
+            if details is not None:
+                found[w] = details
+    elif words:
+        for row in query_word_rows(db, words):
+            record = dict(zip(FIELDS, row))
+            # Rows come in id order, so the earliest entry for a word wins as in the single lookup
+            found.setdefault(record["word"], details_from_record(record))
+
+    return APIResponse(
+        status="success",
+        data={
+            "details": {w: found[w] for w in words if w in found},
+            "missing": [w for w in words if w not in found]
+        },
+        meta={"requested": str(len(words)), "count": str(len(found))}
+    )
@@ -1,13 +1,25 @@
 from fastapi import FastAPI, APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
-from backend.db.database import engine, Base, get_db
+from backend.db.database import engine, get_db
+from backend.db.schema import create_data_tables
+from backend.api.cache import request_data_version
+from backend.services.word_read_model import word_read_model
+from backend.api.snapshots import snapshot_store, SNAPSHOT_PATHS
+from backend.api.compression import (
+    API_COMPRESSION_ENABLED, API_COMPRESS_MIN_SIZE, compress, compressed_cache, is_compressible, negotiate,
+    vary_on_encoding
+)
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from datetime import datetime, timezone
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+import hashlib
 import os
 import logging
 from dotenv import load_dotenv
@@ -20,9 +32,122 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 # Create tables
-Base.metadata.create_all(bind=engine)
+create_data_tables(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the word read model before the first request instead of during it
+    await run_in_threadpool(word_read_model.get)
+    yield
+
+app = FastAPI(title="Wordle Decoded API", lifespan=lifespan)
+
+# HTTP caching: API data only changes when the ETL bumps the dataset version
+API_MAX_AGE = int(os.getenv("API_MAX_AGE", "60"))
+API_STALE_WHILE_REVALIDATE = int(os.getenv("API_STALE_WHILE_REVALIDATE", "86400"))
+API_CACHE_CONTROL = f"public, max-age={API_MAX_AGE}, stale-while-revalidate={API_STALE_WHILE_REVALIDATE}"
+NO_ETAG_PATHS = {"/api/v1/health"}
+
+def dataset_etag(version: int, path: str, query: str) -> str:
+    """Weak ETag for a GET: dataset version + route + normalized query params."""
+    params = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    digest = hashlib.sha256(f"{path}?{params}".encode("utf-8")).hexdigest()[:16]
+    return f'W/"v{version}-{digest}"'
+
+def if_none_match_tags(if_none_match: Optional[str]) -> list:
+    return [t.strip() for t in if_none_match.split(",")] if if_none_match else []
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Weak comparison: the W/ prefix is ignored on both sides
+    return etag.removeprefix("W/") in [t.removeprefix("W/") for t in if_none_match_tags(if_none_match)]
+
+# Innermost: serve ETL-rendered snapshots of the dashboard endpoints when they exist
+@app.middleware("http")
+async def serve_snapshot(request: Request, call_next):
+    path = request.url.path
+    if request.method != "GET" or path not in SNAPSHOT_PATHS or request.url.query:
+        return await call_next(request)
+
+    version = await run_in_threadpool(request_data_version, request)
+    snapshot = None
+    if version is not None:
+        snapshot = await run_in_threadpool(snapshot_store.get, version, path, request.headers.get("accept-encoding", ""))
+    if snapshot is None:
+        return await call_next(request)
+
+    body, encoding = snapshot
+    headers = {"Vary": "Accept-Encoding", "X-Snapshot-Version": str(version)}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Between the two: compress large responses, reusing compressed bodies per ETag
+@app.middleware("http")
+async def compress_response(request: Request, call_next):
+    if not API_COMPRESSION_ENABLED or request.method != "GET":
+        return await call_next(request)
+
+    encoding = negotiate(request.headers.get("accept-encoding", ""))
+    if encoding is None:
+        response = await call_next(request)
+        # Shared caches must not hand this uncompressed copy to clients that accept gzip
+        if is_compressible(response.headers.get("content-type")):
+            response.headers["Vary"] = vary_on_encoding(response.headers.get("vary"))
+        return response
+
+    path = request.url.path
+    key = version = None
+    if path.startswith("/api/v1/") and path not in NO_ETAG_PATHS:
+        version = await run_in_threadpool(request_data_version, request)
+        if version is not None:
+            key = (dataset_etag(version, path, request.url.query), encoding)
+            found, cached = compressed_cache.get(key)
+            if found:
+                body, headers = cached
+                return Response(content=body, headers=headers)
+
+    response = await call_next(request)
+    # Snapshots arrive already compressed; errors and other media types are passed through
+    if (response.status_code != 200 or "content-encoding" in response.headers
+            or not is_compressible(response.headers.get("content-type"))):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    if len(body) < API_COMPRESS_MIN_SIZE:
+        return Response(content=body, status_code=response.status_code, headers=headers)
+
+    compressed = await run_in_threadpool(compress, body, encoding)
+    headers["content-encoding"] = encoding
+    headers["vary"] = vary_on_encoding(headers.get("vary"))
+    if key is not None:
+        compressed_cache.put(key, (compressed, headers), version)
+    return Response(content=compressed, headers=headers)
+
+# Registered before CORS so that 304s still pass through the CORS middleware
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    path = request.url.path
+    if request.method not in ("GET", "HEAD") or not path.startswith("/api/v1/") or path in NO_ETAG_PATHS:
+        return await call_next(request)
+
+    version = await run_in_threadpool(request_data_version, request)
+    if version is None:
+        return await call_next(request)
+
+    etag = dataset_etag(version, path, request.url.query)
+    headers = {"ETag": etag, "Cache-Control": API_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
 
-app = FastAPI(title="Wordle Decoded API")
+    response = await call_next(request)
+    if response.status_code == 200:
+        # "*" matches any current representation, so only a route that produced one qualifies
+        if "*" in if_none_match_tags(if_none_match):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return response
 
 # Handle proxy headers for correct protocol on redirects (Railway uses X-Forwarded-Proto)
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
@@ -90,6 +215,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     )
 
 from backend.api.schemas import APIResponse
+from backend.api.cache import response_cache
 
 # API versioning with v1 router
 api_v1_router = APIRouter(prefix="/api/v1", redirect_slashes=False)
@@ -111,7 +237,10 @@ async def health_check(db: Session = Depends(get_db)):
         data={
             "healthy": True if "error" not in db_status else False,
             "service": "Wordle Decoded API",
-            "database": db_status
+            "database": db_status,
+            "response_cache": response_cache.stats(),
+            "compressed_cache": {**compressed_cache.stats(), "enabled": API_COMPRESSION_ENABLED},
+            "word_read_model": word_read_model.stats()
         },
         meta={
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -0,0 +1,144 @@
+"""
+Fast JSON output for large API payloads.
+
+`FastJSONResponse` renders with orjson (listed in requirements.txt) and falls back to the
+stdlib encoder when it is missing (same compact output; both write NaN and infinities as null). Hot endpoints
+accept `format=columnar`, which returns one array per field instead of one object per
+row. Those payloads are built straight from column queries and returned as a
+FastJSONResponse, so FastAPI skips `response_model` validation and no per-row Pydantic
+objects are created.
+
+Time-series endpoints go further. Their columnar payloads delta-encode the date
+column, and `format=arrow` returns the series as an Arrow IPC stream (needs pyarrow).
+
+Routes that return models keep FastAPI's default response class: for them FastAPI
+already serializes through Pydantic's compiled `dump_json`.
+"""
+
+import json
+import math
+from datetime import date
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+# orjson support is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow support is optional
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class ResponseFormat(str, Enum):
+    rows = "rows"
+    columnar = "columnar"
+
+
+class SeriesFormat(str, Enum):
+    """Formats accepted by the time-series endpoints."""
+    rows = "rows"
+    columnar = "columnar"
+    arrow = "arrow"
+
+
+def _finite(value: Any) -> Any:
+    """Replaces NaN and infinities with None, as orjson writes them (null)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    return value
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(
+            _finite(jsonable_encoder(content)), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def columns(rows: Iterable[Sequence], fields: Sequence[str]) -> Dict[str, List]:
+    """Transposes result rows (tuples in `fields` order) into {field: [values...]}."""
+    rows = list(rows)
+    if not rows:
+        return {field: [] for field in fields}
+    return {field: list(values) for field, values in zip(fields, zip(*rows))}
+
+
+def delta_encode_dates(table: Dict[str, List], field: str = "date") -> Dict[str, Any]:
+    """
+    Replaces the ISO date column `field` with `<field>_start` (the first date) and
+    `<field>_delta` (days since the previous row, 0 for the first). The column is left
+    as-is if any value is not an ISO date.
+    """
+    try:
+        days = [date.fromisoformat(value).toordinal() for value in table[field]]
+    except (TypeError, ValueError):
+        return table
+
+    encoded = {}
+    for name, values in table.items():
+        if name == field:
+            encoded[f"{field}_start"] = values[0] if values else None
+            encoded[f"{field}_delta"] = [0] + [b - a for a, b in zip(days, days[1:])] if days else []
+        else:
+            encoded[name] = values
+    return encoded
+
+
+def arrow_stream(table: Dict[str, List], metadata: Optional[Dict[str, Any]] = None, date_field: str = "date") -> bytes:
+    """Writes `table` as one record batch in Arrow IPC stream format; metadata values are stored as JSON."""
+    arrays = {}
+    for name, values in table.items():
+        if name == date_field:
+            arrays[name] = pa.array([date.fromisoformat(v) if v else None for v in values], type=pa.date32())
+        else:
+            arrays[name] = pa.array(values)
+
+    schema_metadata = {key: json.dumps(jsonable_encoder(value)) for key, value in (metadata or {}).items()}
+    batch = pa.RecordBatch.from_pydict(arrays, metadata=schema_metadata)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def series_response(format: SeriesFormat, series_key: str, table: Dict[str, List],
+                    data: Optional[Dict[str, Any]] = None, meta: Optional[Dict[str, Any]] = None) -> Response:
+    """
+    Returns a time-series endpoint's payload in a non-row format.
+
+    columnar: the usual APIResponse envelope with data[series_key] as delta-encoded columns.
+    arrow: the series as an Arrow IPC stream; the rest of `data` and `meta` are carried
+    as JSON strings in the schema metadata. Raises 406 if pyarrow is not installed.
+    """
+    data = data or {}
+    meta = {**(meta or {}), "format": format.value}
+    if format == SeriesFormat.arrow:
+        if not PYARROW_AVAILABLE:
+            raise HTTPException(status_code=406, detail="format=arrow requires pyarrow on the server; use format=columnar.")
+        body = arrow_stream(table, metadata={"data": data, "meta": meta})
+        return Response(content=body, media_type=ARROW_MEDIA_TYPE)
+
+    return FastJSONResponse({
+        "status": "success",
+        "data": {**data, series_key: delta_encode_dates(table)},
+        "meta": meta,
+    })
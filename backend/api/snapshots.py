@@ -0,0 +1,177 @@
+"""
+Static JSON snapshots of the dashboard endpoints.
+
+These endpoints return the same payload to every client, so the ETL renders them once per
+dataset version into `data/snapshots/v<version>/`. Each snapshot is stored as plain JSON,
+a gzip copy, and a brotli copy when the `brotli` package is installed. The API serves
+those bytes directly, picking an encoding the client accepts. If a snapshot is missing,
+the endpoint is computed live as before.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.api.compression import accepted_encodings
+
+# Brotli support is optional
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", str(Path(os.getenv("DATA_DIR", "data")) / "snapshots")))
+# Snapshot versions kept on disk (the previous one stays until the API has moved on)
+SNAPSHOT_KEEP = int(os.getenv("SNAPSHOT_KEEP", "2"))
+MANIFEST = "manifest.json"
+
+# (encoding, file suffix) in order of preference
+ENCODINGS = (("br", ".json.br"), ("gzip", ".json.gz"), ("identity", ".json"))
+
+
+def _snapshot_renderers() -> Dict[str, Callable]:
+    """Path -> callable(db) for every snapshotted route, called with the routes' default params."""
+    # Imported lazily so the ETL only pulls in the endpoint modules when rendering
+    from backend.api.endpoints import analytics, dashboard, nyt, outliers, words
+    return {
+        "/api/v1/dashboard/at-a-glance": lambda db: dashboard.get_at_a_glance_stats(db=db),
+        "/api/v1/analytics/sentiment": lambda db: analytics.get_sentiment_analytics(db=db),
+        "/api/v1/nyt/analysis": lambda db: nyt.get_nyt_analysis(db=db),
+        "/api/v1/nyt/periods": lambda db: nyt.get_nyt_period_comparison(db=db),
+        "/api/v1/outliers/overview": lambda db: outliers.get_outliers_dashboard(limit=50, db=db),
+        "/api/v1/words/stats/difficulty": lambda db: words.get_difficulty_stats(db=db),
+    }
+
+
+# Only requests without a query string are served from snapshots
+SNAPSHOT_PATHS = frozenset({
+    "/api/v1/dashboard/at-a-glance",
+    "/api/v1/analytics/sentiment",
+    "/api/v1/nyt/analysis",
+    "/api/v1/nyt/periods",
+    "/api/v1/outliers/overview",
+    "/api/v1/words/stats/difficulty",
+})
+
+
+def _filename(path: str) -> str:
+    return path.removeprefix("/api/v1/").replace("/", "_")
+
+
+def render_json(payload) -> bytes:
+    """Serializes an endpoint's return value the way JSONResponse does."""
+    return json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def render_snapshots(version: int, root: Optional[Path] = None) -> Optional[Path]:
+    """
+    Renders every snapshotted endpoint for `version` (called by the ETL after loading).
+    Returns the snapshot directory, or None if rendering failed; the API then serves live.
+    """
+    from backend.db.database import SessionLocal
+
+    root = Path(root) if root is not None else SNAPSHOT_DIR
+    target = root / f"v{version}"
+    tmp = root / f".v{version}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    db = SessionLocal()
+    try:
+        manifest = {"version": version, "files": {}}
+        for path, render in _snapshot_renderers().items():
+            body = render_json(render(db))
+            name = _filename(path)
+            (tmp / f"{name}.json").write_bytes(body)
+            (tmp / f"{name}.json.gz").write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+            if BROTLI_AVAILABLE:
+                (tmp / f"{name}.json.br").write_bytes(brotli.compress(body, quality=11))
+            manifest["files"][path] = {"name": name, "bytes": len(body)}
+
+        with open(tmp / MANIFEST, "w") as f:
+            json.dump(manifest, f, indent=2)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+    except Exception as e:
+        logger.error(f"Failed to render API snapshots for version {version}: {e}", exc_info=True)
+        db.rollback()
+        shutil.rmtree(tmp, ignore_errors=True)
+        return None
+    finally:
+        db.close()
+
+    logger.info(f"Rendered {len(manifest['files'])} API snapshots into {target}")
+    prune_snapshots(root)
+    return target
+
+
+def prune_snapshots(root: Optional[Path] = None) -> None:
+    """Keeps only the newest SNAPSHOT_KEEP versions."""
+    root = Path(root) if root is not None else SNAPSHOT_DIR
+    versions = sorted(
+        (p for p in root.glob("v*") if p.is_dir() and p.name[1:].isdigit()),
+        key=lambda p: int(p.name[1:]),
+        reverse=True,
+    )
+    for stale in versions[SNAPSHOT_KEEP:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+
+class SnapshotStore:
+    """Reads snapshot bytes for the current dataset version, memoized in memory."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root is not None else SNAPSHOT_DIR
+        self._version: Optional[int] = None
+        self._bodies: Dict[Tuple[str, str], Optional[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, version: int, path: str, accept_encoding: str = "") -> Optional[Tuple[bytes, str]]:
+        """
+        Returns (body, encoding) for the best encoding the client accepts, or None
+        if there is no snapshot for this version and path.
+        """
+        if path not in SNAPSHOT_PATHS:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        for encoding, suffix in ENCODINGS:
+            if encoding != "identity" and encoding not in accepted:
+                continue
+            body = self._read(version, path, suffix)
+            if body is not None:
+                return body, encoding
+        return None
+
+    def _read(self, version: int, path: str, suffix: str) -> Optional[bytes]:
+        with self._lock:
+            if version != self._version:
+                self._bodies.clear()
+                self._version = version
+            key = (path, suffix)
+            if key in self._bodies:
+                return self._bodies[key]
+        try:
+            body = (self.root / f"v{version}" / f"{_filename(path)}{suffix}").read_bytes()
+        except OSError:
+            # Not rendered (yet); don't memoize so a later render is picked up
+            return None
+        with self._lock:
+            if version == self._version:
+                self._bodies[key] = body
+        return body
+
+
+snapshot_store = SnapshotStore()
@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 from dotenv import load_dotenv
@@ -28,10 +29,27 @@ else:
 
 print(f"DEBUG: Connecting to {SQLALCHEMY_DATABASE_URL}", flush=True)
 
+# Connection pool bounds (also caps how many ETL loads can run concurrently)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+def _pool_args(url: str) -> dict:
+    """
+    Pool bounds for dialects that use QueuePool (file SQLite, PostgreSQL). In-memory
+    SQLite uses SingletonThreadPool, which rejects them, so it keeps its default pool.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    ):
+        return {}
+    return {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW}
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
     connect_args=connect_args,
-    echo=False # Set to True for SQL queries if needed
+    echo=False, # Set to True for SQL queries if needed
+    **_pool_args(SQLALCHEMY_DATABASE_URL)
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,91 @@
+"""
+Dataset version: a counter in 'dataset_metadata' that the ETL bumps after each run that
+loads data. Read-only API caches include it in their keys.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
+
+from backend.db.database import SessionLocal
+from backend.db.schema import DatasetMetadata, ensure_table
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_KEY = "data_version"
+
+
+def get_data_version(db: Session) -> Optional[int]:
+    """Current dataset version (0 before the first bump), or None if it can't be read."""
+    try:
+        value = db.execute(select(DatasetMetadata.value).where(DatasetMetadata.key == DATA_VERSION_KEY)).scalar()
+    except Exception as e:
+        db.rollback()
+        # The table is created by the first bump, so a database the ETL never versioned is at 0
+        try:
+            if not inspect(db.get_bind()).has_table(DatasetMetadata.__tablename__):
+                return 0
+        except Exception:
+            pass
+        logger.warning(f"Could not read dataset version: {e}")
+        return None
+    if value is None:
+        return 0
+    if not isinstance(value, (str, int)):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def bump_data_version() -> Optional[int]:
+    """Increments the dataset version and returns the new value (None on failure)."""
+    db = SessionLocal()
+    try:
+        ensure_table(DatasetMetadata, db.get_bind())
+        row = db.get(DatasetMetadata, DATA_VERSION_KEY, with_for_update=True)
+        if row is None:
+            row = DatasetMetadata(key=DATA_VERSION_KEY, value="0")
+            db.add(row)
+        version = int(row.value or 0) + 1
+        row.value = str(version)
+        db.commit()
+        logger.info(f"Dataset version is now {version}")
+        return version
+    except Exception as e:
+        logger.error(f"Failed to bump dataset version: {e}")
+        db.rollback()
+        return None
+    finally:
+        db.close()
+
+
+# Seconds a version read outside a request session (e.g. by middleware) is reused
+DATA_VERSION_TTL = float(os.getenv("DATA_VERSION_TTL", "5"))
+
+_cached_version: Optional[int] = None
+_cached_at = 0.0
+_cache_lock = threading.Lock()
+
+
+def current_data_version() -> Optional[int]:
+    """Dataset version from a short-lived cache, so per-request callers don't query every time."""
+    global _cached_version, _cached_at
+    with _cache_lock:
+        if _cached_version is not None and time.monotonic() - _cached_at < DATA_VERSION_TTL:
+            return _cached_version
+    db = SessionLocal()
+    try:
+        version = get_data_version(db)
+    finally:
+        db.close()
+    with _cache_lock:
+        _cached_version, _cached_at = version, time.monotonic()
+    return version
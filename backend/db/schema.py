@@ -172,3 +172,61 @@ class GlobalStats(Base):
     nyt_effect_direction = Column(String)
     
     created_at = Column(DateTime, server_default=func.now())
+
+class EtlRun(Base):
+    """
+    One row per ETL stage execution.
+    The fingerprint hashes the stage's input files and parameters, so a stage
+    whose fingerprint matches its last successful run can be skipped.
+    """
+    __tablename__ = "etl_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stage = Column(String, index=True)
+    fingerprint = Column(String(64))
+    status = Column(String) # 'success' or 'failed'
+    duration_seconds = Column(Float, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_etl_runs_stage_status', 'stage', 'status'),
+    )
+
+class DatasetMetadata(Base):
+    """
+    Key/value facts about the loaded dataset.
+    'data_version' is bumped by every ETL run that loads data, so API caches
+    keyed by it are invalidated exactly when the data changes.
+    """
+    __tablename__ = "dataset_metadata"
+
+    key = Column(String, primary_key=True)
+    value = Column(String)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+class NytAnalysisResult(Base):
+    """
+    NYT effect statistics precomputed by the ETL for one dataset version
+    ('tests': statistical test results, 'periods': period comparison), stored as JSON
+    so API requests don't have to run scipy.
+    """
+    __tablename__ = "nyt_analysis_results"
+
+    name = Column(String, primary_key=True)
+    data_version = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+# Bookkeeping tables are created by the code that first uses them rather than by the
+# import-time create_all, so importing the API or the ETL never changes an existing
+# database's schema
+ON_DEMAND_TABLES = (EtlRun.__table__, DatasetMetadata.__table__, NytAnalysisResult.__table__)
+
+def create_data_tables(bind) -> None:
+    """Creates any missing dataset tables (every table except ON_DEMAND_TABLES)."""
+    tables = [t for t in Base.metadata.sorted_tables if t not in ON_DEMAND_TABLES]
+    Base.metadata.create_all(bind=bind, tables=tables)
+
+def ensure_table(model, bind) -> None:
+    """Creates `model`'s table if it doesn't exist yet."""
+    model.__table__.create(bind=bind, checkfirst=True)
@@ -0,0 +1,146 @@
+"""
+On-disk store for intermediate ETL outputs.
+
+Artifacts live under `data/cache/artifacts/<name>/<fingerprint>/`, keyed by the
+fingerprint of the inputs that produced them, so a later run with the same inputs can
+reuse e.g. the scored tweets frame instead of re-running VADER. DataFrames are written
+as Parquet when pyarrow is installed (pickle otherwise), NumPy arrays as .npy, and
+tuples of either as numbered parts.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.etl.fingerprint import CACHE_DIR
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Parquet support is optional
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+ARTIFACT_DIR = CACHE_DIR / "artifacts"
+# Fingerprints kept per artifact name; older ones are pruned on save
+ARTIFACT_KEEP = int(os.getenv("ETL_ARTIFACT_KEEP", "3"))
+
+MANIFEST = "manifest.json"
+
+
+def _write_part(directory: Path, index: int, value) -> dict:
+    """Writes one value and returns its manifest entry."""
+    if isinstance(value, np.ndarray):
+        filename = f"part-{index}.npy"
+        np.save(directory / filename, value, allow_pickle=False)
+        return {"file": filename, "format": "npy"}
+
+    if not isinstance(value, pd.DataFrame):
+        raise TypeError(f"Unsupported artifact type: {type(value).__name__}")
+
+    if PARQUET_AVAILABLE:
+        filename = f"part-{index}.parquet"
+        try:
+            value.to_parquet(directory / filename)
+            return {"file": filename, "format": "parquet"}
+        except Exception as e:
+            # Mixed-type object columns can't always be expressed in Parquet
+            logger.warning(f"Parquet write failed ({e}); falling back to pickle.")
+            (directory / filename).unlink(missing_ok=True)
+
+    filename = f"part-{index}.pkl"
+    value.to_pickle(directory / filename)
+    return {"file": filename, "format": "pickle"}
+
+
+def _read_part(directory: Path, entry: dict):
+    path = directory / entry["file"]
+    if entry["format"] == "npy":
+        return np.load(path, allow_pickle=False)
+    if entry["format"] == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+class ArtifactStore:
+    def __init__(self, root: Optional[Path] = None, keep: Optional[int] = None):
+        self.root = Path(root) if root is not None else ARTIFACT_DIR
+        self.keep = keep if keep is not None else ARTIFACT_KEEP
+
+    def path(self, name: str, fingerprint: str) -> Path:
+        return self.root / name / fingerprint
+
+    def has(self, name: str, fingerprint: str) -> bool:
+        return (self.path(name, fingerprint) / MANIFEST).exists()
+
+    def load(self, name: str, fingerprint: str) -> Any:
+        """
+        Reads an artifact back in the shape it was saved (a single value or a tuple).
+        Raises KeyError if it does not exist.
+        """
+        directory = self.path(name, fingerprint)
+        try:
+            with open(directory / MANIFEST, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"No artifact '{name}' for fingerprint {fingerprint[:12]}")
+
+        parts = [_read_part(directory, entry) for entry in manifest["parts"]]
+        logger.info(f"Loaded artifact '{name}' ({fingerprint[:12]}) from {directory}")
+        return tuple(parts) if manifest["tuple"] else parts[0]
+
+    def save(self, name: str, fingerprint: str, value) -> Optional[Path]:
+        """
+        Writes an artifact atomically (temp directory + rename). Returns its directory,
+        or None if the value could not be stored; callers treat the cache as best effort.
+        """
+        target = self.path(name, fingerprint)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        is_tuple = isinstance(value, (tuple, list))
+        parts = list(value) if is_tuple else [value]
+
+        tmp = Path(tempfile.mkdtemp(prefix=f".{fingerprint[:12]}-", dir=target.parent))
+        try:
+            manifest = {
+                "name": name,
+                "fingerprint": fingerprint,
+                "tuple": is_tuple,
+                "parts": [_write_part(tmp, i, part) for i, part in enumerate(parts)],
+                "created_at": datetime.now().isoformat(),
+            }
+            with open(tmp / MANIFEST, "w") as f:
+                json.dump(manifest, f, indent=2)
+
+            if target.exists():
+                shutil.rmtree(target)
+            os.replace(tmp, target)
+        except Exception as e:
+            logger.warning(f"Could not store artifact '{name}': {e}")
+            shutil.rmtree(tmp, ignore_errors=True)
+            return None
+
+        logger.info(f"Stored artifact '{name}' ({fingerprint[:12]}) in {target}")
+        self.prune(name)
+        return target
+
+    def prune(self, name: str) -> None:
+        """Keeps only the most recent `keep` fingerprints of an artifact."""
+        directory = self.root / name
+        versions = sorted(
+            (p for p in directory.iterdir() if (p / MANIFEST).exists()),
+            key=lambda p: (p / MANIFEST).stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in versions[self.keep:]:
+            shutil.rmtree(stale, ignore_errors=True)
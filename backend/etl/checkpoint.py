@@ -0,0 +1,107 @@
+"""
+Chunk-level checkpoints for long-running ETL stages.
+
+A stage that works through its input in fixed-size chunks saves each chunk's partial
+aggregate under `data/cache/checkpoints/<stage>/<fingerprint>/`, together with the
+chunk's row range. With `resume=True`, completed chunks are read back instead of being
+recomputed, and the stage merges the saved partials with the new ones.
+
+Checkpoints are keyed by the same input fingerprint as the stage, so partials from
+different inputs are never mixed. A stage clears its checkpoints once it finishes.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from backend.etl.fingerprint import CACHE_DIR
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = CACHE_DIR / "checkpoints"
+
+
+class ChunkCheckpoint:
+    def __init__(self, stage: str, fingerprint: str, resume: bool = False, root: Optional[Path] = None):
+        self.stage = stage
+        self.directory = Path(root if root is not None else CHECKPOINT_DIR) / stage / fingerprint
+        self.resume = resume
+        if not resume and self.directory.exists():
+            # A fresh run must not pick up partials from an earlier attempt
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _path(self, index: int) -> Path:
+        return self.directory / f"chunk-{index:05d}.pkl"
+
+    def completed(self) -> Dict[int, Tuple[int, int]]:
+        """Chunk index -> (start, end) row range for every saved chunk (empty unless resuming)."""
+        if not self.resume:
+            return {}
+        try:
+            with open(self.directory / "progress.json", "r") as f:
+                progress = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return {int(i): tuple(rows) for i, rows in progress.items() if self._path(int(i)).exists()}
+
+    def load(self, index: int) -> Any:
+        return pd.read_pickle(self._path(index))
+
+    def save(self, index: int, rows: Tuple[int, int], partial: Any) -> None:
+        """Persists one chunk's partial aggregate, then records it as completed."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._path(index).with_suffix(".tmp")
+        pd.to_pickle(partial, tmp)
+        os.replace(tmp, self._path(index))
+
+        progress_path = self.directory / "progress.json"
+        try:
+            with open(progress_path, "r") as f:
+                progress = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            progress = {}
+        progress[str(index)] = list(rows)
+        with open(progress_path.with_suffix(".tmp"), "w") as f:
+            json.dump(progress, f, indent=2)
+        os.replace(progress_path.with_suffix(".tmp"), progress_path)
+
+    def clear(self) -> None:
+        """Drops this stage's checkpoints after it has finished."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def run_chunks(n_rows: int, chunk_size: int, compute, checkpoint: Optional[ChunkCheckpoint] = None) -> list:
+    """
+    Calls `compute(start, end)` for each chunk of `n_rows` and returns the partials in
+    chunk order. With a checkpoint, finished chunks are saved and, when resuming, reloaded.
+    """
+    done = checkpoint.completed() if checkpoint else {}
+    if done:
+        logger.info(f"Resuming {checkpoint.stage}: {len(done)} chunk(s) already completed.")
+
+    partials = []
+    for index, start in enumerate(range(0, max(n_rows, 1), chunk_size)):
+        end = min(start + chunk_size, n_rows)
+        # A chunk is reused only if it covered exactly the same rows
+        if done.get(index) == (start, end):
+            partials.append(checkpoint.load(index))
+            continue
+        partial = compute(start, end)
+        if checkpoint:
+            checkpoint.save(index, (start, end), partial)
+        partials.append(partial)
+    return partials
+
+
+def with_checkpoint(func, stage: str, fingerprint: str, resume: bool, *args):
+    """
+    Calls a chunked transform with a fresh ChunkCheckpoint. Module-level so that
+    functools.partial(with_checkpoint, ...) can be sent to a worker process.
+    """
+    return func(*args, checkpoint=ChunkCheckpoint(stage, fingerprint, resume=resume))
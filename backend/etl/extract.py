@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 BASE_DIR = Path(os.getenv("DATA_DIR", "data"))
 RAW_DATA_DIR = Path(os.getenv("RAW_DATA_DIR", str(BASE_DIR / "raw")))
 
+# Rows per chunk when streaming a CSV for an incremental run
+CSV_CHUNK_ROWS = int(os.getenv("ETL_CSV_CHUNK_ROWS", "200000"))
+
 def validate_games_csv(df: pd.DataFrame) -> None:
     """
     Validate the schema of the Wordle Games CSV.
@@ -48,14 +51,25 @@ def _find_largest_csv(directory: Path) -> Path:
     csv_files.sort(key=lambda f: f.stat().st_size, reverse=True)
     return csv_files[0]
 
+def games_csv_path() -> Path:
+    """Path of the raw Wordle games CSV (largest CSV under raw/game_data)."""
+    return _find_largest_csv(RAW_DATA_DIR / "game_data")
+
+def tweets_csv_path() -> Path:
+    """Path of the raw Wordle tweets CSV (largest CSV under raw/tweet_data)."""
+    return _find_largest_csv(RAW_DATA_DIR / "tweet_data")
+
+def guesses_path() -> Path:
+    """Path of the official Wordle guess list."""
+    return RAW_DATA_DIR / "wordle_guesses.txt"
+
 def load_kaggle_games_raw() -> pd.DataFrame:
     """
     Loads the raw Wordle games dataset.
     Returns:
         pd.DataFrame: DataFrame containing Game, Trial, processed_text, etc.
     """
-    game_dir = RAW_DATA_DIR / "game_data"
-    file_path = _find_largest_csv(game_dir)
+    file_path = games_csv_path()
     
     logger.info(f"Loading games data from {file_path}")
     df = pd.read_csv(file_path)
@@ -69,8 +83,7 @@ def load_kaggle_tweets_raw() -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing tweet_text, tweet_date, etc.
     """
-    tweet_dir = RAW_DATA_DIR / "tweet_data"
-    file_path = _find_largest_csv(tweet_dir)
+    file_path = tweets_csv_path()
     
     logger.info(f"Loading tweets data from {file_path}")
     
@@ -79,13 +92,82 @@ def load_kaggle_tweets_raw() -> pd.DataFrame:
     
     return df
 
+def unique_ids(ids: pd.Series) -> pd.Series:
+    """Unique Wordle IDs of an ID column, with non-numeric values dropped."""
+    return pd.Series(pd.to_numeric(ids, errors='coerce').dropna().astype('int64').unique(), name=ids.name)
+
+def load_game_ids() -> pd.Series:
+    """
+    Reads only the Game column of the games CSV and returns its unique IDs.
+    Cheap enough to compute date overlaps without loading or transforming the full dataset.
+    """
+    file_path = games_csv_path()
+    return unique_ids(pd.read_csv(file_path, usecols=['Game'])['Game'])
+
+def load_tweet_ids() -> pd.Series:
+    """Reads only the wordle_id column of the tweets CSV and returns its unique IDs."""
+    file_path = tweets_csv_path()
+    return unique_ids(pd.read_csv(file_path, usecols=['wordle_id'])['wordle_id'])
+
+def load_game_targets() -> pd.DataFrame:
+    """
+    Reads only the Game and target columns of the games CSV: one row per Game with its
+    first target, as transform_games_data() assigns them.
+    """
+    file_path = games_csv_path()
+    df = pd.read_csv(file_path, usecols=['Game', 'target'])
+    return df.groupby('Game')['target'].first().reset_index()
+
+def _read_csv_after_id(file_path: Path, id_column: str, after_id: int, **read_kwargs) -> pd.DataFrame:
+    """
+    Streams a CSV in chunks and keeps only rows whose `id_column` is greater than `after_id`,
+    so an incremental run never holds the full history in memory.
+    """
+    chunks = []
+    for chunk in pd.read_csv(file_path, chunksize=CSV_CHUNK_ROWS, **read_kwargs):
+        ids = pd.to_numeric(chunk[id_column], errors='coerce')
+        chunks.append(chunk[ids > after_id])
+    if not chunks:
+        return pd.read_csv(file_path, nrows=0, **read_kwargs)
+    return pd.concat(chunks, ignore_index=True)
+
+def load_kaggle_games_since(after_id: int) -> pd.DataFrame:
+    """
+    Loads only the games with a Game ID greater than `after_id`.
+    Returns:
+        pd.DataFrame: Same columns as load_kaggle_games_raw()
+    """
+    file_path = games_csv_path()
+
+    logger.info(f"Streaming games after #{after_id} from {file_path}")
+    df = _read_csv_after_id(file_path, 'Game', after_id)
+
+    validate_games_csv(df)
+    logger.info(f"Found {len(df)} game rows after #{after_id}.")
+    return df
+
+def load_kaggle_tweets_since(after_id: int) -> pd.DataFrame:
+    """
+    Loads only the tweets with a wordle_id greater than `after_id`.
+    Returns:
+        pd.DataFrame: Same columns as load_kaggle_tweets_raw()
+    """
+    file_path = tweets_csv_path()
+
+    logger.info(f"Streaming tweets after #{after_id} from {file_path}")
+    df = _read_csv_after_id(file_path, 'wordle_id', after_id, parse_dates=['tweet_date'])
+
+    validate_tweets_csv(df)
+    logger.info(f"Found {len(df)} tweets after #{after_id}.")
+    return df
+
 def load_wordle_guesses() -> list[str]:
     """
     Loads the official Wordle guess list (solutions + allowed).
     Returns:
         list[str]: List of ~13k valid 5-letter words in uppercase.
     """
-    file_path = RAW_DATA_DIR / "wordle_guesses.txt"
+    file_path = guesses_path()
     
     if not file_path.exists():
         logger.warning(f"Wordle guesses file not found at {file_path}. Using fallback list.")
@@ -0,0 +1,133 @@
+"""
+Content-hash change detection for ETL stages.
+
+A stage fingerprint combines the SHA-256 of the stage's input files with a hash of
+the parameters that shape its output (thresholds, lexicon, date bounds). Successful
+runs are recorded in 'etl_runs'; a stage whose fingerprint matches its last
+successful run can skip both transform and load.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from backend.db.database import SessionLocal
+from backend.db.schema import EtlRun, ensure_table
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Bump when transform logic changes in a way the inputs and parameters don't capture
+PIPELINE_VERSION = "1"
+
+# File digests are memoized on (size, mtime) so unchanged CSVs aren't re-read every run
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(Path(os.getenv("DATA_DIR", "data")) / "cache")))
+DIGEST_CACHE_PATH = CACHE_DIR / "file_digests.json"
+
+
+def _hash_json(payload) -> str:
+    """Stable SHA-256 of a JSON-serializable payload."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _read_digest_cache() -> dict:
+    try:
+        with open(DIGEST_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_digest_cache(cache: dict) -> None:
+    DIGEST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(DIGEST_CACHE_PATH, "w") as f:
+        json.dump(cache, f, indent=2)
+
+
+def file_digest(path) -> str:
+    """
+    Returns the SHA-256 of a file, or 'missing' if it does not exist.
+    Reuses the cached digest when the file's size and mtime are unchanged.
+    """
+    path = Path(path)
+    if not path.exists():
+        return "missing"
+
+    stat = path.stat()
+    key = str(path.resolve())
+    cache = _read_digest_cache()
+    entry = cache.get(key)
+    if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry["sha256"]
+
+    logger.info(f"Hashing {path}...")
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+
+    cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha.hexdigest()}
+    _write_digest_cache(cache)
+    return cache[key]["sha256"]
+
+
+def lexicon_version() -> str:
+    """Hash of the sentiment lexicon customizations and stopword lists."""
+    from backend.etl.transform import WORDLE_LEXICON_EXT, PROTECTED_KEYWORDS, STOP_WORDS, sia
+    return _hash_json({
+        "lexicon_ext": WORDLE_LEXICON_EXT,
+        "protected": sorted(PROTECTED_KEYWORDS),
+        "stopwords": sorted(STOP_WORDS),
+        "vader_size": len(sia.lexicon),
+    })
+
+
+def stage_fingerprint(stage: str, files: Iterable = (), params: Optional[dict] = None) -> str:
+    """Fingerprint of a stage's inputs: file contents plus output-shaping parameters."""
+    return _hash_json({
+        "stage": stage,
+        "pipeline_version": PIPELINE_VERSION,
+        "files": [file_digest(f) for f in files],
+        "params": params or {},
+    })
+
+
+def last_successful_fingerprint(stage: str) -> Optional[str]:
+    """Fingerprint of the stage's most recent successful run, if any."""
+    db = SessionLocal()
+    try:
+        ensure_table(EtlRun, db.get_bind())
+        run = db.query(EtlRun)\
+            .filter(EtlRun.stage == stage, EtlRun.status == "success")\
+            .order_by(EtlRun.id.desc())\
+            .first()
+        return run.fingerprint if run else None
+    finally:
+        db.close()
+
+
+def is_stage_current(stage: str, fingerprint: str) -> bool:
+    """True if the stage last succeeded with exactly these inputs."""
+    return last_successful_fingerprint(stage) == fingerprint
+
+
+def record_stage_run(stage: str, fingerprint: str, success: bool, duration: Optional[float] = None) -> None:
+    """Stores the outcome of a stage run in 'etl_runs'."""
+    db = SessionLocal()
+    try:
+        ensure_table(EtlRun, db.get_bind())
+        db.add(EtlRun(
+            stage=stage,
+            fingerprint=fingerprint,
+            status="success" if success else "failed",
+            duration_seconds=duration
+        ))
+        db.commit()
+    except Exception as e:
+        logger.error(f"Failed to record ETL run for {stage}: {e}")
+        db.rollback()
+    finally:
+        db.close()
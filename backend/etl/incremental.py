@@ -0,0 +1,156 @@
+"""
+Incremental ETL: process only the Wordle IDs newer than what is already loaded.
+
+New games and tweets are transformed on their own, filtered to the IDs present in
+both CSVs (DATE_CAP only applies to the historical backfill), and upserted. A run
+covers games up to the newest one it loads and records that ID (PROCESSED_THROUGH_KEY);
+the next run starts after it. A full backfill records the highest Game ID in the CSV,
+since its patterns count every game, including those it keeps out of 'words'.
+Dependent tables are updated from mergeable state instead of the raw history:
+- Pattern stats/transitions: counts add, and avg_guesses merges through
+  sum_guesses = avg_guesses * success_count; ranks are recomputed on the merged counts.
+- Outliers and global stats: rebuilt from the per-day aggregates already in the
+  database (one row per day), never from raw tweets.
+- Traps: a new target can be a neighbour of earlier words, so every target in the
+  games CSV is rescored (the same rows as a full run) and upserted by word_id; rows
+  that didn't change are skipped by the upsert.
+"""
+
+import logging
+
+import pandas as pd
+from sqlalchemy import func, select
+
+from backend.db.database import SessionLocal, engine
+from backend.db.schema import Word, Distribution, TweetSentiment, PatternStatistic, PatternTransition, DatasetMetadata, ensure_table
+from backend.etl.load import load_patterns_data
+from backend.etl.transformers.shared import calculate_frequency_score
+from backend.etl.transformers.traps import transform_trap_data
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+# 'dataset_metadata' key holding the highest Game ID the ETL has read from the games CSV
+PROCESSED_THROUGH_KEY = "processed_through_game_id"
+
+
+def max_loaded_word_id() -> int:
+    """Highest Wordle ID in 'words' (0 if the table is empty)."""
+    db = SessionLocal()
+    try:
+        return db.execute(select(func.max(Word.id))).scalar() or 0
+    finally:
+        db.close()
+
+
+def processed_through_id() -> int:
+    """
+    Highest Game ID already processed. Databases loaded before it was recorded fall
+    back to the highest loaded word.
+    """
+    db = SessionLocal()
+    try:
+        ensure_table(DatasetMetadata, db.get_bind())
+        value = db.execute(select(DatasetMetadata.value).where(DatasetMetadata.key == PROCESSED_THROUGH_KEY)).scalar()
+    finally:
+        db.close()
+    return int(value) if value is not None else max_loaded_word_id()
+
+
+def record_processed_through(game_id: int) -> None:
+    """Stores the highest Game ID processed, where the next incremental run starts."""
+    db = SessionLocal()
+    try:
+        ensure_table(DatasetMetadata, db.get_bind())
+        db.merge(DatasetMetadata(key=PROCESSED_THROUGH_KEY, value=str(int(game_id))))
+        db.commit()
+        logger.info(f"Processed games through #{game_id}")
+    finally:
+        db.close()
+
+
+def merge_pattern_stats(current: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    Merges pattern statistics computed over disjoint sets of games.
+    Expects columns: pattern, count, success_count, avg_guesses.
+    """
+    def with_sums(df: pd.DataFrame) -> pd.DataFrame:
+        df = df.set_index('pattern')[['count', 'success_count', 'avg_guesses']].astype(float)
+        df['sum_guesses'] = df['avg_guesses'] * df['success_count']
+        return df[['count', 'success_count', 'sum_guesses']]
+
+    merged = with_sums(current).add(with_sums(delta), fill_value=0)
+    merged['avg_guesses'] = 0.0
+    solved = merged['success_count'] > 0
+    merged.loc[solved, 'avg_guesses'] = merged.loc[solved, 'sum_guesses'] / merged.loc[solved, 'success_count']
+
+    merged = merged.drop(columns='sum_guesses').reset_index()
+    merged.index.name = None
+    merged['count'] = merged['count'].astype(int)
+    merged['success_count'] = merged['success_count'].astype(int)
+    merged['rank'] = merged['count'].rank(ascending=False, method='min').astype(int)
+    return merged[['pattern', 'count', 'success_count', 'avg_guesses', 'rank']]
+
+
+def merge_pattern_transitions(current: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """Sums transition counts per (source_pattern, next_pattern)."""
+    columns = ['source_pattern', 'next_pattern', 'count']
+    frames = [df[columns] for df in (current, delta) if not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    merged = pd.concat(frames, ignore_index=True)
+    merged = merged.groupby(['source_pattern', 'next_pattern'], as_index=False)['count'].sum()
+    merged['count'] = merged['count'].astype(int)
+    return merged
+
+
+def merge_and_load_patterns(deltas) -> bool:
+    """Merges (stats_delta, transitions_delta) into the loaded pattern tables."""
+    stats_delta, trans_delta = deltas
+    if stats_delta.empty:
+        logger.info("No new patterns to merge.")
+        return True
+
+    current_stats = pd.read_sql(
+        select(PatternStatistic.pattern, PatternStatistic.count, PatternStatistic.success_count, PatternStatistic.avg_guesses),
+        engine
+    )
+    current_trans = pd.read_sql(
+        select(PatternTransition.source_pattern, PatternTransition.next_pattern, PatternTransition.count),
+        engine
+    )
+    logger.info(f"Merging {len(stats_delta)} pattern deltas into {len(current_stats)} loaded patterns...")
+    return load_patterns_data(
+        merge_pattern_stats(current_stats, stats_delta),
+        merge_pattern_transitions(current_trans, trans_delta)
+    )
+
+
+def games_frame_from_db() -> pd.DataFrame:
+    """
+    Per-day games aggregates as loaded, in the column layout of transform_games_data()
+    that the outlier and global stats transforms read.
+    """
+    query = select(
+        Word.id.label('Game'),
+        Word.word.label('target'),
+        Word.date,
+        Word.avg_guess_count.label('avg_guesses'),
+        Word.success_rate,
+        Word.difficulty_rating,
+        Distribution.total_tweets,
+    ).join(Distribution, Distribution.word_id == Word.id).order_by(Word.id)
+    return pd.read_sql(query, engine)
+
+
+def sentiment_frame_from_db() -> pd.DataFrame:
+    """Per-day sentiment aggregates as loaded (date, avg_sentiment)."""
+    query = select(TweetSentiment.date, TweetSentiment.avg_sentiment).order_by(TweetSentiment.date)
+    return pd.read_sql(query, engine)
+
+
+def traps_for_all_targets(game_targets: pd.DataFrame, guess_list=None) -> pd.DataFrame:
+    """Trap analysis over every game in `game_targets` (Game, target), as a full run computes it."""
+    games = game_targets.assign(frequency_score=game_targets['target'].astype(str).map(calculate_frequency_score))
+    return transform_trap_data(games, guess_list)
@@ -1,21 +1,159 @@
+from sqlalchemy import Column, Integer, MetaData, Table, or_, select, text
+from sqlalchemy.sql.elements import conv
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from backend.db.database import SessionLocal, engine, Base
-from backend.db.schema import Word, Distribution, TweetSentiment, PatternStatistic, PatternTransition, Outlier, TrapAnalysis, GlobalStats
+from backend.db.database import SessionLocal, engine, DB_POOL_SIZE
+from backend.db.schema import Word, Distribution, TweetSentiment, PatternStatistic, PatternTransition, Outlier, TrapAnalysis, GlobalStats, create_data_tables
 import pandas as pd
 import logging
+import os
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Rows per upsert statement (keeps SQLite under its bound-parameter limit)
+ETL_BATCH_SIZE = int(os.getenv("ETL_BATCH_SIZE", "1000"))
+
+# Default worker count for concurrent table loads (bounded by the connection pool)
+ETL_LOAD_WORKERS = int(os.getenv("ETL_LOAD_WORKERS", "4"))
+
+# Full-refresh strategy for pattern/outlier/trap tables: 'swap' (staging table + rename) or 'truncate'
+REFRESH_MODE = os.getenv("ETL_REFRESH_MODE", "swap")
+STAGING_SUFFIX = "__staging"
+OLD_SUFFIX = "__old"
+
+# Dialects with native INSERT ... ON CONFLICT support
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Source column -> (table column, dtype) for columnar record building
+WORD_COLUMNS = {
+    'Game': ('id', 'int64'),
+    'target': ('word', 'str'),
+    'date': ('date', 'str'),
+    'avg_guesses': ('avg_guess_count', 'float64'),
+    'success_rate': ('success_rate', 'float64'),
+    'frequency_score': ('frequency_score', 'float64'),
+    'difficulty_rating': ('difficulty_rating', 'int64'),
+}
+DISTRIBUTION_COLUMNS = {
+    'Game': ('word_id', 'int64'),
+    'date': ('date', 'str'),
+    **{f'guess_{i}': (f'guess_{i}', 'int64') for i in range(1, 7)},
+    'failed': ('failed', 'int64'),
+    'total_tweets': ('total_tweets', 'int64'),
+    'avg_guesses': ('avg_guesses', 'float64'),
+}
+SENTIMENT_COLUMNS = {
+    'wordle_id': ('word_id', 'int64'),
+    'date': ('date', 'str'),
+    'avg_sentiment': ('avg_sentiment', 'float64'),
+    'frustration_index': ('frustration_index', 'float64'),
+    'sample_size': ('sample_size', 'int64'),
+    'very_pos_count': ('very_pos_count', 'int64'),
+    'pos_count': ('pos_count', 'int64'),
+    'neu_count': ('neu_count', 'int64'),
+    'neg_count': ('neg_count', 'int64'),
+    'very_neg_count': ('very_neg_count', 'int64'),
+}
+
 # Create tables if they don't exist
 logger.info("Ensuring database tables exist...")
-Base.metadata.create_all(bind=engine)
+create_data_tables(engine)
+
+
+def _frame_records(df: pd.DataFrame, columns: Dict[str, tuple]) -> List[dict]:
+    """
+    Selects, renames and casts DataFrame columns in one vectorized pass and
+    returns them as a list of row dicts with native Python values.
+    """
+    frame = df[list(columns)].rename(columns={src: dst for src, (dst, _) in columns.items()})
+    frame = frame.astype({dst: dtype for dst, dtype in columns.values()})
+    return frame.to_dict(orient='records')
+
+
+def _existing_word_id_mask(db: Session, word_ids: pd.Series) -> pd.Series:
+    """
+    Returns a boolean mask of which IDs exist in 'words'.
+    The incoming IDs go into a temporary table and are matched with a JOIN,
+    so the words table is never pulled into Python.
+    """
+    conn = db.connection()
+    incoming = Table(
+        "_incoming_word_ids", MetaData(),
+        Column("word_id", Integer, primary_key=True),
+        prefixes=["TEMPORARY"]
+    )
+    # A failed load can leave the table (and its rows) on this pooled connection
+    incoming.create(conn, checkfirst=True)
+    conn.execute(incoming.delete())
+    unique_ids = word_ids.drop_duplicates().astype('int64')
+    conn.execute(incoming.insert(), [{"word_id": word_id} for word_id in unique_ids.tolist()])
+    valid_ids = conn.execute(
+        select(incoming.c.word_id).join(Word.__table__, Word.__table__.c.id == incoming.c.word_id)
+    ).scalars().all()
+    incoming.drop(conn)
+    return word_ids.isin(valid_ids)
+
+
+def _upsert_rows(db: Session, model, rows: List[dict], conflict_cols: List[str]) -> int:
+    """
+    Inserts rows into the model's table, updating existing rows on a conflict over `conflict_cols`.
+    The update only fires when at least one value differs, so re-running with unchanged
+    data writes nothing.
+
+    Falls back to DELETE + INSERT on dialects without ON CONFLICT support.
+
+    Returns:
+        Number of rows inserted or updated (-1 if the driver does not report it)
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    insert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        return _replace_rows(db, model, rows, conflict_cols)
+
+    stmt = insert(table)
+    update_cols = [col for col in rows[0] if col not in conflict_cols]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict_cols,
+        set_={col: stmt.excluded[col] for col in update_cols},
+        where=or_(*[table.c[col].is_distinct_from(stmt.excluded[col]) for col in update_cols])
+    )
+
+    written = 0
+    for start in range(0, len(rows), ETL_BATCH_SIZE):
+        result = db.execute(stmt, rows[start:start + ETL_BATCH_SIZE])
+        if result.rowcount is None or result.rowcount < 0:
+            written = -1
+        elif written >= 0:
+            written += result.rowcount
+    return written
+
+
+def _replace_rows(db: Session, model, rows: List[dict], key_cols: List[str]) -> int:
+    """Legacy idempotent write: DELETE rows matching the first key column, then bulk INSERT."""
+    key = key_cols[0]
+    keys = [row[key] for row in rows]
+    db.query(model).filter(getattr(model, key).in_(keys)).delete(synchronize_session=False)
+    db.flush()
+    db.bulk_insert_mappings(model, rows)
+    return len(rows)
+
 
 def load_games_data(df: pd.DataFrame):
     """
-    Loads transformed games data into 'words' and 'distributions' tables using bulk insert.
-    Strategy: DELETE existing records for these IDs, then INSERT new ones (Idempotent).
+    Loads transformed games data into 'words' and 'distributions' tables.
+    Strategy: Native upsert keyed on words.id / distributions.word_id (Idempotent).
+    Unchanged rows are skipped, so re-runs mostly write nothing.
     """
     logger.info(f"load_games_data called with {len(df)} rows")
     if df.empty:
@@ -24,67 +162,32 @@ def load_games_data(df: pd.DataFrame):
 
     db: Session = SessionLocal()
     try:
-        words_data = [] # List of dicts
-        dists_data = [] # List of dicts
+        # Rename and cast once per column instead of once per cell
+        words_data = _frame_records(df, WORD_COLUMNS)
+        dists_data = _frame_records(df, DISTRIBUTION_COLUMNS)
+
+        logger.info("Performing Bulk Upsert (INSERT ... ON CONFLICT) for Games data...")
+
+        # Words first so distributions never reference a missing parent
+        words_written = _upsert_rows(db, Word, words_data, ["id"])
+        dists_written = _upsert_rows(db, Distribution, dists_data, ["word_id"])
 
-        for i, row in df.iterrows():
-            wordle_id = int(row['Game'])
-            target_word = row['target']
-            game_date_str = str(row['date'])
-            
-            # Word Data
-            words_data.append({
-                "id": wordle_id,
-                "word": target_word,
-                "date": game_date_str,
-                "avg_guess_count": float(row['avg_guesses']),
-                "success_rate": float(row['success_rate']),
-                "frequency_score": float(row['frequency_score']),
-                "difficulty_rating": int(row['difficulty_rating'])
-            })
-            
-            # Distribution Data
-            dists_data.append({
-                "word_id": wordle_id,
-                "date": game_date_str,
-                "guess_1": int(row['guess_1']),
-                "guess_2": int(row['guess_2']),
-                "guess_3": int(row['guess_3']),
-                "guess_4": int(row['guess_4']),
-                "guess_5": int(row['guess_5']),
-                "guess_6": int(row['guess_6']),
-                "failed": int(row['failed']),
-                "total_tweets": int(row['total_tweets']),
-                "avg_guesses": float(row['avg_guesses'])
-            })
-
-        logger.info("Performing Bulk Upsert (DELETE + INSERT) for Games data...")
-        
-        ids_to_process = [d['id'] for d in words_data]
-        
-        # Clean existing
-        db.query(Distribution).filter(Distribution.word_id.in_(ids_to_process)).delete(synchronize_session=False)
-        db.query(Word).filter(Word.id.in_(ids_to_process)).delete(synchronize_session=False)
-        db.flush()
-        
-        # Bulk Insert
-        db.bulk_insert_mappings(Word, words_data)
-        db.bulk_insert_mappings(Distribution, dists_data)
-        
         db.commit()
-        logger.info("Games data load complete.")
+        logger.info(f"Games data load complete ({words_written} words and {dists_written} distributions written).")
+        return True
         
     except Exception as e:
         logger.error(f"Error loading games data: {e}")
         logger.debug(traceback.format_exc())
         db.rollback()
+        return False
     finally:
         db.close()
 
 def load_tweets_data(df: pd.DataFrame):
     """
     Loads transformed tweet sentiment data.
-    Strategy: DELETE existing records for these word_ids, then INSERT new ones.
+    Strategy: Native upsert keyed on tweet_sentiment.date; unchanged rows are skipped.
     """
     logger.info(f"load_tweets_data called with {len(df)} rows")
     if df.empty:
@@ -92,138 +195,237 @@ def load_tweets_data(df: pd.DataFrame):
 
     db: Session = SessionLocal()
     try:
-        sentiment_data = []
-        for _, row in df.iterrows():
-            wordle_id = int(row['wordle_id'])
-            
-            sentiment_data.append({
-                "word_id": wordle_id,
-                "date": str(row['date']),
-                "avg_sentiment": float(row['avg_sentiment']),
-                "frustration_index": float(row['frustration_index']),
-                "sample_size": int(row['sample_size']),
-                "very_pos_count": int(row['very_pos_count']),
-                "pos_count": int(row['pos_count']),
-                "neu_count": int(row['neu_count']),
-                "neg_count": int(row['neg_count']),
-                "very_neg_count": int(row['very_neg_count'])
-            })
-            
-        # Filter for valid Word IDs to avoid FK violations
-        existing_ids = set(flat_id for (flat_id,) in db.query(Word.id).all())
-        original_count = len(sentiment_data)
-        sentiment_data = [d for d in sentiment_data if d['word_id'] in existing_ids]
-        dropped_count = original_count - len(sentiment_data)
-        
+        # Filter for valid Word IDs to avoid FK violations (resolved in SQL)
+        valid_mask = _existing_word_id_mask(db, df['wordle_id'])
+        dropped_count = int((~valid_mask).sum())
+
         if dropped_count > 0:
             logger.warning(f"Dropped {dropped_count} sentiment records due to missing Word IDs.")
-            
-        logger.info("Performing Bulk Upsert (DELETE + INSERT) for Sentiment data...")
-        
-        ids_to_process = [d['word_id'] for d in sentiment_data]
-        
-        # Clean existing
-        db.query(TweetSentiment).filter(TweetSentiment.word_id.in_(ids_to_process)).delete(synchronize_session=False)
-        db.flush()
-        
-        # Bulk Insert
-        db.bulk_insert_mappings(TweetSentiment, sentiment_data)
-        
+
+        sentiment_data = _frame_records(df[valid_mask], SENTIMENT_COLUMNS)
+
+        logger.info("Performing Bulk Upsert (INSERT ... ON CONFLICT) for Sentiment data...")
+
+        written = _upsert_rows(db, TweetSentiment, sentiment_data, ["date"])
+
         db.commit()
-        logger.info("Tweet sentiment load complete.")
+        logger.info(f"Tweet sentiment load complete ({written} rows written).")
+        return True
         
     except Exception as e:
         logger.error(f"Error loading tweet data: {e}")
         logger.debug(traceback.format_exc())
         db.rollback()
+        return False
     finally:
         db.close()
 
-def load_patterns_data(stats_df: pd.DataFrame, transitions_df: pd.DataFrame):
+def load_patterns_data(stats_df: pd.DataFrame, transitions_df: pd.DataFrame, mode: Optional[str] = None):
     """
     Loads pattern stats and transitions.
-    Strategy: Truncate tables and reload (Full Refresh).
+    Strategy: Full Refresh, via staging-table swap (default) or truncate + reload.
     """
     logger.info(f"load_patterns_data called with {len(stats_df)} stats and {len(transitions_df)} transitions")
-    
+    return _full_refresh({
+        PatternStatistic: stats_df.to_dict(orient='records'),
+        PatternTransition: transitions_df.to_dict(orient='records')
+    }, "pattern", mode)
+
+def load_outliers_data(df: pd.DataFrame, mode: Optional[str] = None):
+    """
+    Loads outlier analysis results.
+    Strategy: Full Refresh, via staging-table swap (default) or truncate + reload.
+    """
+    logger.info(f"load_outliers_data called with {len(df)} rows")
+    return _full_refresh({Outlier: df.to_dict(orient='records')}, "outlier", mode)
+
+def load_trap_data(df: pd.DataFrame, mode: Optional[str] = None):
+    """
+    Loads trap analysis results.
+    Strategy: Full Refresh, via staging-table swap (default) or truncate + reload.
+    """
+    logger.info(f"load_trap_data called with {len(df)} rows")
+    return _full_refresh({TrapAnalysis: df.to_dict(orient='records')}, "trap", mode)
+
+def upsert_trap_data(df: pd.DataFrame):
+    """
+    Adds or updates trap analysis rows for specific words (incremental runs).
+    Strategy: Native upsert keyed on trap_analysis.word_id; other words are left untouched.
+    """
+    logger.info(f"upsert_trap_data called with {len(df)} rows")
+    if df.empty:
+        return True
+
     db: Session = SessionLocal()
     try:
-        logger.info("Truncating pattern tables...")
-        db.query(PatternTransition).delete()
-        db.query(PatternStatistic).delete()
-        db.flush()
-        
-        if not stats_df.empty:
-            logger.info("Inserting Pattern Statistics...")
-            db.bulk_insert_mappings(PatternStatistic, stats_df.to_dict(orient='records'))
-            
-        if not transitions_df.empty:
-            logger.info("Inserting Pattern Transitions...")
-            db.bulk_insert_mappings(PatternTransition, transitions_df.to_dict(orient='records'))
-            
+        written = _upsert_rows(db, TrapAnalysis, df.to_dict(orient='records'), ["word_id"])
         db.commit()
-        logger.info("Pattern data load complete.")
-        
+        logger.info(f"Trap data upsert complete ({written} rows written).")
+        return True
+
     except Exception as e:
-        logger.error(f"Error loading pattern data: {e}")
+        logger.error(f"Error upserting trap data: {e}")
         logger.debug(traceback.format_exc())
         db.rollback()
+        return False
     finally:
         db.close()
 
-def load_outliers_data(df: pd.DataFrame):
+def _full_refresh(records_by_model: Dict[type, List[dict]], label: str, mode: Optional[str] = None) -> bool:
     """
-    Loads outlier analysis results.
-    Strategy: Truncate and Reload (Full Refresh).
+    Replaces the full contents of each model's table with the given records.
+
+    Modes:
+        swap: Bulk-load into '<table>__staging' tables, then rename them over the live
+              tables in one short transaction. Readers never wait on the bulk insert.
+        truncate: DELETE every row and reinsert inside a single transaction.
+
+    Returns:
+        True if the load committed, False if it was rolled back
     """
-    logger.info(f"load_outliers_data called with {len(df)} rows")
-    
+    mode = mode or REFRESH_MODE
     db: Session = SessionLocal()
     try:
-        logger.info("Truncating outlier table...")
-        db.query(Outlier).delete()
-        db.flush()
-        
-        if not df.empty:
-            logger.info("Inserting Outliers...")
-            db.bulk_insert_mappings(Outlier, df.to_dict(orient='records'))
-            
-        db.commit()
-        logger.info("Outlier data load complete.")
-        
+        if mode == "swap":
+            _swap_load(db, records_by_model)
+        else:
+            logger.info(f"Truncating {label} tables...")
+            # Delete in reverse order so children go before any parents
+            for model in reversed(list(records_by_model)):
+                db.query(model).delete()
+            db.flush()
+            for model, records in records_by_model.items():
+                if records:
+                    logger.info(f"Inserting into {model.__tablename__}...")
+                    db.bulk_insert_mappings(model, records)
+            db.commit()
+        logger.info(f"{label.capitalize()} data load complete.")
+        return True
+
     except Exception as e:
-        logger.error(f"Error loading outlier data: {e}")
+        logger.error(f"Error loading {label} data: {e}")
         logger.debug(traceback.format_exc())
         db.rollback()
+        return False
     finally:
         db.close()
 
-def load_trap_data(df: pd.DataFrame):
+def _staging_table(model) -> Table:
     """
-    Loads trap analysis results.
-    Strategy: Truncate and Reload (Full Refresh).
+    Builds a copy of the model's table named '<table>__staging'.
+    Explicitly named indexes get the suffix too, so they don't clash with the live table's.
     """
-    logger.info(f"load_trap_data called with {len(df)} rows")
-    
-    db: Session = SessionLocal()
+    live = model.__table__
+    metadata = MetaData()
+    # Referenced tables must exist in the copy's metadata for FKs to resolve
+    for fk in live.foreign_keys:
+        fk.column.table.to_metadata(metadata)
+    staging = live.to_metadata(metadata, name=live.name + STAGING_SUFFIX)
+    for index in staging.indexes:
+        if not isinstance(index.name, conv):
+            index.name = index.name + STAGING_SUFFIX
+    return staging
+
+def _swap_load(db: Session, records_by_model: Dict[type, List[dict]]):
+    """
+    Loads records into staging tables (indexes included), then swaps them in.
+    The swap transaction only renames tables and drops the old ones.
+    If anything fails, the staging tables are dropped before the error propagates.
+    """
+    conn = db.connection()
+    dialect = conn.dialect.name
+    staged = {}
+
     try:
-        logger.info("Truncating trap_analysis table...")
-        db.query(TrapAnalysis).delete()
-        db.flush()
-        
-        if not df.empty:
-            logger.info("Inserting Trap Analysis...")
-            db.bulk_insert_mappings(TrapAnalysis, df.to_dict(orient='records'))
-            
+        # 1. Build and fill staging tables outside the swap transaction
+        for model, records in records_by_model.items():
+            staging = _staging_table(model)
+            staging.drop(conn, checkfirst=True)
+            staged[model] = staging
+            staging.create(conn)
+            logger.info(f"Loading {len(records)} rows into {staging.name}...")
+            for start in range(0, len(records), ETL_BATCH_SIZE):
+                conn.execute(staging.insert(), records[start:start + ETL_BATCH_SIZE])
+        db.commit()
+
+        # 2. Swap: live -> __old, staging -> live, drop old
+        conn = db.connection()
+        if dialect == "sqlite":
+            # pysqlite runs DDL in autocommit unless a transaction is already open;
+            # a no-op DELETE opens one so the renames below commit atomically.
+            first = next(iter(staged.values()))
+            conn.exec_driver_sql(f'DELETE FROM "{first.name}" WHERE 0')
+
+        logger.info(f"Swapping staging tables into place: {', '.join(m.__tablename__ for m in staged)}")
+        for model, staging in staged.items():
+            live_name = model.__tablename__
+            old_name = live_name + OLD_SUFFIX
+            conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{old_name}"')
+            conn.exec_driver_sql(f'ALTER TABLE "{live_name}" RENAME TO "{old_name}"')
+            conn.exec_driver_sql(f'ALTER TABLE "{staging.name}" RENAME TO "{live_name}"')
+            conn.exec_driver_sql(f'DROP TABLE "{old_name}"')
+            _restore_index_names(conn, model.__table__, staging)
+            if dialect == "postgresql":
+                _restore_constraint_names(conn, live_name, staging.name)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _drop_staging_tables(db, staged.values())
+        raise
+
+def _drop_staging_tables(db: Session, tables) -> None:
+    """Best-effort cleanup after a failed swap, so no '__staging' tables are left behind."""
+    try:
+        conn = db.connection()
+        for staging in tables:
+            staging.drop(conn, checkfirst=True)
         db.commit()
-        logger.info("Trap data load complete.")
-        
     except Exception as e:
-        logger.error(f"Error loading trap data: {e}")
-        logger.debug(traceback.format_exc())
+        logger.warning(f"Could not drop staging tables: {e}")
         db.rollback()
-    finally:
-        db.close()
+
+def _restore_constraint_names(conn, live_name: str, staging_name: str):
+    """
+    PostgreSQL names a table's constraints (primary/unique/foreign keys) and its serial
+    sequences after the table, so the swapped-in table still carries '<table>__staging...'
+    names. Renames them to the live table's names, freeing the staging names for the
+    next refresh. Renaming a key constraint renames its index too.
+    """
+    constraints = conn.execute(
+        text("SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass)"),
+        {"table": live_name}
+    ).scalars().all()
+    for name in constraints:
+        if name.startswith(staging_name):
+            conn.exec_driver_sql(
+                f'ALTER TABLE "{live_name}" RENAME CONSTRAINT "{name}" TO "{live_name + name[len(staging_name):]}"'
+            )
+
+    # Sequences owned by one of the table's columns (serial / identity)
+    sequences = conn.execute(
+        text(
+            "SELECT s.relname FROM pg_class s JOIN pg_depend d ON d.objid = s.oid "
+            "WHERE s.relkind = 'S' AND d.refobjid = CAST(:table AS regclass) AND d.deptype IN ('a', 'i')"
+        ),
+        {"table": live_name}
+    ).scalars().all()
+    for name in sequences:
+        if name.startswith(staging_name):
+            conn.exec_driver_sql(f'ALTER SEQUENCE "{name}" RENAME TO "{live_name + name[len(staging_name):]}"')
+
+def _restore_index_names(conn, live: Table, staging: Table):
+    """Gives the swapped-in table's indexes their canonical (live) names again."""
+    live_names = {tuple(c.name for c in idx.columns): idx for idx in live.indexes}
+    for index in staging.indexes:
+        target = live_names.get(tuple(c.name for c in index.columns))
+        if target is None or target.name == index.name:
+            continue
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql(f'ALTER INDEX "{index.name}" RENAME TO "{target.name}"')
+        else:
+            # SQLite cannot rename indexes; recreate under the canonical name
+            conn.exec_driver_sql(f'DROP INDEX "{index.name}"')
+            target.create(conn)
 
 def load_global_stats(stats_dict: dict):
     """
@@ -252,10 +454,58 @@ def load_global_stats(stats_dict: dict):
             
         db.commit()
         logger.info("Global stats load complete.")
+        return True
         
     except Exception as e:
         logger.error(f"Error loading global stats: {e}")
         logger.debug(traceback.format_exc())
         db.rollback()
+        return False
     finally:
         db.close()
+
+
+def load_worker_count(max_workers: Optional[int] = None, n_loads: Optional[int] = None) -> int:
+    """
+    Number of threads to use for concurrent loads: the requested count (default
+    ETL_LOAD_WORKERS), capped by the number of loads and the connection pool size.
+    SQLite allows a single writer at a time, so it always gets one.
+    """
+    workers = max_workers or ETL_LOAD_WORKERS
+    workers = max(1, min(workers, n_loads or workers, DB_POOL_SIZE))
+    if engine.dialect.name == "sqlite" and workers > 1:
+        logger.info("SQLite permits one writer at a time; running loads sequentially.")
+        workers = 1
+    return workers
+
+def run_loads_concurrently(loads: Dict[str, Callable[[], None]], max_workers: Optional[int] = None) -> Dict[str, float]:
+    """
+    Runs independent table loads on a thread pool, each on its own pooled session.
+    Callers must only pass loads whose FK parents (e.g. 'words') are already committed.
+    A load fails if it raises or returns False (the loaders' rollback signal).
+
+    SQLite allows a single writer at a time, so loads run one after another there.
+
+    Returns:
+        Dict of load name -> duration in seconds, for the loads that succeeded
+    """
+    workers = load_worker_count(max_workers, len(loads))
+
+    def timed(name: str, load_fn: Callable[[], None]) -> float:
+        start = time.perf_counter()
+        if load_fn() is False:
+            raise RuntimeError("load was rolled back")
+        duration = time.perf_counter() - start
+        logger.info(f"Load '{name}' finished in {duration:.2f}s")
+        return duration
+
+    logger.info(f"Running {len(loads)} table loads with {workers} worker(s): {', '.join(loads)}")
+    timings = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="etl-load") as pool:
+        futures = {name: pool.submit(timed, name, load_fn) for name, load_fn in loads.items()}
+        for name, future in futures.items():
+            try:
+                timings[name] = future.result()
+            except Exception as e:
+                logger.error(f"Load '{name}' failed: {e}", exc_info=True)
+    return timings
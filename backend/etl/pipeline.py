@@ -0,0 +1,304 @@
+"""
+Minimal DAG runner for the ETL pipeline.
+
+Each stage declares the stages whose outputs it consumes. The runner computes every
+stage at most once per run, passes outputs to dependents positionally, and drops an
+output as soon as no remaining stage needs it. Stages marked `io=True` (database
+loads) run on a thread pool, stages marked `cpu=True` run in a process pool when more
+than one worker is allowed, and everything else runs on the calling thread. The run
+ends with a per-stage table and the critical path, i.e. the longest chain of dependent
+stages, which bounds how much concurrency can help.
+
+Per-stage peak memory is opt-in (`track_memory`), since tracemalloc slows down every
+allocation. The peak is traced for stages on the calling thread only. While I/O
+threads run alongside, their allocations count towards that stage, so peaks are
+approximate whenever stages overlap.
+
+Stages with a `fingerprint` are persisted in an ArtifactStore when one is given. If an
+artifact for that fingerprint already exists, the stage is read back from disk and its
+upstream stages are not run at all (unless something else still needs them).
+
+If a stage fails, its transitive dependents are skipped and the other branches keep going.
+"""
+
+import logging
+import time
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.etl.artifacts import ArtifactStore
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """A pipeline node: `func(*outputs_of_deps)` produces this stage's output."""
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    after: Tuple[str, ...] = ()  # Ordering-only dependencies; their outputs are not passed in
+    io: bool = False  # Database/file-bound; runs on the I/O thread pool
+    cpu: bool = False  # CPU-bound; runs in the process pool when cpu_workers > 1 (func and inputs must pickle)
+    fingerprint: Optional[str] = None  # Input fingerprint; enables the artifact cache
+
+    @property
+    def upstream(self) -> Tuple[str, ...]:
+        return self.deps + self.after
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # 'success', 'cached', 'failed' or 'skipped'
+    seconds: float = 0.0
+    peak_mb: Optional[float] = None  # Traced peak above the stage's starting allocation (None for threaded I/O stages)
+    error: Optional[str] = None
+    executor: Optional[str] = None  # 'inline', 'thread' or 'process'
+
+
+class Pipeline:
+    def __init__(self, stages: Iterable[Stage], store: Optional[ArtifactStore] = None):
+        self.store = store
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        for stage in self.stages.values():
+            missing = [d for d in stage.upstream if d not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+
+    def _is_cached(self, name: str) -> bool:
+        stage = self.stages[name]
+        return bool(self.store and stage.fingerprint and self.store.has(name, stage.fingerprint))
+
+    def _closure(self, targets: Iterable[str], upstream: Dict[str, Tuple[str, ...]]) -> List[str]:
+        """Targets plus everything they depend on, in topological (declaration-stable) order."""
+        needed: Set[str] = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            needed.add(name)
+            stack.extend(upstream[name])
+
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in upstream[name]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            if name in needed:
+                visit(name)
+        return order
+
+    def run(self, targets: Iterable[str], io_workers: int = 1, cpu_workers: int = 1, track_memory: bool = False) -> Dict[str, StageResult]:
+        """
+        Runs the targets and their dependencies.
+
+        Args:
+            targets: Stage names to produce
+            io_workers: Threads for `io=True` stages
+            cpu_workers: Processes for `cpu=True` stages (1 runs them on the calling thread)
+            track_memory: Record per-stage traced peak memory (tracemalloc; approximate
+                when I/O threads run concurrently)
+
+        Returns:
+            Dict of stage name -> StageResult, in execution order
+        """
+        run_start = time.perf_counter()
+
+        # Stages with a stored artifact become leaves: their inputs aren't needed
+        cached = {name for name in self.stages if self._is_cached(name)}
+        deps = {name: () if name in cached else stage.deps for name, stage in self.stages.items()}
+        upstream = {name: () if name in cached else stage.upstream for name, stage in self.stages.items()}
+
+        order = self._closure(targets, upstream)
+        waiting = {name: set(upstream[name]) for name in order}
+        consumers = {name: 0 for name in order}
+        for name in order:
+            for dep in deps[name]:
+                consumers[dep] += 1
+
+        outputs: Dict[str, Any] = {}
+        results: Dict[str, StageResult] = {}
+        ready = [name for name in order if not waiting[name]]
+
+        use_processes = cpu_workers > 1 and any(self.stages[n].cpu and n not in cached for n in order)
+
+        def placement(name: str) -> str:
+            if name in cached:
+                return "inline"
+            if self.stages[name].io:
+                return "thread"
+            if self.stages[name].cpu and use_processes:
+                return "process"
+            return "inline"
+
+        started_tracing = track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        def store_output(name: str, output) -> None:
+            outputs[name] = output
+            stage = self.stages[name]
+            if self.store and stage.fingerprint:
+                self.store.save(name, stage.fingerprint, output)
+
+        def execute(name: str, traced: bool, executor: str) -> StageResult:
+            stage = self.stages[name]
+            args = [outputs[dep] for dep in deps[name]]
+            if traced:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                if name in cached:
+                    outputs[name] = self.store.load(name, stage.fingerprint)
+                    status, error = "cached", None
+                else:
+                    store_output(name, stage.func(*args))
+                    status, error = "success", None
+            except Exception as e:
+                logger.error(f"Stage '{name}' failed: {e}", exc_info=True)
+                status, error = "failed", str(e)
+            seconds = time.perf_counter() - start
+            peak = (tracemalloc.get_traced_memory()[1] - baseline) / 1e6 if traced else None
+            return StageResult(name, status, seconds, peak, error, executor)
+
+        def collect_process(name: str, future) -> StageResult:
+            try:
+                output, seconds = future.result()
+                store_output(name, output)
+                return StageResult(name, "success", seconds, executor="process")
+            except Exception as e:
+                logger.error(f"Stage '{name}' failed: {e}", exc_info=True)
+                return StageResult(name, "failed", error=str(e), executor="process")
+
+        def finish(result: StageResult):
+            results[result.name] = result
+            logger.info(f"Stage '{result.name}' {result.status} in {result.seconds:.2f}s")
+            for dep in deps[result.name]:
+                consumers[dep] -= 1
+                if consumers[dep] == 0:
+                    outputs.pop(dep, None)  # No downstream stage needs it anymore
+            if result.status in ("success", "cached"):
+                for name in order:
+                    if result.name in waiting[name] and name not in results:
+                        waiting[name].discard(result.name)
+                        if not waiting[name]:
+                            ready.append(name)
+            else:
+                skip_dependents(result.name)
+
+        def skip_dependents(failed: str):
+            for name in order:
+                if failed in upstream[name] and name not in results:
+                    results[name] = StageResult(name, "skipped", error=f"'{failed}' did not succeed")
+                    logger.warning(f"Skipping stage '{name}': '{failed}' did not succeed")
+                    skip_dependents(name)
+
+        cpu_pool = None
+        if use_processes:
+            # Spawned workers start clean instead of forking a process that holds DB connections and threads
+            cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, io_workers), thread_name_prefix="etl-io") as io_pool:
+                running = {}
+
+                def harvest(timeout=None):
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        finish(collect_process(name, future) if placement(name) == "process" else future.result())
+
+                while ready or running:
+                    # Loads go to threads and CPU-heavy branches to processes; the rest runs here
+                    for name in [n for n in ready if placement(n) != "inline"]:
+                        ready.remove(name)
+                        if placement(name) == "thread":
+                            running[io_pool.submit(execute, name, False, "thread")] = name
+                        else:
+                            args = [outputs[dep] for dep in deps[name]]
+                            running[cpu_pool.submit(_timed_call, self.stages[name].func, args)] = name
+                    if ready:
+                        finish(execute(ready.pop(0), track_memory, "inline"))
+                        if running:
+                            harvest(timeout=0)
+                    elif running:
+                        harvest()
+        finally:
+            if cpu_pool is not None:
+                cpu_pool.shutdown()
+            if started_tracing:
+                tracemalloc.stop()
+
+        self.log_summary(results)
+        self.log_critical_path(results, upstream, time.perf_counter() - run_start)
+        return results
+
+    @staticmethod
+    def log_summary(results: Dict[str, StageResult]) -> None:
+        """Logs a per-stage timing and peak memory table."""
+        width = max([len(name) for name in results] + [5])
+        lines = [f"{'Stage':<{width}}  {'Status':<8}  {'Ran on':<8}  {'Seconds':>8}  {'Peak MB':>8}"]
+        for r in results.values():
+            peak = f"{r.peak_mb:8.1f}" if r.peak_mb is not None else f"{'-':>8}"
+            lines.append(f"{r.name:<{width}}  {r.status:<8}  {r.executor or '-':<8}  {r.seconds:8.2f}  {peak}")
+        logger.info("Pipeline summary:\n" + "\n".join(lines))
+
+    @staticmethod
+    def critical_path(results: Dict[str, StageResult], upstream: Dict[str, Tuple[str, ...]]) -> Tuple[List[str], float]:
+        """Longest chain of dependent stages by duration: the floor on wall-clock time at any concurrency."""
+        finish_at: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for name in results:  # Execution order is a topological order
+            preds = [p for p in upstream.get(name, ()) if p in finish_at]
+            best = max(preds, key=lambda p: finish_at[p], default=None)
+            finish_at[name] = (finish_at[best] if best else 0.0) + results[name].seconds
+            via[name] = best
+
+        if not finish_at:
+            return [], 0.0
+        node = max(finish_at, key=finish_at.get)
+        total = finish_at[node]
+        path = []
+        while node is not None:
+            path.append(node)
+            node = via[node]
+        return path[::-1], total
+
+    def log_critical_path(self, results: Dict[str, StageResult], upstream: Dict[str, Tuple[str, ...]], wall_seconds: float) -> None:
+        path, path_seconds = self.critical_path(results, upstream)
+        serial_seconds = sum(r.seconds for r in results.values())
+        saved = serial_seconds - wall_seconds
+        logger.info(
+            f"Critical path ({path_seconds:.2f}s): {' -> '.join(path)}\n"
+            f"Serial stage time {serial_seconds:.2f}s, wall clock {wall_seconds:.2f}s: "
+            f"concurrency {'saved' if saved >= 0 else 'cost'} {abs(saved):.2f}s."
+        )
+
+
+def _timed_call(func: Callable[..., Any], args: List[Any]) -> Tuple[Any, float]:
+    """Runs a stage in a worker process and returns (output, seconds)."""
+    start = time.perf_counter()
+    output = func(*args)
+    return output, time.perf_counter() - start
@@ -0,0 +1,217 @@
+"""
+Per-stage profiling for `run_etl.py --profile`.
+
+Every stage is wrapped so that, while it runs, cProfile records function timings and a
+background thread samples the stage's call stack, process RSS and traced memory at a
+fixed interval. Each run writes to `data/profiles/<timestamp>/`:
+
+- `<stage>.txt`: the top functions by cumulative time (pstats)
+- `<stage>.prof`: the raw cProfile dump (snakeviz, pstats)
+- `<stage>.collapsed`: sampled stacks in collapsed format (flamegraph.pl, speedscope)
+- `<stage>.memory.csv`: the memory timeline (seconds, rss_mb, traced_mb)
+- `summary.json`: per-stage totals with stable keys, meant to be diffed between runs
+
+The wrapper is a module-level function bound with functools.partial, so stages that run
+in the CPU process pool are profiled inside their worker process.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(Path(os.getenv("DATA_DIR", "data")) / "profiles")))
+# Seconds between stack/memory samples
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("ETL_PROFILE_INTERVAL", "0.01"))
+# Functions listed per stage in the text report and summary
+PROFILE_TOP_N = 25
+
+
+def _rss_mb() -> Optional[float]:
+    """Current resident set size of this process (Linux /proc; None elsewhere)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's stack and the process memory until stopped."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="etl-profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.timeline = []
+        self._stop_event = threading.Event()
+        self._t0 = time.perf_counter()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            # Frames above the wrapper belong to the pipeline runner, not the stage
+            if frame.f_code is profiled_call.__code__:
+                break
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if stack:
+            self.stacks[";".join(reversed(stack))] += 1
+        self.sample_memory()
+
+    def sample_memory(self):
+        traced = tracemalloc.get_traced_memory()[0] / 1e6 if tracemalloc.is_tracing() else None
+        self.timeline.append((time.perf_counter() - self._t0, _rss_mb(), traced))
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        # Final memory reading; the stack would only show the profiler itself
+        self.sample_memory()
+
+
+def _top_functions(profile: pstats.Stats, limit: int) -> list:
+    rows = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in profile.stats.items():
+        rows.append({
+            "function": f"{name} ({os.path.basename(filename)}:{line})",
+            "ncalls": ncalls,
+            "tottime": round(tottime, 4),
+            "cumtime": round(cumtime, 4),
+        })
+    rows.sort(key=lambda r: r["cumtime"], reverse=True)
+    return rows[:limit]
+
+
+def _write_stage_report(run_dir: Path, stage: str, profiler: Optional[cProfile.Profile], sampler: _Sampler,
+                        seconds: float, error: Optional[str]) -> None:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    report = {
+        "stage": stage,
+        "seconds": round(seconds, 4),
+        "error": error,
+        "pid": os.getpid(),
+        "samples": sum(sampler.stacks.values()),
+        "peak_rss_mb": None,
+        "peak_traced_mb": None,
+        "top_functions": [],
+    }
+
+    rss = [r for _, r, _ in sampler.timeline if r is not None]
+    traced = [t for _, _, t in sampler.timeline if t is not None]
+    if rss:
+        report["peak_rss_mb"] = round(max(rss), 1)
+    if traced:
+        report["peak_traced_mb"] = round(max(traced), 1)
+
+    if profiler is not None:
+        profiler.dump_stats(run_dir / f"{stage}.prof")
+        with open(run_dir / f"{stage}.txt", "w") as f:
+            stats = pstats.Stats(profiler, stream=f)
+            stats.strip_dirs().sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        report["top_functions"] = _top_functions(pstats.Stats(profiler), PROFILE_TOP_N)
+
+    with open(run_dir / f"{stage}.collapsed", "w") as f:
+        for stack, count in sorted(sampler.stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+    with open(run_dir / f"{stage}.memory.csv", "w") as f:
+        f.write("seconds,rss_mb,traced_mb\n")
+        for t, r, m in sampler.timeline:
+            f.write(f"{t:.3f},{'' if r is None else f'{r:.1f}'},{'' if m is None else f'{m:.1f}'}\n")
+
+    with open(run_dir / f"{stage}.json", "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def profiled_call(func, stage: str, run_dir: str, *args):
+    """Runs `func(*args)` under cProfile and the stack/memory sampler, then writes the stage report."""
+    sampler = _Sampler(threading.get_ident(), PROFILE_SAMPLE_INTERVAL)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Only one deterministic profiler may be active at a time on some interpreters
+        logger.warning(f"cProfile unavailable for stage '{stage}'; recording samples only.")
+        profiler = None
+
+    sampler.start()
+    start = time.perf_counter()
+    error = None
+    try:
+        return func(*args)
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+        sampler.stop()
+        try:
+            _write_stage_report(Path(run_dir), stage, profiler, sampler, seconds, error)
+        except OSError as e:
+            logger.warning(f"Could not write profile for stage '{stage}': {e}")
+
+
+def profile_pipeline(pipeline, root: Optional[Path] = None) -> Path:
+    """Wraps every stage of `pipeline` with profiled_call and returns this run's profile directory."""
+    run_dir = Path(root if root is not None else PROFILE_DIR) / datetime.now().strftime("%Y%m%d-%H%M%S")
+    run_dir.mkdir(parents=True, exist_ok=True)
+    for stage in pipeline.stages.values():
+        stage.func = partial(profiled_call, stage.func, stage.name, str(run_dir))
+    logger.info(f"Profiling enabled; reports will be written to {run_dir}")
+    return run_dir
+
+
+def write_summary(run_dir: Path, results: Dict) -> Path:
+    """Combines the per-stage reports with the pipeline results into summary.json."""
+    stages = {}
+    for name, result in results.items():
+        entry = {"status": result.status, "executor": result.executor, "seconds": round(result.seconds, 4)}
+        report_path = run_dir / f"{name}.json"
+        if report_path.exists():
+            with open(report_path, "r") as f:
+                report = json.load(f)
+            entry.update({
+                "samples": report["samples"],
+                "peak_rss_mb": report["peak_rss_mb"],
+                "peak_traced_mb": report["peak_traced_mb"],
+                "top_functions": report["top_functions"][:10],
+            })
+        stages[name] = entry
+
+    summary = {
+        "run": run_dir.name,
+        "total_stage_seconds": round(sum(r.seconds for r in results.values()), 4),
+        "stages": stages,
+    }
+    path = run_dir / "summary.json"
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2, sort_keys=True)
+    logger.info(f"Profile summary written to {path}")
+    return path
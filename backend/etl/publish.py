@@ -0,0 +1,20 @@
+"""
+Publishing a load: bumps the dataset version that the API caches are keyed on, then
+precomputes what the API serves for that version (NYT statistics, dashboard snapshots).
+Every script that commits a load calls publish_new_version() afterwards.
+"""
+
+from typing import Optional
+
+from backend.db.dataset_version import bump_data_version
+from backend.api.snapshots import render_snapshots
+from backend.services.nyt_service import persist_nyt_analysis
+
+
+def publish_new_version() -> Optional[int]:
+    """Bumps the dataset version, then precomputes the NYT statistics and dashboard snapshots for it."""
+    version = bump_data_version()
+    if version is not None:
+        persist_nyt_analysis(version)
+        render_snapshots(version)
+    return version
@@ -9,8 +9,6 @@ from nltk.sentiment import SentimentIntensityAnalyzer
 import logging
 from typing import Optional
 from collections import defaultdict
-import multiprocessing
-from functools import partial
 import ast
 from typing import Set
 
@@ -105,6 +103,9 @@ PROTECTED_KEYWORDS = {"phew", "lucky", "easy", "hard", "tough", "failed", "great
 sia = SentimentIntensityAnalyzer()
 sia.lexicon.update(WORDLE_LEXICON_EXT)
 
+# Column-wise date helpers are shared with the modular transformers
+from .transformers.shared import derive_dates_from_ids, dates_from_solutions
+
 def derive_date_from_id(wordle_id: int) -> str:
     """
     Derive the ISO date string from the Wordle Game ID.
@@ -272,8 +273,8 @@ def transform_games_from_tweets(tweets_df: pd.DataFrame, solutions_map: dict) ->
     # Convert solutions_map keys from str to int if needed
     solutions_lookup = {int(k): v for k, v in solutions_map.items()}
     
-    result['target'] = result['Game'].map(lambda x: solutions_lookup.get(x, {}).get('word', 'UNKNOWN'))
-    result['date'] = result['Game'].map(lambda x: solutions_lookup.get(x, {}).get('date', derive_date_from_id(x)))
+    result['target'] = result['Game'].map({game: entry.get('word', 'UNKNOWN') for game, entry in solutions_lookup.items()}).fillna('UNKNOWN')
+    result['date'] = dates_from_solutions(result['Game'], solutions_lookup)
     
     # Calculate statistics
     result['total_tweets'] = result[['guess_1', 'guess_2', 'guess_3', 'guess_4', 'guess_5', 'guess_6', 'failed']].sum(axis=1)
@@ -337,7 +338,7 @@ def transform_games_data(df: pd.DataFrame) -> pd.DataFrame:
     targets = df.groupby('Game')['target'].first()
     result = counts.join(targets).reset_index()
     
-    result['date'] = result['Game'].apply(derive_date_from_id)
+    result['date'] = derive_dates_from_ids(result['Game'])
     result['total_tweets'] = result[['guess_1', 'guess_2', 'guess_3', 'guess_4', 'guess_5', 'guess_6', 'failed']].sum(axis=1)
     
     weighted_sum = sum(result[f'guess_{i}'] * i for i in range(1, 7))
@@ -384,72 +385,103 @@ def transform_games_data(df: pd.DataFrame) -> pd.DataFrame:
     logger.info(f"Transformed {len(result)} games/days.")
     return result
 
-def transform_tweets_data(df: pd.DataFrame) -> pd.DataFrame:
+# Tweets per checkpointed sentiment chunk
+TWEET_CHUNK_ROWS = int(os.getenv("ETL_TWEET_CHUNK_ROWS", "250000"))
+
+# Per-day additive sums; daily means are derived from them once all chunks are merged
+SENTIMENT_BUCKETS = ['is_very_pos', 'is_pos', 'is_neu', 'is_neg', 'is_very_neg']
+
+def score_tweet(text: str) -> float:
     """
-    Transforms tweets:
-    1. Group by wordle_id
-    2. Calculate sentiment for each tweet (parallelized)
-    3. Aggregate daily stats (avg sentiment, frustration index)
+    Cleans and scores one tweet in a single worker round trip.
+    Returns NaN for functional tweets (nothing left after cleaning).
     """
-    logger.info("Transforming tweets data with multiprocessing...")
-    
-    # Get number of CPUs to use (leave one for the system)
-    num_processes = max(1, multiprocessing.cpu_count() - 1)
-    logger.info(f"Using {num_processes} processes for parallel sentiment analysis.")
-    
-    # Extract text column as a list for multiprocessing
-    texts = df['tweet_text'].fillna("").tolist()
-    
-    # Define cleaned text and filter out empty ones
-    logger.info("Cleaning tweets and filtering functional posts...")
-    with multiprocessing.Pool(processes=num_processes) as pool:
-        df['cleaned_text'] = pool.map(clean_tweet_text, texts)
-    
-    # Remove empty/null after cleaning
-    initial_count = len(df)
-    df = df[df['cleaned_text'].str.strip() != ""].copy()
-    filtered_count = len(df)
-    logger.info(f"Filtered {initial_count - filtered_count} functional tweets. Remaining: {filtered_count}")
-    
-    # Calculate sentiment for the remaining expressive tweets
-    logger.info("Calculating sentiment for expressive tweets...")
-    cleaned_texts = df['cleaned_text'].tolist()
-    # Use a top-level function for multiprocessing map to avoid lambda/pickling issues
-    with multiprocessing.Pool(processes=num_processes) as pool:
-        df['sentiment'] = pool.map(get_sentiment_score, cleaned_texts)
+    cleaned = clean_tweet_text(text)
+    if cleaned.strip() == "":
+        return float('nan')
+    return get_sentiment_score(cleaned)
+
+def _sentiment_partial(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cleans and scores one chunk of tweets and returns per-wordle_id sums that can be
+    added across chunks: sentiment_sum, frustrated, scored, tweet_count and bucket counts.
+    """
+    from backend.etl.workers import shared_text_map
+
+    texts = chunk['tweet_text'].fillna("").tolist()
+    chunk = chunk.assign(sentiment=shared_text_map(score_tweet, texts))
+
+    # Remove functional tweets (empty after cleaning)
+    initial_count = len(chunk)
+    chunk = chunk[chunk['sentiment'].notna()].copy()
+    logger.info(f"Filtered {initial_count - len(chunk)} functional tweets. Remaining: {len(chunk)}")
 
     # Define Frustration and Sentiment Buckets (5-bucket)
-    df['is_frustrated'] = df['sentiment'] < FRUSTRATION_THRESHOLD
-    df['is_very_neg'] = df['sentiment'] < -0.5
-    df['is_neg'] = (df['sentiment'] >= -0.5) & (df['sentiment'] < -0.1)
-    df['is_neu'] = (df['sentiment'] >= -0.1) & (df['sentiment'] <= 0.1)
-    df['is_pos'] = (df['sentiment'] > 0.1) & (df['sentiment'] <= 0.5)
-    df['is_very_pos'] = df['sentiment'] > 0.5
-    
-    # Aggregate
-    agg = df.groupby('wordle_id').agg({
-        'sentiment': 'mean',
-        'is_frustrated': 'mean', # Proportion of frustrated tweets
-        'tweet_id': 'count',
-        'is_very_pos': 'sum',
-        'is_pos': 'sum',
-        'is_neu': 'sum',
-        'is_neg': 'sum',
-        'is_very_neg': 'sum'
-    }).rename(columns={
-        'sentiment': 'avg_sentiment',
-        'is_frustrated': 'frustration_index',
-        'tweet_id': 'sample_size',
-        'is_very_pos': 'very_pos_count',
-        'is_pos': 'pos_count',
-        'is_neu': 'neu_count',
-        'is_neg': 'neg_count',
-        'is_very_neg': 'very_neg_count'
+    chunk['is_frustrated'] = chunk['sentiment'] < FRUSTRATION_THRESHOLD
+    chunk['is_very_neg'] = chunk['sentiment'] < -0.5
+    chunk['is_neg'] = (chunk['sentiment'] >= -0.5) & (chunk['sentiment'] < -0.1)
+    chunk['is_neu'] = (chunk['sentiment'] >= -0.1) & (chunk['sentiment'] <= 0.1)
+    chunk['is_pos'] = (chunk['sentiment'] > 0.1) & (chunk['sentiment'] <= 0.5)
+    chunk['is_very_pos'] = chunk['sentiment'] > 0.5
+
+    return chunk.groupby('wordle_id').agg(
+        sentiment_sum=('sentiment', 'sum'),
+        scored=('sentiment', 'count'),
+        frustrated=('is_frustrated', 'sum'),
+        tweet_count=('tweet_id', 'count'),
+        **{bucket: (bucket, 'sum') for bucket in SENTIMENT_BUCKETS}
+    )
+
+def _finalize_sentiment(partials: list) -> pd.DataFrame:
+    """Merges per-chunk sums into the daily sentiment table."""
+    partials = [p for p in partials if not p.empty]
+    if not partials:
+        return pd.DataFrame(columns=['wordle_id', 'avg_sentiment', 'frustration_index', 'sample_size',
+                                     'very_pos_count', 'pos_count', 'neu_count', 'neg_count', 'very_neg_count', 'date'])
+    sums = pd.concat(partials).groupby(level=0).sum()
+    sums.index.name = 'wordle_id'
+
+    agg = pd.DataFrame({
+        'avg_sentiment': sums['sentiment_sum'] / sums['scored'],
+        'frustration_index': sums['frustrated'] / sums['scored'],  # Proportion of frustrated tweets
+        'sample_size': sums['tweet_count'].astype(int),
+        'very_pos_count': sums['is_very_pos'].astype(int),
+        'pos_count': sums['is_pos'].astype(int),
+        'neu_count': sums['is_neu'].astype(int),
+        'neg_count': sums['is_neg'].astype(int),
+        'very_neg_count': sums['is_very_neg'].astype(int),
     })
-    
+
     # Add date
     agg = agg.reset_index()
-    agg['date'] = agg['wordle_id'].apply(derive_date_from_id)
+    agg['date'] = derive_dates_from_ids(agg['wordle_id'])
+    return agg
+
+def transform_tweets_data(df: pd.DataFrame, checkpoint=None, chunk_size: Optional[int] = None) -> pd.DataFrame:
+    """
+    Transforms tweets:
+    1. Split into chunks of `chunk_size` tweets (default TWEET_CHUNK_ROWS)
+    2. Calculate sentiment for each tweet (parallelized) and sum it per wordle_id
+    3. Merge the chunk sums into daily stats (avg sentiment, frustration index)
+
+    With a ChunkCheckpoint, each chunk's sums are saved as soon as they are computed,
+    and a resumed run reuses the chunks that already finished.
+    """
+    logger.info("Transforming tweets data on the shared worker pool...")
+    chunk_size = chunk_size or TWEET_CHUNK_ROWS
+
+    # Imported lazily: the checkpoint module pulls in the database layer
+    from backend.etl.checkpoint import run_chunks
+
+    def score_chunk(start, end):
+        logger.info(f"Scoring tweets {start}-{end} of {len(df)}...")
+        return _sentiment_partial(df.iloc[start:end])
+
+    partials = run_chunks(len(df), chunk_size, score_chunk, checkpoint)
+
+    agg = _finalize_sentiment(partials)
+    if checkpoint is not None:
+        checkpoint.clear()
     
     logger.info(f"Transformed tweets for {len(agg)} days.")
     return agg
@@ -8,7 +8,8 @@ words and distributions tables.
 import pandas as pd
 import logging
 from .shared import (
-    derive_date_from_id,
+    derive_dates_from_ids,
+    dates_from_solutions,
     extract_score_from_tweet,
     calculate_frequency_score
 )
@@ -57,8 +58,8 @@ def transform_games_from_tweets(tweets_df: pd.DataFrame, solutions_map: dict) ->
     # Add target words and dates from solutions map
     solutions_lookup = {int(k): v for k, v in solutions_map.items()}
 
-    result['target'] = result['Game'].map(lambda x: solutions_lookup.get(x, {}).get('word', 'UNKNOWN'))
-    result['date'] = result['Game'].map(lambda x: solutions_lookup.get(x, {}).get('date', derive_date_from_id(x)))
+    result['target'] = result['Game'].map({game: entry.get('word', 'UNKNOWN') for game, entry in solutions_lookup.items()}).fillna('UNKNOWN')
+    result['date'] = dates_from_solutions(result['Game'], solutions_lookup)
 
     # Calculate statistics
     result['total_tweets'] = result[['guess_1', 'guess_2', 'guess_3', 'guess_4', 'guess_5', 'guess_6', 'failed']].sum(axis=1)
@@ -119,7 +120,7 @@ def transform_games_data(df: pd.DataFrame) -> pd.DataFrame:
     targets = df.groupby('Game')['target'].first()
     result = counts.join(targets).reset_index()
 
-    result['date'] = result['Game'].apply(derive_date_from_id)
+    result['date'] = derive_dates_from_ids(result['Game'])
     result['total_tweets'] = result[['guess_1', 'guess_2', 'guess_3', 'guess_4', 'guess_5', 'guess_6', 'failed']].sum(axis=1)
 
     weighted_sum = sum(result[f'guess_{i}'] * i for i in range(1, 7))
@@ -4,20 +4,67 @@ Pattern data transformation module.
 Extracts pattern statistics and transitions from games data.
 """
 
+import os
 import pandas as pd
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Games per aggregation chunk (bounds the size of each explode)
+PATTERN_CHUNK_ROWS = int(os.getenv("ETL_PATTERN_CHUNK_ROWS", "500000"))
 
-def transform_pattern_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+
+def _get_transitions(p_list):
+    if len(p_list) < 2:
+        return []
+    return list(zip(p_list[:-1], p_list[1:]))
+
+
+def _pattern_partial(chunk: pd.DataFrame) -> dict:
+    """
+    Additive pattern aggregates for one chunk of games: total and success counts,
+    summed guesses of successful games, and transition counts.
+    """
+    # Total Counts
+    # explode on 500k games is fine (~3M rows); the full 6.8M at once was the OOM problem
+    exploded = chunk.explode('patterns')
+    total_counts = exploded['patterns'].value_counts()
+
+    # Success Stats: associate each pattern with its game's guess count
+    success_chunk = chunk[chunk['is_success']]
+    exp_success = success_chunk[['patterns', 'guesses']].explode('patterns')
+    success_counts = exp_success['patterns'].value_counts()
+    sum_guesses = exp_success.groupby('patterns')['guesses'].sum()
+
+    # Transitions
+    trans_counts = chunk['patterns'].apply(_get_transitions).explode().value_counts()
+
+    return {
+        'count': total_counts,
+        'success_count': success_counts,
+        'sum_guesses': sum_guesses,
+        'transitions': trans_counts,
+    }
+
+
+def _merge_partials(partials: list, key: str) -> pd.Series:
+    merged = pd.Series(dtype=float)
+    for partial in partials:
+        merged = merged.add(partial[key], fill_value=0)
+    return merged
+
+
+def transform_pattern_data(df: pd.DataFrame, checkpoint=None, chunk_size: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Transforms games data to extract pattern statistics and transitions.
+    Games are aggregated in chunks of `chunk_size` (default PATTERN_CHUNK_ROWS); with a
+    ChunkCheckpoint each chunk's counts are saved and a resumed run skips finished chunks.
     Returns a tuple: (pattern_stats_df, transitions_df)
     """
     logger.info("Transforming pattern data (Vectorized)...")
+    chunk_size = chunk_size or PATTERN_CHUNK_ROWS
 
     # 1. Deduplicate (though it seems distinct already, harmless)
     df = df.sort_values('Trial').drop_duplicates(['Game', 'Username'], keep='last')
@@ -38,95 +85,19 @@ def transform_pattern_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame
 
     logger.info("Aggregating Statistics (Chunked to save memory)...")
 
-    # 2. Pattern Counts (Total) & 3. Success Counts
-    # We will process in chunks to avoid OOM on huge explode
-    total_counts = pd.Series(dtype=int)
-    success_counts = pd.Series(dtype=int)
-
-    # Process in chunks of 500k rows
-    chunk_size = 500000
-    num_chunks = (len(df) // chunk_size) + 1
+    # Imported lazily: the checkpoint module pulls in the database layer
+    from backend.etl.checkpoint import run_chunks
 
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = start_idx + chunk_size
-        chunk = df.iloc[start_idx:end_idx].copy()
+    partials = run_chunks(len(df), chunk_size, lambda start, end: _pattern_partial(df.iloc[start:end]), checkpoint)
 
-        if chunk.empty: continue
-
-        # Explode this chunk only
-        exploded_chunk = chunk.explode('patterns')
-
-        # Counts for this chunk
-        chunk_counts = exploded_chunk['patterns'].value_counts()
-        total_counts = total_counts.add(chunk_counts, fill_value=0)
-
-        # Success counts for this chunk
-        # Filter for success rows in this chunk
-        success_chunk = chunk[chunk['is_success']]
-        if not success_chunk.empty:
-            exploded_success = success_chunk.explode('patterns')
-            chunk_success_counts = exploded_success['patterns'].value_counts()
-            success_counts = success_counts.add(chunk_success_counts, fill_value=0)
-
-        # Clean up
-        del exploded_chunk
-        del chunk
-
-    total_counts.name = 'count'
-    success_counts.name = 'success_count'
+    # 2. Pattern Counts (Total) & 3. Success Counts
+    total_counts = _merge_partials(partials, 'count')
+    success_counts = _merge_partials(partials, 'success_count')
 
     # 4. Avg Guesses (Only for successful games)
-    # This one doesn't need explode on patterns, but grouping by pattern.
-    # We can iterate or use the counts.
-    # Actually we stored 'guesses' per game.
-    # If pattern P appears in game G, we added G's guesses to P's list.
-    # To do this without massive explode:
-    # We need sum_guesses and count per pattern.
-    # We can re-use the chunk loop or do a separate pass.
-    # Let's add it to the chunk loop above?
-    # Wait, 'exploded_success' matches patterns to the game's guess count.
-    # exploded_success['guesses'] would have the value.
-
-    # Re-writing the chunk loop to gather sum_guesses too.
-    sum_guesses = pd.Series(dtype=float)
-
-    # Reset accumulators
-    total_counts = pd.Series(dtype=int)
-    success_counts = pd.Series(dtype=int)
-
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = start_idx + chunk_size
-        chunk = df.iloc[start_idx:end_idx] # View might be enough, but copy safe
-
-        # Total Counts
-        # Using simple iteration for list expansion might be slow but memory safe?
-        # No, explode on 500k is fine (3M rows). 40M was the problem.
-        exploded = chunk.explode('patterns')
-        chunk_vc = exploded['patterns'].value_counts()
-        total_counts = total_counts.add(chunk_vc, fill_value=0)
-
-        # Success Stats
-        success_chunk = chunk[chunk['is_success']]
-        if not success_chunk.empty:
-            # We need to associate the 'guesses' count with each pattern
-            # exploded_success has index from original df, so we can join?
-            # Or just explode specific columns
-            exp_success = success_chunk[['patterns', 'guesses']].explode('patterns')
-
-            # Count successes
-            chunk_succ_vc = exp_success['patterns'].value_counts()
-            success_counts = success_counts.add(chunk_succ_vc, fill_value=0)
-
-            # Sum guesses
-            chunk_sum_guesses = exp_success.groupby('patterns')['guesses'].sum()
-            sum_guesses = sum_guesses.add(chunk_sum_guesses, fill_value=0)
-
-    # Calculate avg
+    sum_guesses = _merge_partials(partials, 'sum_guesses')
     avg_guesses = (sum_guesses / success_counts).rename('avg_guesses')
 
-
     # Create DataFrame explicitly to ensure column names
     stats_df = pd.DataFrame({
         'count': total_counts,
@@ -142,35 +113,9 @@ def transform_pattern_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame
     else:
         stats_df['rank'] = pd.Series(dtype=int)
 
-    logger.info("Calculating Transitions (Chunked)...")
-
     # 5. Transitions
-    # Define helper to pair up patterns
-    def get_transitions(p_list):
-        if len(p_list) < 2:
-            return []
-        return list(zip(p_list[:-1], p_list[1:]))
-
-    # Apply on chunks?
-    # df['patterns'] size is 6.8M. The result column is 6.8M lists of tuples.
-    # Then explode -> 40M tuples.
-    # Just chunk the explode + value_counts part.
-
-    trans_counts = pd.Series(dtype=int)
-
-    for i in range(num_chunks):
-        start_idx = i * chunk_size
-        end_idx = start_idx + chunk_size
-        chunk_patterns = df['patterns'].iloc[start_idx:end_idx]
-
-        # Get transitions
-        chunk_trans = chunk_patterns.apply(get_transitions)
-
-        # Explode and count
-        exploded_trans = chunk_trans.explode()
-        chunk_trans_counts = exploded_trans.value_counts()
-
-        trans_counts = trans_counts.add(chunk_trans_counts, fill_value=0)
+    logger.info("Calculating Transitions...")
+    trans_counts = _merge_partials(partials, 'transitions')
 
     trans_data = []
     for (src, next_p), count in trans_counts.items():
@@ -183,5 +128,8 @@ def transform_pattern_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame
 
     trans_df = pd.DataFrame(trans_data)
 
+    if checkpoint is not None:
+        checkpoint.clear()
+
     logger.info(f"Generated {len(stats_df)} pattern stats and {len(trans_df)} transitions.")
     return stats_df, trans_df
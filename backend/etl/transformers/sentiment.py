@@ -6,11 +6,11 @@ Handles sentiment calculation and aggregation for tweet data.
 
 import pandas as pd
 import logging
-import multiprocessing
+from backend.etl.workers import parallel_map
 from .shared import (
     clean_tweet_text,
     get_sentiment_score,
-    derive_date_from_id,
+    derive_dates_from_ids,
     FRUSTRATION_THRESHOLD
 )
 
@@ -32,19 +32,14 @@ def transform_tweets_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Aggregated sentiment DataFrame
     """
-    logger.info("Transforming tweets data with multiprocessing...")
+    logger.info("Transforming tweets data on the shared worker pool...")
 
-    # Get number of CPUs to use (leave one for the system)
-    num_processes = max(1, multiprocessing.cpu_count() - 1)
-    logger.info(f"Using {num_processes} processes for parallel sentiment analysis.")
-
-    # Extract text column as a list for multiprocessing
+    # Extract text column as a list for the worker pool
     texts = df['tweet_text'].fillna("").tolist()
 
     # Clean tweets and filter out empty ones
     logger.info("Cleaning tweets and filtering functional posts...")
-    with multiprocessing.Pool(processes=num_processes) as pool:
-        df['cleaned_text'] = pool.map(clean_tweet_text, texts)
+    df['cleaned_text'] = parallel_map(clean_tweet_text, texts)
 
     # Remove empty/null after cleaning
     initial_count = len(df)
@@ -55,8 +50,7 @@ def transform_tweets_data(df: pd.DataFrame) -> pd.DataFrame:
     # Calculate sentiment for the remaining expressive tweets
     logger.info("Calculating sentiment for expressive tweets...")
     cleaned_texts = df['cleaned_text'].tolist()
-    with multiprocessing.Pool(processes=num_processes) as pool:
-        df['sentiment'] = pool.map(get_sentiment_score, cleaned_texts)
+    df['sentiment'] = parallel_map(get_sentiment_score, cleaned_texts)
 
     # Define Frustration and Sentiment Buckets (5-bucket)
     df['is_frustrated'] = df['sentiment'] < FRUSTRATION_THRESHOLD
@@ -89,7 +83,7 @@ def transform_tweets_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Add date
     agg = agg.reset_index()
-    agg['date'] = agg['wordle_id'].apply(derive_date_from_id)
+    agg['date'] = derive_dates_from_ids(agg['wordle_id'])
 
     logger.info(f"Transformed tweets for {len(agg)} days.")
     return agg
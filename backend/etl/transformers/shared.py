@@ -6,6 +6,7 @@ import os
 import re
 import logging
 import nltk
+import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional
 from dotenv import load_dotenv
@@ -87,6 +88,33 @@ def derive_date_from_id(wordle_id: int) -> str:
     return (WORDLE_START_DATE + timedelta(days=wordle_id - 1)).strftime("%Y-%m-%d")
 
 
+def derive_dates_from_ids(ids) -> pd.Series:
+    """
+    Vectorized derive_date_from_id: maps a column of Wordle IDs to ISO date strings
+    with one timedelta addition, logging a single warning for all out-of-bounds IDs.
+    A Series keeps its index, so the result can be assigned straight back.
+    """
+    ids = pd.Series(ids).astype('int64')
+    out_of_bounds = ~ids.between(MIN_GAME_ID, MAX_GAME_ID)
+    if out_of_bounds.any():
+        logger.warning(
+            f"Deriving dates for {int(out_of_bounds.sum())} out-of-bounds Wordle IDs "
+            f"(expected {MIN_GAME_ID}-{MAX_GAME_ID}, got {ids[out_of_bounds].min()}-{ids[out_of_bounds].max()})"
+        )
+    dates = pd.Timestamp(WORDLE_START_DATE) + pd.to_timedelta(ids - 1, unit='D')
+    return dates.dt.strftime("%Y-%m-%d")
+
+
+def dates_from_solutions(game_ids: pd.Series, solutions_lookup: dict) -> pd.Series:
+    """Dates from the solutions map, derived from the ID where the map has no entry."""
+    dates = game_ids.map({game: entry.get('date') for game, entry in solutions_lookup.items()})
+    missing = dates.isna()
+    if missing.any():
+        dates = dates.astype(object)
+        dates[missing] = derive_dates_from_ids(game_ids[missing])
+    return dates
+
+
 def clean_tweet_text(text: str) -> str:
     """
     Removes Wordle grids (squares) and common urls to leave just the user commentary.
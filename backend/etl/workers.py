@@ -0,0 +1,163 @@
+"""
+Process-wide worker pool for the ETL's data-parallel steps.
+
+The pool is created on first use and reused by every stage in the run, so workers pay
+the module import (NLTK lookups, VADER lexicon, stopwords) once instead of once per
+`multiprocessing.Pool`. Work is sent in index-tagged batches through
+`imap_unordered`, so results arrive as soon as any worker is free and are put back in
+input order by the caller.
+
+For text columns, `shared_text_map` avoids pickling the strings altogether: the texts
+are packed once into a UTF-8 buffer plus an offsets array in shared memory, workers
+receive only (start, end) row ranges, and write float results into a shared array.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Worker processes (leave one core for the main process)
+ETL_WORKERS = int(os.getenv("ETL_WORKERS", str(max(1, multiprocessing.cpu_count() - 1))))
+# Items per batch sent to a worker; larger batches mean fewer round trips
+ETL_IMAP_CHUNKSIZE = int(os.getenv("ETL_IMAP_CHUNKSIZE", "2000"))
+# 'spawn' keeps workers independent of the parent's DB connections and threads
+ETL_START_METHOD = os.getenv("ETL_START_METHOD", "spawn")
+# Hand text columns to workers through shared memory instead of pickling them
+ETL_SHARED_TEXT = os.getenv("ETL_SHARED_TEXT", "true").lower() == "true"
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    """Builds the per-worker state once: stopwords, VADER and the Wordle lexicon."""
+    from backend.etl import transform  # noqa: F401  (module import constructs the analyzer)
+
+
+def _run_batch(task: tuple) -> tuple:
+    func, start, batch = task
+    return start, [func(item) for item in batch]
+
+
+def _run_text_range(task: tuple) -> int:
+    """Decodes rows [start, end) from the shared text buffer and writes func's results in place."""
+    func, names, n_rows, n_bytes, start, end = task
+    text_shm = shared_memory.SharedMemory(name=names[0])
+    offsets_shm = shared_memory.SharedMemory(name=names[1])
+    results_shm = shared_memory.SharedMemory(name=names[2])
+    try:
+        data = text_shm.buf
+        offsets = np.ndarray((n_rows + 1,), dtype=np.int64, buffer=offsets_shm.buf)
+        results = np.ndarray((n_rows,), dtype=np.float64, buffer=results_shm.buf)
+        for i in range(start, end):
+            results[i] = func(bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8", "surrogatepass"))
+        # Views must be released before the segments can be closed
+        del data, offsets, results
+    finally:
+        text_shm.close()
+        offsets_shm.close()
+        results_shm.close()
+    return end - start
+
+
+def get_pool(processes: Optional[int] = None):
+    """Returns the shared pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            processes = processes or ETL_WORKERS
+            logger.info(f"Starting ETL worker pool with {processes} process(es) ({ETL_START_METHOD}).")
+            context = multiprocessing.get_context(ETL_START_METHOD)
+            _pool = context.Pool(processes=processes, initializer=_init_worker)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stops the shared pool (called at the end of a run and at interpreter exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool.join()
+            _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def parallel_map(func: Callable, items: Sequence, chunksize: Optional[int] = None) -> List:
+    """
+    Applies a picklable module-level `func` to every item on the shared pool and
+    returns the results in input order. Small inputs (a single batch) run in-process.
+    """
+    chunksize = chunksize or ETL_IMAP_CHUNKSIZE
+    if len(items) <= chunksize or ETL_WORKERS <= 1:
+        return [func(item) for item in items]
+
+    results: List = [None] * len(items)
+    batches = ((func, start, items[start:start + chunksize]) for start in range(0, len(items), chunksize))
+    for start, batch_results in get_pool().imap_unordered(_run_batch, batches):
+        results[start:start + len(batch_results)] = batch_results
+    return results
+
+
+def shared_text_map(func: Callable[[str], float], texts: Sequence[str], chunksize: Optional[int] = None) -> np.ndarray:
+    """
+    Applies a picklable `func(str) -> float` to every text on the shared pool, passing
+    the texts through shared memory. Returns a float64 array in input order. Falls back
+    to parallel_map when the work would run in-process or shared memory is unavailable.
+    """
+    chunksize = chunksize or ETL_IMAP_CHUNKSIZE
+    n_rows = len(texts)
+    if not ETL_SHARED_TEXT or n_rows <= chunksize or ETL_WORKERS <= 1:
+        return np.asarray(parallel_map(func, texts, chunksize), dtype=np.float64)
+
+    # Non-string values (missing text) travel as empty strings
+    encoded = [text.encode("utf-8", "surrogatepass") if isinstance(text, str) else b"" for text in texts]
+    offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    n_bytes = int(offsets[-1])
+
+    segments = []
+    try:
+        # SharedMemory rejects size 0, so every segment gets at least one byte
+        for size in (max(n_bytes, 1), offsets.nbytes, n_rows * 8):
+            segments.append(shared_memory.SharedMemory(create=True, size=size))
+    except OSError as e:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+        logger.warning(f"Shared memory unavailable ({e}); sending texts by pickling.")
+        return np.asarray(parallel_map(func, texts, chunksize), dtype=np.float64)
+
+    text_shm, offsets_shm, results_shm = segments
+    try:
+        text_shm.buf[:n_bytes] = b"".join(encoded)
+        del encoded
+        np.ndarray(offsets.shape, dtype=np.int64, buffer=offsets_shm.buf)[:] = offsets
+
+        names = (text_shm.name, offsets_shm.name, results_shm.name)
+        tasks = (
+            (func, names, n_rows, n_bytes, start, min(start + chunksize, n_rows))
+            for start in range(0, n_rows, chunksize)
+        )
+        for _ in get_pool().imap_unordered(_run_text_range, tasks):
+            pass
+
+        shared_results = np.ndarray((n_rows,), dtype=np.float64, buffer=results_shm.buf)
+        results = shared_results.copy()
+        del shared_results
+        return results
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
@@ -1,18 +1,39 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, func, case, cast, Float
 from datetime import datetime, timedelta
 import pandas as pd
-from scipy import stats
 import numpy as np
+import json
+import logging
 import os
+import threading
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-from backend.db.schema import Word, Distribution, TweetSentiment
+from backend.db.schema import Word, Distribution, TweetSentiment, NytAnalysisResult, ensure_table
+from backend.db.dataset_version import get_data_version
 from backend.api.schemas import NYTMetrics, NYTComparison, StatTestResult, NYTTimelinePoint
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Process-wide cache of the aligned frame and statistical results for one dataset version.
+# NYTService is constructed per request, so an instance attribute would only last one request.
+_shared_cache: dict = {}
+_shared_lock = threading.Lock()
+
+
+def _shared_entry(version: int) -> dict:
+    """The cache entry for `version`, discarding any older version's entry."""
+    with _shared_lock:
+        if _shared_cache.get("version") != version:
+            _shared_cache.clear()
+            _shared_cache["version"] = version
+        return _shared_cache
+
 class NYTService:
     ACQUISITION_DATE = os.getenv("NYT_ACQUISITION_DATE", "2022-02-01")
 
@@ -26,6 +47,35 @@ class NYTService:
     def __init__(self, db: Session):
         self.db = db
         self._df_cache = None  # Cache for DataFrame to avoid repeated queries
+        # None (version unreadable) disables the process-wide cache
+        self._version = get_data_version(db)
+
+    def _cached(self, name: str):
+        """A process-wide cached value, or a result the ETL persisted for this version."""
+        if self._version is None:
+            return None
+        entry = _shared_entry(self._version)
+        if name in entry:
+            return entry[name]
+        if name == "df":
+            return None
+
+        try:
+            row = self.db.get(NytAnalysisResult, name)
+        except Exception as e:
+            # The ETL creates the table when it first persists results
+            logger.warning(f"Could not read persisted NYT analysis '{name}': {e}")
+            self.db.rollback()
+            return None
+        if row is None or row.data_version != self._version:
+            return None
+        payload = json.loads(row.payload)
+        entry[name] = payload
+        return payload
+
+    def _remember(self, name: str, value) -> None:
+        if self._version is not None:
+            _shared_entry(self._version)[name] = value
 
     def _get_data(self) -> pd.DataFrame:
         """Fetches and aligns Word, Distribution, and TweetSentiment data.
@@ -33,41 +83,46 @@ class NYTService:
         """
         if self._df_cache is not None:
             return self._df_cache
+        shared = self._cached("df")
+        if shared is not None:
+            self._df_cache = shared
+            return shared
         
-        # Join words, distributions, and sentiment
+        # Join words, distributions, and sentiment; only the needed columns, with the
+        # success rate computed in SQL
+        total_attempts = (
+            func.coalesce(Distribution.guess_1, 0) + func.coalesce(Distribution.guess_2, 0) +
+            func.coalesce(Distribution.guess_3, 0) + func.coalesce(Distribution.guess_4, 0) +
+            func.coalesce(Distribution.guess_5, 0) + func.coalesce(Distribution.guess_6, 0) +
+            func.coalesce(Distribution.failed, 0)
+        )
+        # Cast so PostgreSQL returns floats rather than Decimals
+        success_rate = cast(case(
+            (total_attempts > 0, cast(total_attempts - func.coalesce(Distribution.failed, 0), Float) / total_attempts * 100),
+            else_=0.0
+        ), Float)
         query = (
-            select(Word, Distribution, TweetSentiment)
+            select(
+                Word.date,
+                Word.word,
+                Word.avg_guess_count.label("avg_guesses"),
+                Word.difficulty_rating.label("difficulty"),
+                success_rate.label("success_rate"),
+                TweetSentiment.avg_sentiment.label("sentiment"),
+                TweetSentiment.frustration_index.label("frustration"),
+                Distribution.total_tweets.label("daily_tweets"),
+            )
             .join(Distribution, Word.id == Distribution.word_id)
             .outerjoin(TweetSentiment, Word.date == TweetSentiment.date)
+            .where(Word.date.isnot(None), Word.date != "", Word.avg_guess_count.isnot(None), Word.avg_guess_count != 0)
         )
-        results = self.db.execute(query).all()
-
-        data = []
-        for word, dist, sentiment in results:
-            if not word.date or not word.avg_guess_count:
-                continue
+        result = self.db.execute(query)
+        df = pd.DataFrame(result.all(), columns=list(result.keys()))
+        if not df.empty:
+            df["era"] = np.where(df["date"] < self.ACQUISITION_DATE, "Pre-NYT", "Post-NYT")
 
-            # Calculate success rate from distribution data
-            total_attempts = (
-                (dist.guess_1 or 0) + (dist.guess_2 or 0) + (dist.guess_3 or 0) +
-                (dist.guess_4 or 0) + (dist.guess_5 or 0) + (dist.guess_6 or 0) + (dist.failed or 0)
-            )
-            success_count = total_attempts - (dist.failed or 0)
-            success_rate = (success_count / total_attempts * 100) if total_attempts > 0 else 0.0
-
-            data.append({
-                "date": word.date,
-                "word": word.word,
-                "avg_guesses": word.avg_guess_count,
-                "difficulty": word.difficulty_rating,
-                "success_rate": success_rate,
-                "sentiment": sentiment.avg_sentiment if sentiment else None,
-                "frustration": sentiment.frustration_index if sentiment else None,
-                "daily_tweets": dist.total_tweets,
-                "era": "Pre-NYT" if word.date < self.ACQUISITION_DATE else "Post-NYT"
-            })
-
-        self._df_cache = pd.DataFrame(data)
+        self._df_cache = df
+        self._remember("df", self._df_cache)
         return self._df_cache
 
     @staticmethod
@@ -122,6 +177,14 @@ class NYTService:
         Returns metrics for before and multiple post-acquisition periods.
         Used for the NYT Effect table display.
         """
+        cached = self._cached("periods")
+        if cached is not None:
+            return cached
+        periods = self._compute_period_comparison()
+        self._remember("periods", periods)
+        return periods
+
+    def _compute_period_comparison(self) -> dict:
         df = self._get_data()
 
         if df.empty:
@@ -197,6 +260,8 @@ class NYTService:
 
     def _is_significant(self, baseline_series, period_series) -> bool:
         """Run t-test and return if p < 0.05."""
+        from scipy import stats
+
         baseline_clean = baseline_series.dropna()
         period_clean = period_series.dropna()
 
@@ -213,6 +278,17 @@ class NYTService:
             return False
 
     def run_statistical_tests(self) -> dict[str, StatTestResult]:
+        cached = self._cached("tests")
+        if cached is not None:
+            return {name: StatTestResult(**result) for name, result in cached.items()}
+        results = self._compute_statistical_tests()
+        self._remember("tests", {name: result.model_dump() for name, result in results.items()})
+        return results
+
+    def _compute_statistical_tests(self) -> dict[str, StatTestResult]:
+        # Imported lazily: requests served from persisted results never load scipy
+        from scipy import stats
+
         df = self._get_data()
         if df.empty:
             return {}
@@ -291,14 +367,59 @@ class NYTService:
         # Sort by date
         df = df.sort_values('date')
 
-        timeline = []
-        for _, row in df.iterrows():
-            timeline.append(NYTTimelinePoint(
-                date=row['date'],
-                word=row['word'],
-                era=row['era'],
-                avg_guesses=row['avg_guesses'],
-                difficulty=int(row['difficulty']) if pd.notna(row['difficulty']) else None
-            ))
+        # Column-wise instead of iterrows(): one Python tuple per day, no per-row Series
+        difficulty = [int(d) if pd.notna(d) else None for d in df['difficulty']]
+        timeline = [
+            NYTTimelinePoint(date=date, word=word, era=era, avg_guesses=avg_guesses, difficulty=diff)
+            for date, word, era, avg_guesses, diff in zip(
+                df['date'], df['word'], df['era'], df['avg_guesses'].astype(float), difficulty
+            )
+        ]
 
         return timeline
+
+    def get_timeline_columns(self) -> dict:
+        """The timeline as one list per field (same values and order as get_timeline)."""
+        df = self._get_data()
+        fields = ('date', 'word', 'era', 'avg_guesses', 'difficulty')
+        if df.empty:
+            return {field: [] for field in fields}
+
+        df = df.sort_values('date')
+        return {
+            'date': df['date'].tolist(),
+            'word': df['word'].tolist(),
+            'era': df['era'].tolist(),
+            'avg_guesses': df['avg_guesses'].astype(float).tolist(),
+            'difficulty': [int(d) if pd.notna(d) else None for d in df['difficulty']],
+        }
+
+
+def persist_nyt_analysis(version: int, db: Optional[Session] = None) -> bool:
+    """
+    Computes the statistical tests and period comparison for `version` and stores them in
+    'nyt_analysis_results' (called by the ETL after bumping the dataset version).
+    """
+    from backend.db.database import SessionLocal
+
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        service = NYTService(db)
+        payloads = {
+            "tests": {name: result.model_dump() for name, result in service._compute_statistical_tests().items()},
+            "periods": service._compute_period_comparison(),
+        }
+        ensure_table(NytAnalysisResult, db.get_bind())
+        for name, payload in payloads.items():
+            db.merge(NytAnalysisResult(name=name, data_version=version, payload=json.dumps(payload)))
+        db.commit()
+        logger.info(f"Persisted NYT analysis for dataset version {version}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to persist NYT analysis: {e}", exc_info=True)
+        db.rollback()
+        return False
+    finally:
+        if own_session:
+            db.close()
@@ -0,0 +1,211 @@
+"""
+In-memory read model of every word's facts, for word-level lookups.
+
+The dataset holds at most a few thousand days and only changes when the ETL bumps the
+dataset version. So instead of running 4–5 queries per lookup (Word, TweetSentiment by
+date, TrapAnalysis, Outlier, Distribution), the API loads everything once with a single
+joined query into immutable column tuples, indexed by word and by date. Lookups are
+dict hits with no database round trip.
+
+The store builds a model on first use (the API also warms it at startup) and builds a
+new one when the dataset version changes. The new model is swapped in with a single
+assignment, so readers see either the old model or the new one, never a mix.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.api.utils import get_difficulty_label
+from backend.db.dataset_version import current_data_version
+from backend.db.schema import Word, Distribution, TweetSentiment, TrapAnalysis, Outlier
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+WORD_READ_MODEL_ENABLED = os.getenv("WORD_READ_MODEL_ENABLED", "true").lower() == "true"
+
+# Column order of the joined query
+FIELDS = (
+    "id", "word", "date", "difficulty_rating", "success_rate", "avg_guess_count",
+    "tweet_volume", "sentiment_score", "frustration_index",
+    "has_trap", "trap_score", "neighbor_count", "deadly_neighbors",
+    "is_outlier", "outlier_z_score",
+)
+
+# Keys (in order) of a word-details payload, as returned by /words/{word}/details
+DETAIL_FIELDS = (
+    "word", "date", "difficulty_rating", "difficulty_label", "success_rate", "avg_guess_count",
+    "tweet_volume", "sentiment_score", "frustration_index", "trap_score", "neighbor_count",
+    "deadly_neighbors", "is_outlier", "outlier_z_score",
+)
+
+
+def _parse_neighbors(raw: Optional[str]) -> Optional[tuple]:
+    if not raw:
+        return None
+    try:
+        return tuple(json.loads(raw))
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def query_word_rows(db: Session, words: Optional[Sequence[str]] = None) -> list:
+    """
+    One row per word (in FIELDS order) with its distribution, sentiment, trap analysis
+    and first outlier joined in. `words` limits the query to those (upper-case) words,
+    still as a single statement.
+    """
+    # A word's outlier status comes from its first recorded outlier
+    first_outlier = db.query(Outlier.word_id, func.min(Outlier.id).label("id"))\
+        .group_by(Outlier.word_id).subquery()
+    query = db.query(
+        Word.id,
+        Word.word,
+        Word.date,
+        Word.difficulty_rating,
+        Word.success_rate,
+        Word.avg_guess_count,
+        Distribution.total_tweets,
+        TweetSentiment.avg_sentiment,
+        TweetSentiment.frustration_index,
+        TrapAnalysis.id,
+        TrapAnalysis.trap_score,
+        TrapAnalysis.neighbor_count,
+        TrapAnalysis.deadly_neighbors,
+        Outlier.id,
+        Outlier.z_score
+    ).outerjoin(Distribution, Distribution.word_id == Word.id)\
+     .outerjoin(TweetSentiment, TweetSentiment.date == Word.date)\
+     .outerjoin(TrapAnalysis, TrapAnalysis.word_id == Word.id)\
+     .outerjoin(first_outlier, first_outlier.c.word_id == Word.id)\
+     .outerjoin(Outlier, Outlier.id == first_outlier.c.id)
+    if words is not None:
+        query = query.filter(Word.word.in_(list(words)))
+
+    rows = []
+    for r in query.order_by(Word.id).all():
+        rows.append(r[:9] + (r[9] is not None, r[10], r[11], _parse_neighbors(r[12]), r[13] is not None, r[14]))
+    return rows
+
+
+class WordReadModel:
+    """Immutable per-word facts stored column-wise, with word and date indexes."""
+
+    def __init__(self, version: Optional[int], rows: list):
+        self.version = version
+        self._columns: Dict[str, tuple] = {
+            field: tuple(values) for field, values in zip(FIELDS, zip(*rows))
+        } if rows else {field: () for field in FIELDS}
+        self._size = len(rows)
+        self._by_word: Dict[str, int] = {}
+        self._by_date: Dict[str, int] = {}
+        for i, (word, date) in enumerate(zip(self._columns["word"], self._columns["date"])):
+            # Rows are in id order; like the old `.first()` lookups, the earliest row wins
+            self._by_word.setdefault(word, i)
+            self._by_date.setdefault(date, i)
+
+    @classmethod
+    def load(cls, db: Session, version: Optional[int]) -> "WordReadModel":
+        return cls(version, query_word_rows(db))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _record(self, index: Optional[int]) -> Optional[dict]:
+        if index is None:
+            return None
+        return {field: self._columns[field][index] for field in FIELDS}
+
+    def record_by_word(self, word: str) -> Optional[dict]:
+        """All stored facts (FIELDS) for `word`, or None if it isn't in the dataset."""
+        return self._record(self._by_word.get(word))
+
+    def record_by_date(self, date: str) -> Optional[dict]:
+        """All stored facts (FIELDS) for the word of `date` (YYYY-MM-DD)."""
+        return self._record(self._by_date.get(date))
+
+    def details_by_word(self, word: str) -> Optional[dict]:
+        """The /words/{word}/details payload for `word` (a fresh dict)."""
+        record = self.record_by_word(word)
+        return details_from_record(record) if record is not None else None
+
+
+def details_from_record(record: dict) -> dict:
+    """Builds a word-details payload from a record with the FIELDS keys."""
+    details = {key: record[key] for key in DETAIL_FIELDS if key in record}
+    neighbors = record["deadly_neighbors"]
+    details["deadly_neighbors"] = list(neighbors) if neighbors is not None else None
+    details["difficulty_label"] = get_difficulty_label(record["difficulty_rating"])
+    return {key: details[key] for key in DETAIL_FIELDS}
+
+
+class WordReadModelStore:
+    """Holds the current WordReadModel and rebuilds it when the dataset version changes."""
+
+    def __init__(self, version_source: Callable[[], Optional[int]] = current_data_version):
+        self._version_source = version_source
+        self._model: Optional[WordReadModel] = None
+        self._build_lock = threading.Lock()
+
+    def get(self, db: Optional[Session] = None) -> Optional[WordReadModel]:
+        """
+        The model for the current dataset version, building it (with `db`, or a new
+        session) if needed. None if disabled or the version/model can't be read, in
+        which case callers query the database directly.
+        """
+        if not WORD_READ_MODEL_ENABLED:
+            return None
+        version = self._version_source()
+        if version is None:
+            return None
+        model = self._model
+        if model is not None and model.version == version:
+            return model
+
+        with self._build_lock:
+            # Another request may have built it while we waited
+            model = self._model
+            if model is not None and model.version == version:
+                return model
+            return self._build(version, db)
+
+    def _build(self, version: int, db: Optional[Session]) -> Optional[WordReadModel]:
+        from backend.db.database import SessionLocal
+
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            model = WordReadModel.load(db, version)
+        except Exception as e:
+            logger.error(f"Failed to build word read model for version {version}: {e}", exc_info=True)
+            db.rollback()
+            return None
+        finally:
+            if own_session:
+                db.close()
+
+        # Single reference swap: readers hold either the old model or this one
+        self._model = model
+        logger.info(f"Loaded word read model: {len(model)} words (dataset version {version})")
+        return model
+
+    def clear(self) -> None:
+        with self._build_lock:
+            self._model = None
+
+    def stats(self) -> dict:
+        model = self._model
+        return {
+            "enabled": WORD_READ_MODEL_ENABLED,
+            "data_version": model.version if model is not None else None,
+            "words": len(model) if model is not None else 0,
+        }
+
+
+word_read_model = WordReadModelStore()
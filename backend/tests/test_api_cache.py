@@ -0,0 +1,94 @@
+"""
+Tests for the dataset-versioned response cache.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from backend.db.database import Base
+from backend.db.schema import DatasetMetadata
+from backend.db.dataset_version import DATA_VERSION_KEY, get_data_version
+from backend.api.cache import ResponseCache, cached_endpoint, response_cache
+from backend.api.responses import FastJSONResponse
+
+
+@pytest.fixture
+def db():
+    """In-memory session with the dataset version set to 1."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(DatasetMetadata(key=DATA_VERSION_KEY, value="1"))
+    session.commit()
+    response_cache.clear()
+    yield session
+    session.close()
+    response_cache.clear()
+
+
+class TestResponseCache:
+    """Tests for the LRU bounds and counters."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1, version=1)
+        cache.put("b", 2, version=1)
+        cache.get("a")
+        cache.put("c", 3, version=1)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+        assert cache.stats()["evictions"] == 1
+
+    def test_new_version_drops_old_entries(self):
+        """Test that entries from an older dataset version are discarded."""
+        cache = ResponseCache()
+        cache.put("a", 1, version=1)
+        cache.put("b", 2, version=2)
+
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["entries"] == 1
+
+
+class TestCachedEndpoint:
+    """Tests for the endpoint decorator."""
+
+    def test_reuses_response_until_version_changes(self, db):
+        """Test that the endpoint body runs once per params and dataset version."""
+        calls = []
+
+        @cached_endpoint
+        def endpoint(limit: int = 10, db=None):
+            calls.append(limit)
+            return {"limit": limit}
+
+        assert endpoint(limit=5, db=db) == {"limit": 5}
+        assert endpoint(limit=5, db=db) == {"limit": 5}
+        assert endpoint(limit=6, db=db) == {"limit": 6}
+        assert calls == [5, 6]
+
+        db.get(DatasetMetadata, DATA_VERSION_KEY).value = "2"
+        db.commit()
+        endpoint(limit=5, db=db)
+        assert calls == [5, 6, 5]
+
+    def test_cached_response_objects_are_copied(self, db):
+        """Test that each hit on a cached Response gets its own instance with the same body."""
+        @cached_endpoint
+        def endpoint(db=None):
+            return FastJSONResponse({"points": [1, 2, 3]})
+
+        first = endpoint(db=db)
+        second = endpoint(db=db)
+        assert first is not second
+        assert first.body == second.body
+        assert second.headers["content-type"] == "application/json"
+
+    def test_missing_version_defaults_to_zero(self):
+        """Test that a database without a version row reads as version 0."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        assert get_data_version(session) == 0
+        session.close()
@@ -15,3 +15,43 @@ def test_get_difficulty_stats():
     assert response.status_code == 200
     data = response.json()
     assert "points" in data["data"]
+
+def test_word_details_match_database_queries(monkeypatch):
+    from backend.services import word_read_model
+
+    words = [w["word"] for w in client.get("/api/v1/words/?limit=25").json()["data"]["words"]]
+    from_model = [client.get(f"/api/v1/words/{w.lower()}/details").json() for w in words]
+    trap_model = [client.get(f"/api/v1/traps/{w}").json() for w in words]
+
+    monkeypatch.setattr(word_read_model, "WORD_READ_MODEL_ENABLED", False)
+    assert [client.get(f"/api/v1/words/{w.lower()}/details").json() for w in words] == from_model
+    assert [client.get(f"/api/v1/traps/{w}").json() for w in words] == trap_model
+
+def test_word_details_not_found():
+    response = client.get("/api/v1/words/qqqqq/details")
+    assert response.status_code == 404
+
+def test_word_details_batch(monkeypatch):
+    from backend.services import word_read_model
+
+    words = [w["word"] for w in client.get("/api/v1/words/?limit=5").json()["data"]["words"]]
+    requested = [w.lower() for w in words] + [words[0], "qqqqq"]
+    response = client.post("/api/v1/words/details:batch", json={"words": requested})
+    assert response.status_code == 200
+    data = response.json()["data"]
+
+    assert list(data["details"]) == words
+    assert data["missing"] == ["QQQQQ"]
+    for w in words:
+        assert data["details"][w] == client.get(f"/api/v1/words/{w}/details").json()["data"]["details"]
+
+    # Without the read model the batch is answered by one IN query with the same result
+    monkeypatch.setattr(word_read_model, "WORD_READ_MODEL_ENABLED", False)
+    assert client.post("/api/v1/words/details:batch", json={"words": requested}).json()["data"] == data
+
+def test_word_details_batch_limits():
+    from backend.api.endpoints.words import WORD_DETAILS_BATCH_MAX
+
+    too_many = ["crane"] * (WORD_DETAILS_BATCH_MAX + 1)
+    assert client.post("/api/v1/words/details:batch", json={"words": too_many}).status_code == 422
+    assert client.post("/api/v1/words/details:batch", json={"words": []}).status_code == 422
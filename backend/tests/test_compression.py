@@ -0,0 +1,100 @@
+"""
+Tests for response compression and the compressed-body cache.
+"""
+
+import gzip
+import pytest
+from fastapi.testclient import TestClient
+from backend.api import main
+from backend.api.compression import (
+    BROTLI_AVAILABLE, API_COMPRESS_MIN_SIZE, accepted_encodings, compressed_cache, negotiate, vary_on_encoding
+)
+from backend.api.snapshots import SnapshotStore
+from backend.db.dataset_version import current_data_version
+
+client = TestClient(main.app)
+
+LARGE = "/api/v1/distributions/?limit=200"
+SMALL = "/api/v1/distributions/aggregate"
+
+
+@pytest.fixture(autouse=True)
+def empty_compressed_cache():
+    compressed_cache.clear()
+    yield
+    compressed_cache.clear()
+
+
+class TestNegotiation:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_refused_codings_are_dropped(self):
+        """Test that q=0 removes a coding and parameters are ignored."""
+        assert accepted_encodings("gzip;q=0.8, br;q=0, identity") == {"gzip", "identity"}
+        assert accepted_encodings("") == set()
+
+    def test_prefers_brotli_when_available(self):
+        """Test that br is chosen only when the brotli package is installed."""
+        assert negotiate("gzip, br") == ("br" if BROTLI_AVAILABLE else "gzip")
+        assert negotiate("gzip;q=0, deflate") is None
+
+    def test_vary_added_once(self):
+        """Test that Accept-Encoding is appended to Vary without duplicates."""
+        assert vary_on_encoding(None) == "Accept-Encoding"
+        assert vary_on_encoding("Origin") == "Origin, Accept-Encoding"
+        assert vary_on_encoding("accept-encoding") == "accept-encoding"
+
+
+class TestCompressionMiddleware:
+    """Tests for the compression middleware."""
+
+    def test_large_response_is_gzipped(self):
+        """Test that a body above the threshold is compressed and marked as varying."""
+        response = client.get(LARGE, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert response.json()["status"] == "success"
+
+    def test_small_response_is_not_compressed(self):
+        """Test that bodies under API_COMPRESS_MIN_SIZE are sent as-is."""
+        response = client.get(SMALL, headers={"Accept-Encoding": "gzip"})
+        assert len(response.content) < API_COMPRESS_MIN_SIZE
+        assert "content-encoding" not in response.headers
+
+    def test_identity_client_gets_plain_body(self):
+        """Test that clients without gzip get the plain body, still with Vary."""
+        response = client.get(LARGE, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_repeat_request_served_from_cache(self):
+        """Test that the second request reuses the compressed body and keeps the ETag."""
+        first = client.get(LARGE, headers={"Accept-Encoding": "gzip"})
+        second = client.get(LARGE, headers={"Accept-Encoding": "gzip"})
+
+        assert compressed_cache.stats()["hits"] == 1
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["content-encoding"] == "gzip"
+
+    def test_not_modified_before_cache(self):
+        """Test that a matching If-None-Match still gets a 304."""
+        etag = client.get(LARGE, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        response = client.get(LARGE, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_precompressed_snapshot_passes_through(self, tmp_path, monkeypatch):
+        """Test that a gzip snapshot is served as stored, without recompression or caching."""
+        version = current_data_version()
+        snapshot_dir = tmp_path / f"v{version}"
+        snapshot_dir.mkdir()
+        (snapshot_dir / "words_stats_difficulty.json.gz").write_bytes(gzip.compress(b'{"snapshot":true}'))
+        monkeypatch.setattr(main, "snapshot_store", SnapshotStore(tmp_path))
+
+        response = client.get("/api/v1/words/stats/difficulty", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["x-snapshot-version"] == str(version)
+        assert response.json() == {"snapshot": True}
+        assert compressed_cache.stats()["entries"] == 0
@@ -3,8 +3,11 @@ Tests for ETL shared utilities.
 """
 
 import pytest
+import pandas as pd
 from backend.etl.transformers.shared import (
     derive_date_from_id,
+    derive_dates_from_ids,
+    dates_from_solutions,
     clean_tweet_text,
     get_sentiment_score,
     calculate_frequency_score,
@@ -39,6 +42,35 @@ class TestDeriveDateFromId:
         assert len(result) == 10  # YYYY-MM-DD format
 
 
+class TestDeriveDatesFromIds:
+    """Tests for the vectorized derive_dates_from_ids function."""
+
+    def test_matches_scalar_version(self):
+        """Test that every ID maps to the same date as derive_date_from_id."""
+        ids = [1, 2, 100, 365, 1000]
+        assert derive_dates_from_ids(ids).tolist() == [derive_date_from_id(i) for i in ids]
+
+    def test_keeps_series_index(self):
+        """Test that results align with the input Series for assignment."""
+        ids = pd.Series([10, 20], index=[5, 7])
+        assert derive_dates_from_ids(ids).index.tolist() == [5, 7]
+
+    def test_single_warning_for_out_of_bounds_ids(self, caplog):
+        """Test that out-of-bounds IDs produce one aggregated warning."""
+        with caplog.at_level('WARNING'):
+            result = derive_dates_from_ids([0, 1, 3000, 3001])
+        warnings = [r for r in caplog.records if 'out-of-bounds' in r.getMessage()]
+        assert len(warnings) == 1
+        assert '3 out-of-bounds' in warnings[0].getMessage()
+        assert len(result) == 4
+
+    def test_solutions_map_with_fallback(self):
+        """Test that solution dates win and missing IDs fall back to derivation."""
+        lookup = {1: {'word': 'CIGAR', 'date': '2021-06-19'}, 2: {'word': 'REBUT'}}
+        dates = dates_from_solutions(pd.Series([1, 2, 100]), lookup)
+        assert dates.tolist() == ['2021-06-19', '2021-06-20', '2021-09-26']
+
+
 class TestCleanTweetText:
     """Tests for clean_tweet_text function."""
 
@@ -10,3 +10,37 @@ def test_health_check(client):
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json()["status"] == "success"
+
+def test_conditional_get_returns_304(client):
+    response = client.get("/api/v1/distributions/aggregate")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "stale-while-revalidate" in response.headers["cache-control"]
+
+    cached = client.get("/api/v1/distributions/aggregate", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+def test_wildcard_if_none_match_only_matches_existing_routes(client):
+    assert client.get("/api/v1/distributions/aggregate", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/api/v1/no-such-route", headers={"If-None-Match": "*"}).status_code == 404
+
+def test_etag_depends_on_query_params(client):
+    first = client.get("/api/v1/distributions/?limit=5").headers["etag"]
+    reordered = client.get("/api/v1/distributions/?limit=5&").headers["etag"]
+    other = client.get("/api/v1/distributions/?limit=6").headers["etag"]
+    assert first == reordered
+    assert first != other
+
+def test_one_dataset_version_per_request(client):
+    from unittest.mock import patch
+    from backend.api.cache import response_cache
+
+    response_cache.clear()
+    with patch("backend.api.cache.current_data_version", side_effect=[7, 8]) as version:
+        response = client.get("/api/v1/distributions/aggregate", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert version.call_count == 1
+    assert response.headers["etag"].startswith('W/"v7-')
+    assert response_cache.stats()["data_version"] == 7
+    response_cache.clear()
@@ -0,0 +1,168 @@
+"""
+Tests for the fast JSON response class and the columnar/arrow formats.
+"""
+
+import json
+from datetime import date, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from backend.api import responses
+from backend.api.main import app
+from backend.api.responses import FastJSONResponse, columns, delta_encode_dates
+
+client = TestClient(app)
+
+
+def decode_dates(table):
+    """Undoes delta_encode_dates on a columnar payload."""
+    if "date_start" not in table:
+        return table
+    day = date.fromisoformat(table["date_start"])
+    dates = []
+    for delta in table["date_delta"]:
+        day += timedelta(days=delta)
+        dates.append(day.isoformat())
+    decoded = {"date": dates}
+    decoded.update({k: v for k, v in table.items() if k not in ("date_start", "date_delta")})
+    return decoded
+
+
+def as_rows(table):
+    """Turns a {field: [values...]} payload back into a list of row dicts."""
+    table = decode_dates(table)
+    return [dict(zip(table, values)) for values in zip(*table.values())]
+
+
+class TestFastJSONResponse:
+    """Tests for rendering and the column helper."""
+
+    def test_renders_compact_json(self):
+        """Test that the output parses back to the same content."""
+        content = {"word": "crane", "values": [1, 2.5, None], "label": "café"}
+        response = FastJSONResponse(content)
+        assert json.loads(response.body) == content
+        assert b", " not in response.body
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_finite_floats_render_as_null(self, monkeypatch, use_orjson):
+        """Test that orjson and the stdlib fallback both write NaN/Inf as null."""
+        if use_orjson and not responses.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(responses, "ORJSON_AVAILABLE", use_orjson)
+        content = {"z": [float("nan"), 1.5, float("inf")], "nested": {"score": float("-inf")}}
+        response = FastJSONResponse(content)
+        assert json.loads(response.body) == {"z": [None, 1.5, None], "nested": {"score": None}}
+
+    def test_columns_transposes_rows(self):
+        """Test that rows become one list per field, empty lists when there are no rows."""
+        rows = [("2022-01-01", 4.1), ("2022-01-02", 3.9)]
+        assert columns(rows, ("date", "avg")) == {"date": ["2022-01-01", "2022-01-02"], "avg": [4.1, 3.9]}
+        assert columns([], ("date", "avg")) == {"date": [], "avg": []}
+
+    def test_delta_encodes_dates(self):
+        """Test that dates become a start date plus day offsets, in either direction."""
+        table = {"date": ["2022-01-01", "2022-01-02", "2022-01-05", "2022-01-04"], "avg": [1, 2, 3, 4]}
+        encoded = delta_encode_dates(table)
+        assert encoded == {"date_start": "2022-01-01", "date_delta": [0, 1, 3, -1], "avg": [1, 2, 3, 4]}
+        assert decode_dates(encoded) == table
+
+    def test_leaves_non_iso_dates(self):
+        """Test that a column that isn't ISO dates is returned unchanged."""
+        table = {"date": ["yesterday"], "avg": [1]}
+        assert delta_encode_dates(table) == table
+
+
+class TestColumnarFormat:
+    """Tests that format=columnar carries the same data as the default row format."""
+
+    def test_outliers_overview(self):
+        """Test that scatter points and top outliers match the row payload."""
+        rows = client.get("/api/v1/outliers/overview?limit=10").json()
+        response = client.get("/api/v1/outliers/overview?limit=10&format=columnar")
+        assert response.status_code == 200
+        data = response.json()
+
+        by_date = lambda points: sorted(points, key=lambda p: p["date"])
+        assert by_date(as_rows(data["plot_data"])) == by_date(rows["plot_data"])
+        assert as_rows(data["top_outliers"]) == rows["top_outliers"]
+
+    def test_distributions(self):
+        """Test that the distributions table matches the row payload."""
+        rows = client.get("/api/v1/distributions/?limit=30").json()
+        data = client.get("/api/v1/distributions/?limit=30&format=columnar").json()
+
+        assert as_rows(data["data"]["distributions"]) == rows["data"]["distributions"]
+        assert data["meta"]["count"] == rows["meta"]["count"]
+        assert data["meta"]["format"] == "columnar"
+
+    def test_difficulty_stats(self):
+        """Test that the difficulty points match the row payload."""
+        rows = client.get("/api/v1/words/stats/difficulty").json()
+        data = client.get("/api/v1/words/stats/difficulty?format=columnar").json()
+
+        assert "date" not in data["data"]["points"]
+        assert as_rows(data["data"]["points"]) == rows["data"]["points"]
+
+    def test_sentiment_timeline(self):
+        """Test that only the timeline changes shape; aggregates and top lists stay as they are."""
+        rows = client.get("/api/v1/analytics/sentiment").json()
+        data = client.get("/api/v1/analytics/sentiment?format=columnar").json()
+
+        assert as_rows(data["data"]["timeline"]) == rows["data"]["timeline"]
+        for key in ("aggregates", "top_hated", "top_loved"):
+            assert data["data"][key] == rows["data"][key]
+
+    def test_nyt_analysis(self):
+        """Test that the timeline columns match the row timeline."""
+        rows = client.get("/api/v1/nyt/analysis").json()
+        data = client.get("/api/v1/nyt/analysis?format=columnar").json()
+
+        assert data["summary"] == rows["summary"]
+        assert data["tests"] == rows["tests"]
+        assert as_rows(data["timeline"]) == rows["timeline"]
+
+    def test_rejects_unknown_format(self):
+        """Test that an unsupported format is a validation error."""
+        response = client.get("/api/v1/distributions/?format=xml")
+        assert response.status_code == 422
+
+
+class TestArrowFormat:
+    """Tests for format=arrow on the time-series endpoints."""
+
+    def test_difficulty_stats_stream(self):
+        """Test that the Arrow stream holds the same points, with dates as date32."""
+        pa = pytest.importorskip("pyarrow")
+        rows = client.get("/api/v1/words/stats/difficulty").json()
+        response = client.get("/api/v1/words/stats/difficulty?format=arrow")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == responses.ARROW_MEDIA_TYPE
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.schema.field("date").type == pa.date32()
+        points = table.to_pylist()
+        for point in points:
+            point["date"] = point["date"].isoformat()
+        assert points == rows["data"]["points"]
+        assert json.loads(table.schema.metadata[b"meta"])["count"] == rows["meta"]["count"]
+
+    def test_sentiment_metadata(self):
+        """Test that the non-tabular parts of the payload travel in the schema metadata."""
+        pa = pytest.importorskip("pyarrow")
+        rows = client.get("/api/v1/analytics/sentiment").json()
+        response = client.get("/api/v1/analytics/sentiment?format=arrow")
+
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert json.loads(table.schema.metadata[b"data"])["aggregates"] == rows["data"]["aggregates"]
+        assert table.num_rows == len(rows["data"]["timeline"])
+
+    def test_not_acceptable_without_pyarrow(self, monkeypatch):
+        """Test that the server answers 406 when pyarrow isn't installed."""
+        monkeypatch.setattr(responses, "PYARROW_AVAILABLE", False)
+        response = client.get("/api/v1/distributions/?limit=7&format=arrow")
+        assert response.status_code == 406
+
+    def test_only_series_endpoints_accept_arrow(self):
+        """Test that endpoints without a time series reject format=arrow."""
+        response = client.get("/api/v1/outliers/overview?format=arrow")
+        assert response.status_code == 422
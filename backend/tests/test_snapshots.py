@@ -0,0 +1,39 @@
+"""
+Tests for ETL-rendered API snapshots.
+"""
+
+import gzip
+import json
+from backend.api.snapshots import SnapshotStore, render_snapshots, prune_snapshots, SNAPSHOT_PATHS
+
+
+class TestSnapshots:
+    """Tests for rendering and serving snapshots."""
+
+    def test_render_and_serve(self, tmp_path):
+        """Test that every snapshotted route is rendered and served in the accepted encoding."""
+        target = render_snapshots(7, root=tmp_path)
+        assert target == tmp_path / "v7"
+        manifest = json.loads((target / "manifest.json").read_text())
+        assert set(manifest["files"]) == set(SNAPSHOT_PATHS)
+
+        store = SnapshotStore(root=tmp_path)
+        plain, encoding = store.get(7, "/api/v1/nyt/periods")
+        assert encoding == "identity"
+        compressed, encoding = store.get(7, "/api/v1/nyt/periods", "gzip, deflate")
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == plain
+        json.loads(plain)
+
+    def test_missing_snapshot_falls_back(self, tmp_path):
+        """Test that unknown versions and routes are not served from disk."""
+        store = SnapshotStore(root=tmp_path)
+        assert store.get(1, "/api/v1/nyt/periods") is None
+        assert store.get(1, "/api/v1/words/") is None
+
+    def test_prune_keeps_newest_versions(self, tmp_path):
+        """Test that only the newest versions are kept."""
+        for version in (1, 2, 10):
+            (tmp_path / f"v{version}").mkdir()
+        prune_snapshots(tmp_path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["v10", "v2"]
@@ -151,6 +151,12 @@ export const statsApi = {
   getWordDetails: async (word: string): Promise<import('@/types').WordDetails> => {
     const response = await apiClient.get(`/words/${word.toLowerCase()}/details`)
     return response.data.data.details
+  },
+
+  // Details for several words in one request, keyed by upper-case word (unknown words are omitted)
+  getWordDetailsBatch: async (words: string[]): Promise<Record<string, import('@/types').WordDetails>> => {
+    const response = await apiClient.post('/words/details:batch', { words })
+    return response.data.data.details
   }
 }
 
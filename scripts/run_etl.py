@@ -2,6 +2,11 @@ import sys
 import os
 import logging
 import argparse
+import time
+from functools import partial
+from typing import Optional
+
+import pandas as pd
 
 # Configure logging for the execution
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -11,105 +16,268 @@ logger = logging.getLogger("ETL_Runner")
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.etl.extract import load_kaggle_games_raw, load_kaggle_tweets_raw, load_wordle_guesses, load_solutions_map
+from backend.etl.extract import load_kaggle_games_since, load_kaggle_tweets_since, load_game_ids, load_tweet_ids, load_game_targets, unique_ids
 from backend.etl.transform import transform_games_data, transform_tweets_data, transform_pattern_data, transform_outlier_data, transform_trap_data, transform_global_stats_data
-from backend.etl.load import load_games_data, load_tweets_data, load_patterns_data, load_outliers_data, load_trap_data, load_global_stats
+from backend.etl.load import load_games_data, load_tweets_data, load_patterns_data, load_outliers_data, load_trap_data, load_global_stats, load_worker_count, upsert_trap_data
+from backend.etl.incremental import processed_through_id, record_processed_through, merge_and_load_patterns, games_frame_from_db, sentiment_frame_from_db, traps_for_all_targets
+from backend.etl.pipeline import Pipeline, Stage
+from backend.etl.artifacts import ArtifactStore
+from backend.etl.checkpoint import with_checkpoint
+from backend.etl.workers import shutdown_pool
+from backend.etl.profiling import profile_pipeline, write_summary
+from backend.etl.publish import publish_new_version
+from backend.etl.extract import games_csv_path, tweets_csv_path, guesses_path
+from backend.etl.fingerprint import stage_fingerprint, lexicon_version, is_stage_current, record_stage_run
+from backend.etl.transform import FRUSTRATION_THRESHOLD, MIN_GAME_ID, MAX_GAME_ID, WORDLE_START_DATE, derive_dates_from_ids
 
-def run_games_etl(date_filter=None):
-    """Runs the Games Data ETL process using wordle_games.csv."""
-    logger.info("Starting Games ETL...")
-    
-    # Load raw games from CSV
-    raw_games = load_kaggle_games_raw()
-    
-    # Transform games data
-    transformed_games = transform_games_data(raw_games)
-    
-    # Apply date filter if provided
-    if date_filter is not None:
-        logger.info(f"Filtering games to {len(date_filter)} common dates...")
-        transformed_games = transformed_games[transformed_games['date'].isin(date_filter)]
-    
-    # Load to database
-    load_games_data(transformed_games)
-    logger.info(f"Games Data ETL Success ({len(transformed_games)} games loaded).")
-    
-    return raw_games, transformed_games
+# Data quality of the historical dataset drops off after this date, so the full backfill
+# caps the common dates here. Incremental runs ingest new days and are not capped.
+DATE_CAP = '2022-11-15'
 
-def run_tweets_etl(date_filter=None):
-    """Runs the Tweets Data ETL process for sentiment analysis."""
-    logger.info("Starting Tweets ETL...")
-    raw_tweets = load_kaggle_tweets_raw()
-    transformed_tweets = transform_tweets_data(raw_tweets)
-    
-    # Apply date filter if provided
-    if date_filter is not None:
-        logger.info(f"Filtering tweets to {len(date_filter)} common dates...")
-        transformed_tweets = transformed_tweets[transformed_tweets['date'].isin(date_filter)]
-    
-    load_tweets_data(transformed_tweets)
-    logger.info(f"Tweets Data ETL Success ({len(transformed_tweets)} tweets loaded).")
-    return transformed_tweets
-
-def run_patterns_etl(raw_games=None):
-    """Runs the Patterns Data ETL process."""
-    logger.info("Starting Patterns ETL...")
-    # Patterns still need raw game data for emoji patterns
-    # Keep loading from wordle_games.csv for now as backup
-    if raw_games is None:
-        logger.info("WARNING: Patterns ETL still requires wordle_games.csv for emoji grid parsing.")
-        logger.info("Loading raw games data for patterns...")
-        raw_games = load_kaggle_games_raw()
-    
-    stats_df, trans_df = transform_pattern_data(raw_games)
-    load_patterns_data(stats_df, trans_df)
-    logger.info("Patterns Data ETL Success.")
+# Default worker processes for independent CPU-heavy branches (per-row work runs on the shared worker pool)
+ETL_JOBS = int(os.getenv("ETL_JOBS", "2"))
 
-def run_outliers_etl(raw_games=None, transformed_tweets=None):
+def compute_stage_fingerprints(date_filtered: bool) -> dict:
     """
-    Runs Outlier Detection ETL.
-    Requires Games data (for volume) and Tweets data (for sentiment).
+    Fingerprints every stage's inputs (file hashes + output-shaping parameters).
+    Returns an empty dict if the raw inputs can't be located, which disables skipping.
     """
-    logger.info("Starting Outliers ETL...")
-    
-    # Needs Games Data
-    if raw_games is None:
-        logger.info("Loading raw games data for outliers...")
-        raw_games = load_kaggle_games_raw()
-        
-    # Needs Transformed Games (with date/id mapping)
-    # Actually, let's just re-transform or pass it. 
-    # transform_outlier_data needs DataFrame with [date, target, total_tweets, id, difficulty_rating]
-    # We can get this from transform_games_data.
-    games_df = transform_games_data(raw_games)
-    
-    # Needs Transformed Tweets
-    if transformed_tweets is None:
-         logger.info("Loading and transforming tweets for outliers...")
-         raw_tweets = load_kaggle_tweets_raw()
-         transformed_tweets = transform_tweets_data(raw_tweets)
-         
-    outliers_df = transform_outlier_data(games_df, transformed_tweets)
-    load_outliers_data(outliers_df)
-    load_outliers_data(outliers_df)
-    logger.info("Outliers ETL Success.")
-    return outliers_df
-
-def run_traps_etl(raw_games=None):
-    """Runs Trap Analysis ETL."""
-    logger.info("Starting Traps ETL...")
-    
-    if raw_games is None:
-        raw_games = load_kaggle_games_raw()
-        
-    # Load enhanced guess list
-    guess_list = load_wordle_guesses()
-        
-    # Needs frequency scores from transformed games
-    games_df = transform_games_data(raw_games)
-    
-    traps_df = transform_trap_data(games_df, guess_list)
-    load_trap_data(traps_df)
-    logger.info("Traps ETL Success.")
+    try:
+        games_csv = games_csv_path()
+        tweets_csv = tweets_csv_path()
+    except FileNotFoundError as e:
+        logger.warning(f"Cannot fingerprint inputs ({e}); every selected stage will run.")
+        return {}
+
+    game_params = {
+        "min_game_id": MIN_GAME_ID,
+        "max_game_id": MAX_GAME_ID,
+        "wordle_start_date": WORDLE_START_DATE.strftime("%Y-%m-%d"),
+        "date_filtered": date_filtered,
+        "date_cap": DATE_CAP,
+    }
+    sentiment_params = {
+        **game_params,
+        "frustration_threshold": FRUSTRATION_THRESHOLD,
+        "lexicon": lexicon_version(),
+    }
+    # Unfiltered transforms don't depend on the date filter, so their artifacts are shared across run modes
+    transform_params = {k: v for k, v in game_params.items() if k not in ("date_filtered", "date_cap")}
+    # The common-date filter depends on both CSVs, so games and tweets hash both
+    return {
+        "transform_games": stage_fingerprint("transform_games", [games_csv], transform_params),
+        "transform_tweets": stage_fingerprint("transform_tweets", [tweets_csv], {
+            **transform_params,
+            "frustration_threshold": FRUSTRATION_THRESHOLD,
+            "lexicon": lexicon_version(),
+        }),
+        "games": stage_fingerprint("games", [games_csv, tweets_csv], game_params),
+        "tweets": stage_fingerprint("tweets", [games_csv, tweets_csv], sentiment_params),
+        "patterns": stage_fingerprint("patterns", [games_csv]),
+        "outliers": stage_fingerprint("outliers", [games_csv, tweets_csv], sentiment_params),
+        "traps": stage_fingerprint("traps", [games_csv, guesses_path()], game_params),
+        "global_stats": stage_fingerprint("global_stats", [games_csv, tweets_csv], {
+            **sentiment_params,
+            "nyt_acquisition_date": os.getenv("NYT_ACQUISITION_DATE", "2022-02-01"),
+        }),
+    }
+
+def find_common_dates(game_ids, tweet_ids, cap: Optional[str] = DATE_CAP) -> list:
+    """
+    Dates present in both datasets, up to `cap` (None for no cap).
+    Works on the raw ID columns alone, so it doesn't wait for the full transforms.
+    """
+    common_ids = set(game_ids).intersection(tweet_ids)
+    common_dates = derive_dates_from_ids(sorted(common_ids))
+    if cap is not None:
+        # [FILTER] Cap end date due to data quality drop-off
+        common_dates = common_dates[common_dates <= cap]
+    common_dates = common_dates.tolist()
+
+    logger.info(f"Found {len(common_dates)} common dates between datasets")
+    logger.info(f"Games date range: {len(game_ids)} dates")
+    logger.info(f"Tweets date range: {len(tweet_ids)} dates")
+    return common_dates
+
+def common_dates_from_csvs():
+    """
+    Common dates of the games and tweets CSVs, or None if they can't be computed, in
+    which case games and tweets load unfiltered.
+    """
+    try:
+        return find_common_dates(load_game_ids(), load_tweet_ids())
+    except Exception as e:
+        logger.error(f"Failed to calculate date intersection: {e}", exc_info=True)
+        return None
+
+def filter_dates(df, common_dates=None):
+    """Restricts a transformed frame to the common dates (no-op without a date filter)."""
+    if common_dates is None or df.empty:
+        return df
+    return df[df['date'].isin(common_dates)]
+
+def checked_load(load_fn):
+    """Wraps a loader so a rollback (False return) fails its pipeline stage."""
+    def run(*frames):
+        if load_fn(*frames) is False:
+            raise RuntimeError("load was rolled back")
+        return True
+    return run
+
+def build_pipeline(date_filtered: bool, load_games: bool, fingerprints: dict = None, store: ArtifactStore = None, resume: bool = False) -> Pipeline:
+    """
+    Declares the ETL stages and their inputs. Each transform runs at most once per run,
+    and dependent loads wait for 'words' when the games load is part of the run.
+    Transforms with a fingerprint are cached in `store` and reused on later runs.
+    The long chunked stages checkpoint every chunk; `resume` reuses finished chunks.
+    """
+    fingerprints = fingerprints or {}
+
+    def checkpointed(func, stage):
+        if stage not in fingerprints:
+            return func
+        return partial(with_checkpoint, func, stage, fingerprints[stage], resume)
+
+    # Games and tweets are filtered to their common dates on a full run
+    date_deps = ("common_dates",) if date_filtered else ()
+    # Tables with FKs to 'words' load after it is committed
+    words_dep = ("load_games",) if load_games else ()
+
+    stages = [
+        Stage("extract_games", load_kaggle_games_raw),
+        Stage("extract_tweets", load_kaggle_tweets_raw),
+        Stage("extract_guesses", load_wordle_guesses),
+        Stage("transform_games", transform_games_data, ("extract_games",), cpu=True, fingerprint=fingerprints.get("transform_games")),
+        Stage("transform_tweets", checkpointed(transform_tweets_data, "transform_tweets"), ("extract_tweets",), fingerprint=fingerprints.get("transform_tweets")),
+        Stage("common_dates", common_dates_from_csvs),
+        Stage("games", filter_dates, ("transform_games",) + date_deps),
+        Stage("tweets", filter_dates, ("transform_tweets",) + date_deps),
+        # Patterns need the raw emoji grids
+        Stage("patterns", checkpointed(transform_pattern_data, "patterns"), ("extract_games",), cpu=True, fingerprint=fingerprints.get("patterns")),
+        # Same daily aggregates as loaded, which incremental runs read back from the database
+        Stage("outliers", transform_outlier_data, ("games", "tweets")),
+        Stage("traps", transform_trap_data, ("transform_games", "extract_guesses"), cpu=True, fingerprint=fingerprints.get("traps")),
+        Stage("global_stats", transform_global_stats_data, ("games", "tweets", "outliers")),
+        Stage("load_games", checked_load(load_games_data), ("games",), io=True),
+        Stage("load_tweets", checked_load(load_tweets_data), ("tweets",), words_dep, io=True),
+        Stage("load_patterns", checked_load(lambda frames: load_patterns_data(*frames)), ("patterns",), words_dep, io=True),
+        Stage("load_outliers", checked_load(load_outliers_data), ("outliers",), words_dep, io=True),
+        Stage("load_traps", checked_load(load_trap_data), ("traps",), words_dep, io=True),
+        Stage("load_global_stats", checked_load(load_global_stats), ("global_stats",), words_dep, io=True),
+    ]
+    return Pipeline(stages, store=store)
+
+def build_incremental_pipeline(after_id: int) -> Pipeline:
+    """
+    Declares the --incremental run: only games/tweets after `after_id` are extracted and
+    transformed, then filtered to the IDs present in both CSVs (without DATE_CAP, which
+    only applies to the historical backfill). Dependent tables merge deltas or are
+    rebuilt from the loaded daily aggregates.
+
+    A run only covers games up to the newest one it loads into 'words'. Later games
+    (e.g. today's, before its tweets arrive) are left for the next run, so patterns
+    don't merge them and the processed-through ID doesn't move past them.
+    """
+    def new_common_dates(raw_games, raw_tweets):
+        # New IDs present in both CSVs
+        try:
+            return find_common_dates(unique_ids(raw_games['Game']), unique_ids(raw_tweets['wordle_id']), cap=None)
+        except Exception as e:
+            logger.error(f"Failed to calculate date intersection: {e}", exc_info=True)
+            return None
+
+    def transform_new_games(raw_games):
+        if raw_games.empty:
+            return pd.DataFrame()
+        return transform_games_data(raw_games)
+
+    def rescore_traps(raw_games, guess_list):
+        # New targets change earlier words' neighbours, so every target is rescored
+        if raw_games.empty:
+            return pd.DataFrame()
+        return traps_for_all_targets(load_game_targets(), guess_list)
+
+    def covered(raw_games, games):
+        # Raw games up to the newest one being loaded
+        if games.empty:
+            return raw_games.iloc[0:0]
+        return raw_games[pd.to_numeric(raw_games['Game'], errors='coerce') <= games['Game'].max()]
+
+    def pattern_deltas(raw_games, games):
+        raw_games = covered(raw_games, games)
+        if raw_games.empty:
+            return pd.DataFrame(), pd.DataFrame()
+        return transform_pattern_data(raw_games)
+
+    def transform_new_tweets(raw_tweets):
+        if raw_tweets.empty:
+            return pd.DataFrame()
+        return transform_tweets_data(raw_tweets)
+
+    def record_loaded_games(games):
+        if not games.empty:
+            record_processed_through(games['Game'].max())
+
+    def outliers_from_db():
+        return transform_outlier_data(games_frame_from_db(), sentiment_frame_from_db())
+
+    def global_stats_from_db(outliers_df):
+        return transform_global_stats_data(games_frame_from_db(), sentiment_frame_from_db(), outliers_df)
+
+    words = ("load_games",)
+    return Pipeline([
+        Stage("extract_games", lambda: load_kaggle_games_since(after_id)),
+        Stage("extract_tweets", lambda: load_kaggle_tweets_since(after_id)),
+        Stage("extract_guesses", load_wordle_guesses),
+        Stage("transform_games", transform_new_games, ("extract_games",)),
+        Stage("transform_tweets", transform_new_tweets, ("extract_tweets",)),
+        Stage("common_dates", new_common_dates, ("extract_games", "extract_tweets")),
+        Stage("games", filter_dates, ("transform_games", "common_dates")),
+        Stage("tweets", filter_dates, ("transform_tweets", "common_dates")),
+        # As in a full run, patterns count every game (not just common dates) and traps score every target
+        Stage("patterns", pattern_deltas, ("extract_games", "games")),
+        Stage("traps", rescore_traps, ("extract_games", "extract_guesses")),
+        Stage("load_games", checked_load(load_games_data), ("games",), io=True),
+        Stage("load_tweets", checked_load(load_tweets_data), ("tweets",), words, io=True),
+        Stage("load_patterns", checked_load(merge_and_load_patterns), ("patterns",), words, io=True),
+        Stage("load_traps", checked_load(upsert_trap_data), ("traps",), words, io=True),
+        # Volume z-scores and global stats depend on every day, so they read the loaded aggregates
+        Stage("outliers", outliers_from_db, after=("load_games", "load_tweets")),
+        Stage("load_outliers", checked_load(load_outliers_data), ("outliers",), io=True),
+        Stage("global_stats", global_stats_from_db, ("outliers",)),
+        Stage("load_global_stats", checked_load(load_global_stats), ("global_stats",), io=True),
+        # Only once every load that covers the new games has committed
+        Stage("processed_through", record_loaded_games, ("games",), ("load_games", "load_tweets", "load_patterns", "load_traps")),
+    ])
+
+def run_incremental(load_workers=None, profile: bool = False, track_memory: bool = False) -> None:
+    """Loads only the Wordle IDs newer than the highest one already processed."""
+    after_id = processed_through_id()
+    logger.info(f"Incremental run: processing Wordle IDs after #{after_id}...")
+
+    try:
+        fingerprint = stage_fingerprint("incremental", [games_csv_path(), tweets_csv_path()], {"after_id": after_id})
+    except FileNotFoundError as e:
+        logger.error(f"Cannot run incremental ETL: {e}")
+        return
+
+    pipeline = build_incremental_pipeline(after_id)
+    profile_dir = profile_pipeline(pipeline) if profile else None
+
+    start = time.perf_counter()
+    results = pipeline.run(
+        ["load_games", "load_tweets", "load_patterns", "load_traps", "load_outliers", "load_global_stats", "processed_through"],
+        io_workers=load_worker_count(load_workers),
+        track_memory=track_memory or profile,
+    )
+    if profile_dir:
+        write_summary(profile_dir, results)
+    success = all(r.status == "success" for r in results.values())
+    record_stage_run("incremental", fingerprint, success, time.perf_counter() - start)
+    if any(name.startswith("load_") and r.status == "success" for name, r in results.items()):
+        publish_new_version()
+    logger.info(f"Incremental run {'complete' if success else 'finished with failures'}; "
+                f"processed games through #{processed_through_id()}.")
 
 
 def main():
@@ -121,132 +289,88 @@ def main():
     parser.add_argument("--traps", action="store_true", help="Run Traps ETL process")
     parser.add_argument("--global-stats", action="store_true", help="Run Global Stats aggregation")
     parser.add_argument("--all", action="store_true", help="Run all ETL processes (default)")
+    parser.add_argument("--load-workers", type=int, default=None, help="Threads for concurrent table loads (default: ETL_LOAD_WORKERS)")
+    parser.add_argument("--force", action="store_true", help="Run selected stages even if their inputs are unchanged")
+    parser.add_argument("--incremental", action="store_true", help="Only process Wordle IDs newer than the latest one loaded")
+    parser.add_argument("--jobs", type=int, default=ETL_JOBS, help="Worker processes for CPU-heavy branches (patterns, traps, games transform); 1 runs them serially")
+    parser.add_argument("--resume", action="store_true", help="Continue chunked stages (sentiment, patterns) from their last saved chunk")
+    parser.add_argument("--no-artifacts", action="store_true", help="Recompute transforms instead of reusing cached artifacts")
+    parser.add_argument("--profile", action="store_true", help="Profile each stage (cProfile, sampled stacks, memory timeline) into data/profiles/; implies --track-memory")
+    parser.add_argument("--track-memory", action="store_true", help="Report each stage's peak traced memory (tracemalloc; slows allocation-heavy stages)")
     
     args = parser.parse_args()
+
+    if args.incremental:
+        run_incremental(args.load_workers, profile=args.profile, track_memory=args.track_memory)
+        return
     
     # If no specific flags are provided, default to all
     if not (args.games or args.tweets or args.patterns or args.outliers or args.traps or args.global_stats or args.all):
         args.all = True
 
     logger.info(f"Starting ETL Pipeline...")
-    
-    # Shared Data containers to avoid re-loading/re-processing
-    raw_games = None
-    transformed_games = None
-    transformed_tweets = None
-    outliers_df = None
-    common_dates = None
-
-    # Calculate date intersection if running both games and tweets
-    if args.all:
-        try:
-            logger.info("Calculating date intersection...")
-            # Load both datasets to get dates
-            temp_games = load_kaggle_games_raw()
-            temp_tweets = load_kaggle_tweets_raw()
-            
-            # Transform to get dates
-            temp_games_df = transform_games_data(temp_games)
-            temp_tweets_df = transform_tweets_data(temp_tweets)
-            
-            # Calculate intersection
-            games_dates = set(temp_games_df['date'].unique())
-            tweets_dates = set(temp_tweets_df['date'].unique())
-            common_dates = list(games_dates.intersection(tweets_dates))
-            
-            # [FILTER] Cap end date at 2022-11-15 due to data quality drop-off
-            common_dates = [d for d in common_dates if d <= '2022-11-15']
-            
-            logger.info(f"Found {len(common_dates)} common dates between datasets")
-            logger.info(f"Games date range: {len(games_dates)} dates")
-            logger.info(f"Tweets date range: {len(tweets_dates)} dates")
-        except Exception as e:
-            logger.error(f"Failed to calculate date intersection: {e}", exc_info=True)
-            common_dates = None
 
-    # 1. Games Data (FROM WORDLE_GAMES.CSV)
-    if args.all or args.games:
-        try:
-            raw_games, transformed_games = run_games_etl(common_dates)
-        except Exception as e:
-            logger.error(f"Games ETL/Load Failed: {e}", exc_info=True)
-    
-    # For patterns/traps that still need raw games CSV (emoji grids)
-    if args.patterns or args.traps:
-        if raw_games is None:
-            try:
-                logger.info("Loading raw games CSV for patterns/traps (emoji grids required)...")
-                raw_games = load_kaggle_games_raw()
-            except Exception as e:
-                logger.error(f"Failed to load raw games: {e}", exc_info=True)
-    
-    # For outliers that need transformed games
-    if args.outliers:
-        if transformed_games is None:
-            try:
-                logger.info("Running games transform for outliers dependency...")
-                if raw_games is None:
-                    raw_games = load_kaggle_games_raw()
-                transformed_games = transform_games_data(raw_games)
-            except Exception as e:
-                logger.error(f"Failed to transform games: {e}", exc_info=True)
-
-    # 2. Tweets Data
-    if args.all or args.tweets or args.outliers:
-        try:
-            if args.tweets or args.all:
-                transformed_tweets = run_tweets_etl(common_dates)
-            else:
-                logger.info("Loading and transforming tweets (dependency)...")
-                raw_tweets = load_kaggle_tweets_raw()
-                transformed_tweets = transform_tweets_data(raw_tweets)
-        except Exception as e:
-            logger.error(f"Tweets ETL Failed: {e}", exc_info=True)
+    # Skip stages whose inputs match their last successful run
+    fingerprints = compute_stage_fingerprints(date_filtered=args.all)
 
-    # 3. Pattern Data
-    if args.all or args.patterns:
-        try:
-            run_patterns_etl(raw_games)
-        except Exception as e:
-            logger.error(f"Patterns ETL Failed: {e}", exc_info=True)
-            
-    # 4. Outliers Data
-    if args.all or args.outliers:
-        try:
-            outliers_df = run_outliers_etl(raw_games, transformed_tweets)
-        except Exception as e:
-            logger.error(f"Outliers ETL Failed: {e}", exc_info=True)
+    def should_run(stage, selected):
+        if not selected:
+            return False
+        if not args.force and stage in fingerprints and is_stage_current(stage, fingerprints[stage]):
+            logger.info(f"Skipping {stage}: inputs unchanged since last successful run (use --force to rerun).")
+            return False
+        return True
 
-    # 5. Traps Data
-    if args.all or args.traps:
-        try:
-             run_traps_etl(raw_games)
-        except Exception as e:
-            logger.error(f"Traps ETL Failed: {e}", exc_info=True)
+    selected = {
+        "games": args.games,
+        "tweets": args.tweets,
+        "patterns": args.patterns,
+        "outliers": args.outliers,
+        "traps": args.traps,
+        "global_stats": args.global_stats,
+    }
+    stages_to_run = [stage for stage, flag in selected.items() if should_run(stage, args.all or flag)]
+    if not stages_to_run:
+        logger.info("Nothing to do.")
+        return
+
+    pipeline = build_pipeline(
+        date_filtered=args.all,
+        load_games="games" in stages_to_run,
+        fingerprints=fingerprints,
+        store=None if args.no_artifacts else ArtifactStore(),
+        resume=args.resume,
+    )
+    profile_dir = profile_pipeline(pipeline) if args.profile else None
+    results = pipeline.run(
+        [f"load_{stage}" for stage in stages_to_run],
+        io_workers=load_worker_count(args.load_workers, len(stages_to_run)),
+        cpu_workers=args.jobs,
+        track_memory=args.track_memory or args.profile,
+    )
+    if profile_dir:
+        write_summary(profile_dir, results)
+
+    loaded_any, loaded_all = False, True
+    for stage in stages_to_run:
+        result = results.get(f"load_{stage}")
+        success = result is not None and result.status == "success"
+        loaded_any = loaded_any or success
+        loaded_all = loaded_all and success
+        if stage in fingerprints:
+            record_stage_run(stage, fingerprints[stage], success, result.seconds if success else None)
+
+    # A complete run covers every game in the CSV; incremental runs continue after it
+    if args.all and loaded_all:
+        record_processed_through(load_game_ids().max())
+
+    # API caches are keyed by the dataset version, so any committed load invalidates them
+    if loaded_any:
+        publish_new_version()
 
-    # 6. Global Stats (Final Aggregation)
-    if args.all or args.global_stats:
-        try:
-            logger.info("Starting Global Stats ETL...")
-            if transformed_games is None:
-                if raw_games is None:
-                    raw_games = load_kaggle_games_raw()
-                transformed_games = transform_games_data(raw_games)
-            
-            if transformed_tweets is None:
-                raw_tweets = load_kaggle_tweets_raw()
-                transformed_tweets = transform_tweets_data(raw_tweets)
-                
-            if outliers_df is None:
-                # Need to re-run transform if not available
-                outliers_df = transform_outlier_data(transformed_games, transformed_tweets)
-            
-            global_stats = transform_global_stats_data(transformed_games, transformed_tweets, outliers_df)
-            load_global_stats(global_stats)
-            logger.info("Global Stats ETL Success.")
-            
-        except Exception as e:
-            logger.error(f"Global Stats ETL Failed: {e}", exc_info=True)
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        shutdown_pool()
@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend.etl.extract import load_kaggle_games_raw
 from backend.etl.transform import transform_pattern_data
 from backend.etl.load import load_patterns_data
+from backend.etl.publish import publish_new_version
 
 def main():
     logger.info("Starting Pattern Analysis ETL...")
@@ -27,8 +28,12 @@ def main():
         logger.info(f"Transformed: {len(stats_df)} unique patterns, {len(trans_df)} transitions.")
         
         # 3. Load Data
-        load_patterns_data(stats_df, trans_df)
+        if load_patterns_data(stats_df, trans_df) is False:
+            raise RuntimeError("pattern load was rolled back")
         logger.info("Pattern Data Load Success.")
+
+        # 4. Invalidate API caches keyed by the dataset version
+        publish_new_version()
         
     except Exception as e:
         logger.error(f"Pattern ETL Failed: {e}", exc_info=True)
@@ -92,3 +92,114 @@ def test_idempotency(db_session, mock_extract):
         count2 = db_session.query(Word).count()
         
         assert count1 == count2 == 2
+
+def test_upsert_skips_unchanged_and_updates_changed(db_session, mock_extract):
+    """Re-running the games load writes nothing; changed rows are updated in place."""
+    games_df = extract.load_kaggle_games_raw()
+    games_transformed = transform.transform_games_data(games_df)
+
+    with patch('backend.etl.load.SessionLocal') as mock_session_cls:
+        mock_session_cls.return_value = db_session
+        load.load_games_data(games_transformed)
+
+        words = [{"id": w.id, "word": w.word} for w in db_session.query(Word).all()]
+        assert load._upsert_rows(db_session, Word, words, ["id"]) == 0
+
+        changed = games_transformed.copy()
+        changed.loc[changed['Game'] == 500, 'target'] = 'redux'
+        load.load_games_data(changed)
+
+        db_session.expire_all()
+        assert db_session.query(Word).filter(Word.id == 500).one().word == 'redux'
+        assert db_session.query(Word).count() == 2
+        assert db_session.query(Distribution).count() == 2
+
+def test_swap_refresh_replaces_rows_and_keeps_index_names(db_session):
+    """Staging-table swap leaves only the new rows and the canonical index names."""
+    from sqlalchemy import inspect
+    from backend.db.schema import Outlier, PatternStatistic, PatternTransition
+
+    stats = pd.DataFrame({'pattern': ['🟩⬜⬜⬜⬜'], 'count': [3], 'success_count': [2], 'avg_guesses': [4.0], 'rank': [1]})
+    trans = pd.DataFrame({'source_pattern': ['🟩⬜⬜⬜⬜'], 'next_pattern': ['🟩🟩🟩🟩🟩'], 'count': [2]})
+    outliers = pd.DataFrame({
+        'word_id': [500], 'date': ['2022-10-31'], 'outlier_type': ['viral_fun'], 'metric': ['volume'],
+        'actual_value': [900.0], 'expected_value': [300.0], 'z_score': [2.5], 'context': ['busy']
+    })
+
+    with patch('backend.etl.load.SessionLocal') as mock_session_cls:
+        mock_session_cls.return_value = db_session
+        for _ in range(2):
+            load.load_patterns_data(stats, trans, mode="swap")
+            load.load_outliers_data(outliers, mode="swap")
+
+    assert db_session.query(PatternStatistic).count() == 1
+    assert db_session.query(PatternTransition).count() == 1
+    assert db_session.query(Outlier).count() == 1
+
+    inspector = inspect(db_session.connection())
+    table_names = inspector.get_table_names()
+    assert not any(name.endswith(('__staging', '__old')) for name in table_names)
+    index_names = {idx['name'] for idx in inspector.get_indexes('outliers')}
+    assert {'ix_outliers_id', 'ix_outlier_type_zscore'} <= index_names
+
+def test_failed_swap_refresh_drops_staging_table(db_session):
+    """A swap that fails while staging leaves the live table in place and no '__staging' table."""
+    from sqlalchemy import inspect
+    from backend.db.schema import Outlier
+
+    outliers = pd.DataFrame({
+        'id': [1, 1], 'word_id': [500, 501], 'date': ['2022-10-31', '2022-11-01'], 'outlier_type': ['viral_fun'] * 2,
+        'metric': ['volume'] * 2, 'actual_value': [900.0] * 2, 'expected_value': [300.0] * 2, 'z_score': [2.5] * 2,
+        'context': ['busy'] * 2
+    })
+
+    with patch('backend.etl.load.SessionLocal') as mock_session_cls:
+        mock_session_cls.return_value = db_session
+        assert not load.load_outliers_data(outliers, mode="swap")
+
+    table_names = inspect(db_session.connection()).get_table_names()
+    assert Outlier.__tablename__ in table_names
+    assert Outlier.__tablename__ + load.STAGING_SUFFIX not in table_names
+
+def test_tweets_load_drops_rows_without_parent_word(db_session, mock_extract):
+    """Sentiment rows whose wordle_id has no Word are filtered out in SQL."""
+    games_transformed = transform.transform_games_data(extract.load_kaggle_games_raw())
+    tweets_transformed = transform.transform_tweets_data(extract.load_kaggle_tweets_raw())
+    orphan = tweets_transformed.iloc[[0]].assign(wordle_id=999, date='2024-03-03')
+    tweets_with_orphan = pd.concat([tweets_transformed, orphan], ignore_index=True)
+
+    with patch('backend.etl.load.SessionLocal') as mock_session_cls:
+        mock_session_cls.return_value = db_session
+        load.load_games_data(games_transformed)
+        load.load_tweets_data(tweets_with_orphan)
+
+    word_ids = {s.word_id for s in db_session.query(TweetSentiment).all()}
+    assert word_ids == {500, 501}
+
+def test_word_id_mask_survives_leftover_temp_table(db_session):
+    """A temp table left behind by a failed load neither breaks nor skews the next one."""
+    db_session.add(Word(id=500, word='REACT', date='2022-10-31'))
+    db_session.flush()
+    conn = db_session.connection()
+    conn.exec_driver_sql('CREATE TEMPORARY TABLE _incoming_word_ids (word_id INTEGER PRIMARY KEY)')
+    conn.exec_driver_sql('INSERT INTO _incoming_word_ids VALUES (501)')
+
+    mask = load._existing_word_id_mask(db_session, pd.Series([500, 501, 500]))
+    assert mask.tolist() == [True, False, True]
+
+def test_run_loads_concurrently_times_each_load():
+    """Every queued load runs once and reports a duration; a failing load is logged, not raised."""
+    calls = []
+
+    def failing_load():
+        raise RuntimeError("boom")
+
+    timings = load.run_loads_concurrently({
+        'patterns': lambda: calls.append('patterns'),
+        'outliers': lambda: calls.append('outliers'),
+        'broken': failing_load,
+    }, max_workers=3)
+
+    assert sorted(calls) == ['outliers', 'patterns']
+    assert set(timings) == {'patterns', 'outliers'}
+    assert all(duration >= 0 for duration in timings.values())
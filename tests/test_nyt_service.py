@@ -1,48 +1,39 @@
 import pytest
 import pandas as pd
 from unittest.mock import MagicMock
+from backend.services import nyt_service
 from backend.services.nyt_service import NYTService
+from backend.db.schema import Word, Distribution
 from backend.api.schemas import NYTMetrics, NYTComparison
 
-class MockWord:
-    def __init__(self, date, word, avg_guesses, difficulty, success_rate):
-        self.date = date
-        self.word = word
-        self.avg_guess_count = avg_guesses
-        self.difficulty_rating = difficulty
-        self.success_rate = success_rate
+def add_day(db, word_id, date, word, avg_guesses, difficulty, failed=0):
+    db.add(Word(id=word_id, word=word, date=date, avg_guess_count=avg_guesses, difficulty_rating=difficulty))
+    db.add(Distribution(word_id=word_id, date=date, guess_3=90, failed=failed, total_tweets=100))
 
-class MockDistribution:
-    def __init__(self, word_id):
-        self.word_id = word_id
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    # The service caches per dataset version across instances; each test has its own data
+    nyt_service._shared_cache.clear()
+    yield
+    nyt_service._shared_cache.clear()
 
 @pytest.fixture
 def mock_db():
     return MagicMock()
 
-def test_nyt_service_get_comparison(mock_db):
-    # Setup mock data
-    # Pre-NYT: 2022-01-01
-    w1 = MockWord("2022-01-01", "HELLO", 3.5, 2, 0.9)
-    d1 = MockDistribution(1)
-    
-    # Post-NYT: 2022-03-01
-    w2 = MockWord("2022-03-01", "WORLD", 4.5, 8, 0.8)
-    d2 = MockDistribution(2)
-
-    # Mock DB response for select(Word, Distribution).join...
-    # The service iterates over results
-    mock_db.execute.return_value.all.return_value = [
-        (w1, d1),
-        (w2, d2)
-    ]
+def test_nyt_service_get_comparison(db_session):
+    # Pre-NYT: 2022-01-01, Post-NYT: 2022-03-01
+    add_day(db_session, 1, "2022-01-01", "HELLO", 3.5, 2, failed=10)
+    add_day(db_session, 2, "2022-03-01", "WORLD", 4.5, 8, failed=20)
+    db_session.flush()
 
-    service = NYTService(mock_db)
+    service = NYTService(db_session)
     comparison = service.get_comparison_summary()
 
     # Verify Pre-NYT metrics
     assert comparison.before.avg_guesses == 3.5
     assert comparison.before.avg_difficulty == 2.0
+    assert comparison.before.avg_success_rate == 90.0
     assert comparison.before.total_games == 1
 
     # Verify Post-NYT metrics
@@ -54,21 +45,45 @@ def test_nyt_service_get_comparison(mock_db):
     assert comparison.diff_guesses == 1.0  # 4.5 - 3.5
     assert comparison.diff_difficulty == 6.0 # 8.0 - 2.0
 
-def test_nyt_timeline(mock_db):
-    w1 = MockWord("2022-01-01", "HELLO", 3.5, 2, 0.9)
-    d1 = MockDistribution(1)
-    
-    mock_db.execute.return_value.all.return_value = [(w1, d1)]
-    
-    service = NYTService(mock_db)
+def test_nyt_timeline(db_session):
+    add_day(db_session, 1, "2022-01-01", "HELLO", 3.5, 2)
+    add_day(db_session, 2, "2021-12-31", "SKIPS", None, 3)  # No average: left out
+    db_session.flush()
+
+    service = NYTService(db_session)
     timeline = service.get_timeline()
     
     assert len(timeline) == 1
     assert timeline[0].date == "2022-01-01"
     assert timeline[0].era == "Pre-NYT"
+    assert timeline[0].difficulty == 2
 
 def test_statistical_tests_empty(mock_db):
     mock_db.execute.return_value.all.return_value = []
     service = NYTService(mock_db)
     results = service.run_statistical_tests()
     assert results == {}
+
+def test_persisted_analysis_skips_scipy(db_session):
+    from unittest.mock import patch
+    from backend.db.schema import DatasetMetadata
+    from backend.services.nyt_service import persist_nyt_analysis
+
+    db_session.add(DatasetMetadata(key="data_version", value="1"))
+    days = [("2022-01-%02d" % d, 3.5 + d / 100, d % 9 + 1) for d in range(1, 29)]
+    days += [("2022-03-%02d" % d, 4.0 + d / 100, d % 7 + 2) for d in range(1, 29)]
+    for i, (date, guesses, difficulty) in enumerate(days, start=1):
+        db_session.add(Word(id=i, word="w%04d" % i, date=date, avg_guess_count=guesses, difficulty_rating=difficulty))
+        db_session.add(Distribution(word_id=i, date=date, guess_3=50 + i, guess_4=40, failed=i % 5, total_tweets=100 + i))
+    db_session.commit()
+
+    assert persist_nyt_analysis(1, db=db_session)
+    expected = NYTService(db_session).run_statistical_tests()
+    assert set(expected) == {"t_test_means", "mann_whitney", "levene_variance", "mann_whitney_difficulty", "t_test_success"}
+
+    # A fresh process-wide cache must be filled from the persisted rows, not from scipy
+    nyt_service._shared_cache.clear()
+    with patch("scipy.stats.ttest_ind", side_effect=AssertionError("scipy was called")):
+        service = NYTService(db_session)
+        assert service.run_statistical_tests() == expected
+        assert service.get_period_comparison()["before"]
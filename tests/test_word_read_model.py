@@ -0,0 +1,70 @@
+import pytest
+from backend.db.schema import Word, Distribution, TweetSentiment, TrapAnalysis, Outlier
+from backend.services.word_read_model import WordReadModel, WordReadModelStore
+
+def add_word(db, word_id, word, date, rating=None):
+    db.add(Word(id=word_id, word=word, date=date, difficulty_rating=rating, avg_guess_count=4.0, success_rate=0.9))
+
+@pytest.fixture
+def seeded(db_session):
+    add_word(db_session, 1, "CRANE", "2022-01-01", rating=3)
+    db_session.add(Distribution(word_id=1, date="2022-01-01", total_tweets=1200))
+    db_session.add(TweetSentiment(date="2022-01-01", avg_sentiment=0.25, frustration_index=0.1))
+    db_session.add(TrapAnalysis(word_id=1, trap_score=7.5, neighbor_count=2, deadly_neighbors='["CRATE", "GRANE"]'))
+    db_session.add(Outlier(id=10, word_id=1, outlier_type="Viral", z_score=3.1))
+    db_session.add(Outlier(id=11, word_id=1, outlier_type="Hard", z_score=2.2))
+    add_word(db_session, 2, "SLATE", "2022-01-02")
+    db_session.flush()
+    return db_session
+
+def test_details_join_every_table(seeded):
+    model = WordReadModel.load(seeded, version=1)
+    assert len(model) == 2
+
+    details = model.details_by_word("CRANE")
+    assert details == {
+        "word": "CRANE", "date": "2022-01-01", "difficulty_rating": 3, "difficulty_label": "Easy",
+        "success_rate": 0.9, "avg_guess_count": 4.0, "tweet_volume": 1200, "sentiment_score": 0.25,
+        "frustration_index": 0.1, "trap_score": 7.5, "neighbor_count": 2, "deadly_neighbors": ["CRATE", "GRANE"],
+        "is_outlier": True, "outlier_z_score": 3.1,  # first recorded outlier
+    }
+
+def test_missing_facts_are_empty(seeded):
+    model = WordReadModel.load(seeded, version=1)
+    record = model.record_by_date("2022-01-02")
+    assert record["word"] == "SLATE"
+    assert record["has_trap"] is False
+    assert record["is_outlier"] is False
+    assert model.details_by_word("SLATE")["deadly_neighbors"] is None
+    assert model.details_by_word("ZZZZZ") is None
+
+def test_returned_details_are_copies(seeded):
+    model = WordReadModel.load(seeded, version=1)
+    model.details_by_word("CRANE")["deadly_neighbors"].append("BRAVE")
+    assert model.details_by_word("CRANE")["deadly_neighbors"] == ["CRATE", "GRANE"]
+
+def test_store_rebuilds_on_version_change(seeded):
+    versions = [1]
+    store = WordReadModelStore(version_source=lambda: versions[-1])
+
+    first = store.get(seeded)
+    assert store.get(seeded) is first
+
+    add_word(seeded, 3, "TRACE", "2022-01-03")
+    seeded.flush()
+    versions.append(2)
+    second = store.get(seeded)
+    assert second is not first
+    assert second.version == 2
+    assert second.details_by_word("TRACE") is not None
+    # The old model is untouched for readers still holding it
+    assert first.details_by_word("TRACE") is None
+
+def test_store_unavailable_without_version(seeded):
+    store = WordReadModelStore(version_source=lambda: None)
+    assert store.get(seeded) is None
+
+def test_query_limited_to_words(seeded):
+    from backend.services.word_read_model import query_word_rows
+    rows = query_word_rows(seeded, ["SLATE", "ZZZZZ"])
+    assert [row[1] for row in rows] == ["SLATE"]
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backend.etl.artifacts import ArtifactStore
+from backend.etl.pipeline import Pipeline, Stage
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(root=tmp_path, keep=2)
+
+
+class TestArtifactStore:
+    def test_frame_round_trip(self, store):
+        df = pd.DataFrame({'date': ['2022-01-01', '2022-01-02'], 'avg_sentiment': [0.1, -0.2]})
+        store.save('transform_tweets', 'abc', df)
+        assert store.has('transform_tweets', 'abc')
+        pd.testing.assert_frame_equal(store.load('transform_tweets', 'abc'), df)
+
+    def test_tuple_and_array_round_trip(self, store):
+        stats = pd.DataFrame({'pattern': ['GGGGG'], 'count': [3]})
+        matrix = np.arange(6, dtype=np.int32).reshape(2, 3)
+        store.save('patterns', 'abc', (stats, matrix))
+        loaded_stats, loaded_matrix = store.load('patterns', 'abc')
+        pd.testing.assert_frame_equal(loaded_stats, stats)
+        np.testing.assert_array_equal(loaded_matrix, matrix)
+
+    def test_missing_artifact(self, store):
+        assert not store.has('traps', 'nope')
+        with pytest.raises(KeyError):
+            store.load('traps', 'nope')
+
+    def test_prunes_old_fingerprints(self, store, tmp_path):
+        for fp in ('v1', 'v2', 'v3'):
+            store.save('traps', fp, pd.DataFrame({'x': [1]}))
+        assert not store.has('traps', 'v1')
+        assert store.has('traps', 'v2') and store.has('traps', 'v3')
+
+
+class TestPipelineArtifacts:
+    def test_cached_stage_skips_upstream(self, store):
+        calls = []
+
+        def extract():
+            calls.append('extract')
+            return pd.DataFrame({'x': [1, 2]})
+
+        def transform(df):
+            calls.append('transform')
+            return df * 2
+
+        def build():
+            return Pipeline([
+                Stage('extract', extract),
+                Stage('transform', transform, ('extract',), fingerprint='fp1'),
+                Stage('load', lambda df: int(df['x'].sum()), ('transform',)),
+            ], store=store)
+
+        first = build().run(['load'])
+        calls.clear()
+        second = build().run(['load'])
+
+        assert first['transform'].status == 'success'
+        assert second['transform'].status == 'cached'
+        assert 'extract' not in second and calls == []
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+from backend.etl.checkpoint import ChunkCheckpoint, run_chunks
+
+
+def _sum_chunks(values, calls, fail_at=None):
+    def compute(start, end):
+        if start == fail_at:
+            raise RuntimeError('crash')
+        calls.append(start)
+        return pd.Series({'total': sum(values[start:end])})
+    return compute
+
+
+class TestRunChunks:
+    def test_resume_skips_completed_chunks(self, tmp_path):
+        values = list(range(10))
+
+        calls = []
+        with pytest.raises(RuntimeError):
+            run_chunks(10, 3, _sum_chunks(values, calls, fail_at=6), ChunkCheckpoint('stage', 'fp', root=tmp_path))
+        assert calls == [0, 3]
+
+        calls = []
+        partials = run_chunks(10, 3, _sum_chunks(values, calls), ChunkCheckpoint('stage', 'fp', resume=True, root=tmp_path))
+        assert calls == [6, 9]
+        assert sum(p['total'] for p in partials) == sum(values)
+
+    def test_fresh_run_discards_old_partials(self, tmp_path):
+        run_chunks(4, 2, _sum_chunks([1, 2, 3, 4], []), ChunkCheckpoint('stage', 'fp', root=tmp_path))
+        calls = []
+        run_chunks(4, 2, _sum_chunks([1, 2, 3, 4], calls), ChunkCheckpoint('stage', 'fp', root=tmp_path))
+        assert calls == [0, 2]
+
+    def test_changed_chunk_size_recomputes(self, tmp_path):
+        run_chunks(4, 2, _sum_chunks([1, 2, 3, 4], []), ChunkCheckpoint('stage', 'fp', root=tmp_path))
+        calls = []
+        run_chunks(4, 3, _sum_chunks([1, 2, 3, 4], calls), ChunkCheckpoint('stage', 'fp', resume=True, root=tmp_path))
+        assert calls == [0, 3]
+
+
+class TestChunkedTransforms:
+    def test_pattern_chunks_match_single_pass(self, tmp_path):
+        from backend.etl.transformers.patterns import transform_pattern_data
+        g, y, w = '🟩', '🟨', '⬜'
+        games = pd.DataFrame({
+            'Game': [1, 1, 2, 2, 3],
+            'Username': ['a', 'b', 'a', 'c', 'd'],
+            'Trial': [2, 3, 1, 7, 2],
+            'processed_text': [f'{y*5}\n{g*5}', f'{w*5}\n{y*5}\n{g*5}', g * 5, f'{w*5}\n' * 6, f'{w*5}\n{g*5}'],
+        })
+        single_stats, single_trans = transform_pattern_data(games.copy())
+        chunked_stats, chunked_trans = transform_pattern_data(
+            games.copy(), checkpoint=ChunkCheckpoint('patterns', 'fp', root=tmp_path), chunk_size=2
+        )
+        pd.testing.assert_frame_equal(single_stats.sort_values('pattern').reset_index(drop=True),
+                                      chunked_stats.sort_values('pattern').reset_index(drop=True), check_dtype=False)
+        pd.testing.assert_frame_equal(single_trans.sort_values(['source_pattern', 'next_pattern']).reset_index(drop=True),
+                                      chunked_trans.sort_values(['source_pattern', 'next_pattern']).reset_index(drop=True))
+        # Finished stages clean up after themselves
+        assert not (tmp_path / 'patterns' / 'fp').exists()
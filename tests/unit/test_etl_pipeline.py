@@ -0,0 +1,109 @@
+import pytest
+from backend.etl.pipeline import Pipeline, Stage, StageResult
+
+
+class TestPipeline:
+    def test_each_stage_runs_once(self):
+        calls = []
+
+        def node(name, value):
+            def run(*args):
+                calls.append(name)
+                return value + sum(args)
+            return run
+
+        pipeline = Pipeline([
+            Stage('extract', node('extract', 1)),
+            Stage('transform', node('transform', 10), ('extract',)),
+            Stage('left', node('left', 100), ('transform',)),
+            Stage('right', node('right', 1000), ('transform', 'extract')),
+            Stage('load', node('load', 0), ('left', 'right'), io=True),
+        ])
+        results = pipeline.run(['load'], io_workers=2)
+
+        assert sorted(calls) == ['extract', 'left', 'load', 'right', 'transform']
+        assert all(r.status == 'success' for r in results.values())
+
+    def test_outputs_freed_after_last_consumer(self):
+        held_when_loading = {}
+
+        class Frame:
+            instances = 0
+
+            def __init__(self):
+                Frame.instances += 1
+
+            def __del__(self):
+                Frame.instances -= 1
+
+        def load(_):
+            held_when_loading['frames'] = Frame.instances
+
+        pipeline = Pipeline([
+            Stage('extract', Frame),
+            Stage('transform', lambda frame: 42, ('extract',)),
+            Stage('load', load, ('transform',)),
+        ])
+        pipeline.run(['load'], track_memory=False)
+        assert held_when_loading['frames'] == 0
+
+    def test_memory_tracking_is_opt_in(self):
+        pipeline = Pipeline([Stage('build', lambda: list(range(10000)))])
+        assert pipeline.run(['build'])['build'].peak_mb is None
+        assert pipeline.run(['build'], track_memory=True)['build'].peak_mb > 0
+
+    def test_failure_skips_dependents_only(self):
+        def boom():
+            raise ValueError('bad input')
+
+        pipeline = Pipeline([
+            Stage('bad', boom),
+            Stage('good', lambda: 1),
+            Stage('after_bad', lambda x: x, ('bad',)),
+            Stage('ordered_after_bad', lambda: 1, after=('bad',)),
+            Stage('after_good', lambda x: x, ('good',)),
+        ])
+        results = pipeline.run(['after_bad', 'ordered_after_bad', 'after_good'])
+
+        assert results['bad'].status == 'failed'
+        assert results['after_bad'].status == 'skipped'
+        assert results['ordered_after_bad'].status == 'skipped'
+        assert results['after_good'].status == 'success'
+
+    def test_only_target_closure_runs(self):
+        pipeline = Pipeline([
+            Stage('a', lambda: 1),
+            Stage('b', lambda x: x, ('a',)),
+            Stage('unrelated', lambda: 1),
+        ])
+        assert list(pipeline.run(['b'])) == ['a', 'b']
+
+    def test_rejects_unknown_dependency(self):
+        with pytest.raises(ValueError):
+            Pipeline([Stage('a', lambda x: x, ('missing',))])
+
+    def test_cpu_stages_run_in_processes(self):
+        captured = {}
+        pipeline = Pipeline([
+            Stage('numbers', lambda: [3, 1, 2]),
+            Stage('total', sum, ('numbers',), cpu=True),
+            Stage('ordered', sorted, ('numbers',), cpu=True),
+            Stage('report', lambda total, ordered: captured.update(total=total, ordered=ordered), ('total', 'ordered')),
+        ])
+        results = pipeline.run(['report'], cpu_workers=2)
+
+        assert results['total'].executor == 'process'
+        assert results['report'].executor == 'inline'
+        assert captured == {'total': 6, 'ordered': [1, 2, 3]}
+
+    def test_critical_path(self):
+        results = {
+            'a': StageResult('a', 'success', 1.0),
+            'b': StageResult('b', 'success', 5.0),
+            'c': StageResult('c', 'success', 2.0),
+            'd': StageResult('d', 'success', 1.0),
+        }
+        upstream = {'a': (), 'b': ('a',), 'c': ('a',), 'd': ('b', 'c')}
+        path, seconds = Pipeline.critical_path(results, upstream)
+        assert path == ['a', 'b', 'd']
+        assert seconds == 7.0
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import patch
+from backend.etl import fingerprint
+
+
+@pytest.fixture
+def digest_cache(tmp_path):
+    with patch.object(fingerprint, 'DIGEST_CACHE_PATH', tmp_path / 'digests.json'):
+        yield tmp_path
+
+
+class TestFileDigest:
+    def test_missing_file(self, digest_cache):
+        assert fingerprint.file_digest(digest_cache / 'nope.csv') == 'missing'
+
+    def test_digest_changes_with_content(self, digest_cache):
+        path = digest_cache / 'games.csv'
+        path.write_text('Game,Trial\n1,3\n')
+        first = fingerprint.file_digest(path)
+        path.write_text('Game,Trial\n1,4\n2,5\n')
+        assert fingerprint.file_digest(path) != first
+
+    def test_unchanged_file_uses_cached_digest(self, digest_cache):
+        path = digest_cache / 'games.csv'
+        path.write_text('Game,Trial\n1,3\n')
+        first = fingerprint.file_digest(path)
+        with patch('builtins.open', wraps=open) as mock_open:
+            assert fingerprint.file_digest(path) == first
+            opened = [call.args[0] for call in mock_open.call_args_list]
+            assert path not in opened
+
+
+class TestStageFingerprint:
+    def test_params_change_fingerprint(self, digest_cache):
+        a = fingerprint.stage_fingerprint('tweets', [], {'frustration_threshold': -0.1})
+        b = fingerprint.stage_fingerprint('tweets', [], {'frustration_threshold': -0.2})
+        assert a != b
+
+    def test_stable_for_same_inputs(self, digest_cache):
+        params = {'b': 1, 'a': 2}
+        assert fingerprint.stage_fingerprint('games', [], params) == fingerprint.stage_fingerprint('games', [], dict(reversed(params.items())))
+
+
+class TestRunRecords:
+    def test_only_successful_runs_count(self, db_session):
+        with patch.object(fingerprint, 'SessionLocal', return_value=db_session):
+            assert not fingerprint.is_stage_current('patterns', 'abc')
+            fingerprint.record_stage_run('patterns', 'abc', success=False)
+            assert not fingerprint.is_stage_current('patterns', 'abc')
+            fingerprint.record_stage_run('patterns', 'abc', success=True, duration=1.5)
+            assert fingerprint.is_stage_current('patterns', 'abc')
+            fingerprint.record_stage_run('patterns', 'def', success=True)
+            assert not fingerprint.is_stage_current('patterns', 'abc')
@@ -0,0 +1,85 @@
+import pandas as pd
+from unittest.mock import patch
+from backend.db.schema import Word
+from backend.etl import incremental
+from backend.etl.extract import load_game_targets
+from backend.etl.incremental import merge_pattern_stats, merge_pattern_transitions, traps_for_all_targets
+from backend.etl.transform import transform_games_data
+from backend.etl.transformers.patterns import transform_pattern_data
+from backend.etl.transformers.traps import transform_trap_data
+
+G, Y, W = '🟩', '🟨', '⬜'
+
+
+def _games(rows):
+    return pd.DataFrame(rows, columns=['Game', 'Username', 'Trial', 'processed_text'])
+
+
+class TestPatternMerge:
+    def test_merged_deltas_match_full_recompute(self):
+        old = _games([
+            (1, 'a', 3, f'{W*5}\n{Y*2}{W*3}\n{G*5}'),
+            (1, 'b', 2, f'{Y*2}{W*3}\n{G*5}'),
+        ])
+        new = _games([
+            (2, 'c', 3, f'{W*5}\n{G*4}{W}\n{G*5}'),
+            (2, 'd', 7, f'{W*5}\n{G*4}{W}\n{G*4}{W}\n{G*4}{W}\n{G*4}{W}\n{G*4}{W}'),
+        ])
+
+        full_stats, full_trans = transform_pattern_data(pd.concat([old, new], ignore_index=True))
+        old_stats, old_trans = transform_pattern_data(old)
+        new_stats, new_trans = transform_pattern_data(new)
+
+        merged = merge_pattern_stats(old_stats, new_stats).set_index('pattern').sort_index()
+        expected = full_stats.set_index('pattern').sort_index()
+        pd.testing.assert_series_equal(merged['count'], expected['count'].astype(int), check_dtype=False)
+        pd.testing.assert_series_equal(merged['success_count'], expected['success_count'].astype(int), check_dtype=False)
+        pd.testing.assert_series_equal(merged['avg_guesses'], expected['avg_guesses'], check_dtype=False)
+        pd.testing.assert_series_equal(merged['rank'], expected['rank'], check_dtype=False)
+
+        trans = merge_pattern_transitions(old_trans, new_trans).set_index(['source_pattern', 'next_pattern']).sort_index()
+        expected_trans = full_trans.set_index(['source_pattern', 'next_pattern']).sort_index()
+        pd.testing.assert_series_equal(trans['count'], expected_trans['count'], check_dtype=False)
+
+    def test_merge_into_empty_tables(self):
+        delta = pd.DataFrame({'pattern': [G * 5], 'count': [2], 'success_count': [2], 'avg_guesses': [1.0], 'rank': [1]})
+        empty = pd.DataFrame(columns=['pattern', 'count', 'success_count', 'avg_guesses'])
+        merged = merge_pattern_stats(empty, delta)
+        assert merged.to_dict('records') == [{'pattern': G * 5, 'count': 2, 'success_count': 2, 'avg_guesses': 1.0, 'rank': 1}]
+
+
+class TestProcessedThrough:
+    def test_falls_back_to_latest_word_until_recorded(self, db_session):
+        db_session.add(Word(id=480, word='TRACE', date='2022-10-14'))
+        db_session.flush()
+        with patch.object(incremental, 'SessionLocal', return_value=db_session):
+            assert incremental.processed_through_id() == 480
+            # Later games past the date cap were read but never loaded into 'words'
+            incremental.record_processed_through(559)
+            assert incremental.processed_through_id() == 559
+
+
+class TestTrapRescore:
+    def test_upserted_rescore_matches_full_run(self, tmp_path):
+        columns = ['Game', 'Trial', 'Username', 'processed_text', 'target']
+        old = pd.DataFrame([(201, 3, 'a', '', 'LIGHT'), (201, 4, 'b', '', 'LIGHT'), (202, 2, 'a', '', 'CRANE')], columns=columns)
+        # NIGHT and SIGHT become neighbours of the already-scored LIGHT
+        new = pd.DataFrame([(203, 5, 'a', '', 'NIGHT'), (204, 3, 'a', '', 'SIGHT')], columns=columns)
+        games = pd.concat([old, new], ignore_index=True)
+        guesses = ['FIGHT', 'CRATE']
+
+        expected = transform_trap_data(transform_games_data(games), guesses)
+
+        games.to_csv(tmp_path / 'games.csv', index=False)
+        with patch('backend.etl.extract.games_csv_path', return_value=tmp_path / 'games.csv'):
+            rescored = traps_for_all_targets(load_game_targets(), guesses)
+        # The upsert replaces rows by word_id and keeps the rest
+        loaded = transform_trap_data(transform_games_data(old), guesses)
+        merged = pd.concat([loaded, rescored]).drop_duplicates('word_id', keep='last')
+
+        pd.testing.assert_frame_equal(
+            merged.sort_values('word_id').reset_index(drop=True),
+            expected.sort_values('word_id').reset_index(drop=True),
+            check_dtype=False
+        )
+        assert merged.set_index('word_id').loc[201, 'neighbor_count'] == 3
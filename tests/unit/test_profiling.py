@@ -0,0 +1,39 @@
+import json
+
+from backend.etl.pipeline import Pipeline, Stage
+from backend.etl.profiling import profile_pipeline, write_summary
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+class TestProfiling:
+    def test_writes_stage_reports_and_summary(self, tmp_path):
+        pipeline = Pipeline([
+            Stage('size', lambda: 200000),
+            Stage('square_sum', _busy, ('size',)),
+        ])
+        run_dir = profile_pipeline(pipeline, root=tmp_path)
+        results = pipeline.run(['square_sum'], track_memory=False)
+
+        assert results['square_sum'].status == 'success'
+        for suffix in ('.txt', '.prof', '.collapsed', '.memory.csv', '.json'):
+            assert (run_dir / f'square_sum{suffix}').exists()
+
+        summary = json.loads(write_summary(run_dir, results).read_text())
+        stage = summary['stages']['square_sum']
+        assert stage['status'] == 'success'
+        assert any('_busy' in f['function'] for f in stage['top_functions'])
+
+    def test_failed_stage_still_reported(self, tmp_path):
+        def boom():
+            raise ValueError('bad input')
+
+        pipeline = Pipeline([Stage('bad', boom)])
+        run_dir = profile_pipeline(pipeline, root=tmp_path)
+        results = pipeline.run(['bad'], track_memory=False)
+
+        assert results['bad'].status == 'failed'
+        report = json.loads((run_dir / 'bad.json').read_text())
+        assert report['error'] == 'bad input'
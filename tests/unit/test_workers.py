@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from backend.etl import workers
+
+
+class TestParallelMap:
+    def test_small_input_runs_inline(self):
+        with patch.object(workers, 'get_pool') as get_pool:
+            assert workers.parallel_map(abs, [-1, 2, -3], chunksize=10) == [1, 2, 3]
+        get_pool.assert_not_called()
+
+    def test_results_keep_input_order(self):
+        items = list(range(-50, 50))
+        try:
+            with patch.object(workers, 'ETL_WORKERS', 2):
+                assert workers.parallel_map(abs, items, chunksize=7) == [abs(i) for i in items]
+            # The pool is reused by later calls
+            pool = workers.get_pool()
+            assert workers.get_pool() is pool
+        finally:
+            workers.shutdown_pool()
+
+
+class TestSharedTextMap:
+    def test_matches_inline_results(self):
+        texts = ["wordle 💚", "", "naïve", "x" * 40, None] * 9
+        try:
+            with patch.object(workers, 'ETL_WORKERS', 2):
+                results = workers.shared_text_map(len, texts, chunksize=4)
+        finally:
+            workers.shutdown_pool()
+        expected = [len(t) if isinstance(t, str) else 0 for t in texts]
+        assert results.tolist() == expected